@@ -0,0 +1,218 @@
+"""Response latency against conversation size over a simulated long session.
+
+Drives one ``OpenaiRealtimeHandler`` through ``--hours`` of synthetic
+conversation against the local mock realtime server: one spoken user turn every
+``--turn-interval-s`` simulated seconds, a tool call (a ~2 KB JSON result) every
+``--tool-every`` turns and a camera image every ``--camera-every`` turns. The
+context clock is simulated, so image expiry follows session time, while the
+turns themselves run back to back.
+
+The session runs twice: with trimming at ``--budget`` tokens, and with trimming
+disabled (no budget, no image expiry). For each simulated hour it reports the
+handler's context estimate at ``response.created`` and p50/p95 of
+``stop_to_response_created`` and ``stop_to_first_delta``.
+
+The mock adds ``--latency-ms-per-1k-tokens`` of response latency per 1000 tokens
+of conversation it holds. That slope is an assumption of the model, not a
+measurement of the real API: what the benchmark shows is how much conversation
+each mode keeps the server carrying, and what that costs under the given slope.
+
+    python benchmarks/context_soak.py --hours 8 --latency-ms-per-1k-tokens 10
+"""
+
+from __future__ import annotations
+import sys
+import json
+import math
+import socket
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+SAMPLE_RATE = 24000
+FRAME = 480  # 20 ms
+
+
+class _NullMovementManager:
+    """Movement manager that accepts everything and moves nothing."""
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: False
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def _script(turns: int, tool_every: int, camera_every: int) -> List[Dict[str, Any]]:
+    """Return the mock's responses in order: a tool call then its spoken follow-up, or a plain answer."""
+    script: List[Dict[str, Any]] = []
+    for i in range(1, turns + 1):
+        if camera_every and i % camera_every == 0:
+            script.append({"tool": "camera", "arguments": {"question": "What do you see?"}})
+        elif tool_every and i % tool_every == 0:
+            script.append({"tool": "check_signal_aggregates", "arguments": {}})
+        script.append({"text": "Sure. " + "Here is a fairly ordinary spoken answer to that question. " * 3})
+    return script
+
+
+async def _dispatch_tool(tool_name: str, args_json: str, deps: Any) -> Dict[str, Any]:
+    if tool_name == "camera":
+        return {"b64_im": "A" * 40000}
+    return {"signals": [{"name": f"signal_{i}", "count": i, "rate_per_min": i / 7.0} for i in range(40)]}
+
+
+def _speech() -> List[Tuple[int, np.ndarray]]:
+    """Return one user utterance: 1.5 s of tone and 0.6 s of silence, in 20 ms frames."""
+    t = np.arange(int(1.5 * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = np.concatenate([(4000 * np.sin(2 * np.pi * 300.0 * t)), np.zeros(int(0.6 * SAMPLE_RATE))])
+    pcm = audio.astype(np.int16)
+    return [(SAMPLE_RATE, pcm[i : i + FRAME]) for i in range(0, len(pcm), FRAME)]
+
+
+async def _run_session(args: argparse.Namespace, trim: bool) -> List[Dict[str, Any]]:
+    from openai import AsyncOpenAI
+
+    from reachy_mini_karen_whisperer.openai_realtime import OpenaiRealtimeHandler
+    from reachy_mini_karen_whisperer.tools.core_tools import ToolDependencies
+    from reachy_mini_karen_whisperer.mock_realtime_server import MockOptions, MockRealtimeServer
+
+    turns = int(args.hours * 3600 / args.turn_interval_s)
+    port = _free_port()
+    server = MockRealtimeServer(
+        port=port,
+        options=MockOptions(
+            latency_ms=args.latency_ms,
+            latency_ms_per_1k_tokens=args.latency_ms_per_1k_tokens,
+            audio_rate=0.0,
+            response_s=args.response_s,
+            script=_script(turns, args.tool_every, args.camera_every),
+        ),
+    )
+    await server.start()
+
+    handler = OpenaiRealtimeHandler(ToolDependencies(reachy_mini=None, movement_manager=_NullMovementManager()))
+    handler.client = AsyncOpenAI(api_key="mock", websocket_base_url=server.websocket_base_url)
+    handler.dispatch_tool = _dispatch_tool
+    clock = [0.0]
+    handler.context._now = lambda: clock[0]
+    if trim:
+        handler.context.token_budget = args.budget
+    else:
+        handler.context.token_budget = sys.maxsize
+        handler.context.image_ttl_s = math.inf
+
+    async def _drain() -> None:
+        while True:
+            await handler.output_queue.get()
+
+    drain = asyncio.create_task(_drain())
+    session = asyncio.create_task(handler._run_realtime_session())
+    await asyncio.wait_for(handler._connected_event.wait(), timeout=10.0)
+
+    speech = _speech()
+    rows: List[Dict[str, Any]] = []
+    last_turn = -1
+    for i in range(turns):
+        clock[0] = i * args.turn_interval_s
+        for frame in speech:
+            await handler.receive(frame)
+        while True:
+            recent = handler.latency.recent(1)
+            if recent and recent[0]["turn"] != last_turn:
+                break
+            await asyncio.sleep(0.005)
+        last_turn = recent[0]["turn"]
+        rows.append({"t_s": clock[0], **recent[0], "evicted_items": handler.context.evicted_items})
+
+    session.cancel()
+    drain.cancel()
+    await asyncio.gather(session, drain, return_exceptions=True)
+    await server.stop()
+    return rows
+
+
+def _pct(values: List[float], q: float) -> float:
+    return round(float(np.percentile(values, q)), 1) if values else float("nan")
+
+
+def _interval(rows: List[Dict[str, Any]], name: str) -> List[float]:
+    return [r["intervals_ms"][name] for r in rows if name in r["intervals_ms"]]
+
+
+def _hourly(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    buckets: Dict[int, List[Dict[str, Any]]] = {}
+    for row in rows:
+        buckets.setdefault(int(row["t_s"] // 3600), []).append(row)
+    out = []
+    for hour, bucket in sorted(buckets.items()):
+        created = _interval(bucket, "stop_to_response_created")
+        delta = _interval(bucket, "stop_to_first_delta")
+        tokens = [r.get("context_tokens", 0) for r in bucket]
+        out.append(
+            {
+                "hour": hour + 1,
+                "turns": len(bucket),
+                "context_tokens_mean": int(np.mean(tokens)),
+                "context_tokens_max": int(max(tokens)),
+                "created_p50_ms": _pct(created, 50),
+                "created_p95_ms": _pct(created, 95),
+                "first_delta_p50_ms": _pct(delta, 50),
+                "first_delta_p95_ms": _pct(delta, 95),
+                "evicted_items": bucket[-1]["evicted_items"],
+            }
+        )
+    return out
+
+
+def main() -> int:
+    """Run the session with and without trimming and print per-hour tables."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--turn-interval-s", type=float, default=60.0, help="Simulated time between user turns")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Mock latency at an empty context")
+    parser.add_argument(
+        "--latency-ms-per-1k-tokens", type=float, default=10.0, help="Assumed extra latency per 1000 context tokens"
+    )
+    parser.add_argument("--response-s", type=float, default=4.0, help="Length of each spoken answer")
+    parser.add_argument("--budget", type=int, default=16000, help="Token budget of the trimmed run")
+    parser.add_argument("--tool-every", type=int, default=5)
+    parser.add_argument("--camera-every", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print the per-hour rows as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for mode, trim in (("trim", True), ("no_trim", False)):
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        loop = asyncio.get_event_loop()
+        try:
+            results[mode] = _hourly(loop.run_until_complete(_run_session(args, trim)))
+        finally:
+            loop.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for mode, hours in results.items():
+        print(f"\n{mode} (budget {args.budget if mode == 'trim' else 'none'})")
+        print(
+            f"{'hour':>4} {'tokens':>7} {'max':>7} {'created p50':>11} {'p95':>7} {'delta p50':>9} {'p95':>7} {'evicted':>7}"
+        )
+        for h in hours:
+            print(
+                f"{h['hour']:>4} {h['context_tokens_mean']:>7} {h['context_tokens_max']:>7} "
+                f"{h['created_p50_ms']:>11} {h['created_p95_ms']:>7} "
+                f"{h['first_delta_p50_ms']:>9} {h['first_delta_p95_ms']:>7} {h['evicted_items']:>7}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Minimal stand-in for ``ReachyMini`` used by the benchmarks.
+
+It implements only the calls the app makes: motion targets (counted, not
+executed), joint and head pose reads, and a media object whose microphone
+produces a short tone burst every few seconds so a server VAD sees turns.
+"""
+
+from __future__ import annotations
+import time
+import threading
+from typing import Any, Dict, List, Tuple, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FakeMedia:
+    """Microphone and speaker of a fake robot."""
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        frame_ms: float = 20.0,
+        speech_every_s: float = 8.0,
+        speech_s: float = 1.5,
+    ) -> None:
+        """Prepare a mic that speaks for ``speech_s`` every ``speech_every_s`` seconds."""
+        self.backend = None
+        self.sample_rate = sample_rate
+        self.frame = int(sample_rate * frame_ms / 1000.0)
+        self.speech_every_s = speech_every_s
+        self.speech_s = speech_s
+        self._started: Optional[float] = None
+        self._next_frame_at = 0.0
+        self._phase = 0
+        self.samples_played = 0
+
+    def start_recording(self) -> None:
+        self._started = time.monotonic()
+        self._next_frame_at = self._started
+
+    def start_playing(self) -> None:
+        pass
+
+    def stop_recording(self) -> None:
+        self._started = None
+
+    def stop_playing(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._started = None
+
+    def get_input_audio_samplerate(self) -> int:
+        return self.sample_rate
+
+    def get_output_audio_samplerate(self) -> int:
+        return self.sample_rate
+
+    def get_audio_sample(self) -> Optional[NDArray[np.float32]]:
+        """Return the next mic frame once it is due, like a real capture device."""
+        if self._started is None:
+            return None
+        now = time.monotonic()
+        if now < self._next_frame_at:
+            return None
+        self._next_frame_at += self.frame / self.sample_rate
+        speaking = (now - self._started) % self.speech_every_s < self.speech_s
+        t = np.arange(self._phase, self._phase + self.frame) / self.sample_rate
+        self._phase += self.frame
+        amplitude = 0.3 if speaking else 0.001
+        return (amplitude * np.sin(2 * np.pi * 180.0 * t)).astype(np.float32)
+
+    def push_audio_sample(self, data: NDArray[np.float32]) -> None:
+        self.samples_played += int(data.shape[0])
+
+    def get_frame(self) -> Optional[NDArray[np.uint8]]:
+        return np.zeros((480, 640, 3), dtype=np.uint8)
+
+
+class FakeClient:
+    """Daemon client of a fake robot."""
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"simulation_enabled": False}
+
+    def disconnect(self) -> None:
+        pass
+
+
+class FakeRobot:
+    """Records motion commands instead of sending them to a daemon."""
+
+    def __init__(self, **media_kwargs: Any) -> None:
+        """Create the fake media and client."""
+        self.media = FakeMedia(**media_kwargs)
+        self.client = FakeClient()
+        self._lock = threading.Lock()
+        self.set_target_calls = 0
+        self.goto_calls = 0
+        self.targets: List[Tuple[Any, Any, Any]] = []
+        self.keep_targets = False
+
+    def set_target(self, head: Any = None, antennas: Any = None, body_yaw: Any = None) -> None:
+        with self._lock:
+            self.set_target_calls += 1
+            if self.keep_targets:
+                self.targets.append((head, antennas, body_yaw))
+
+    def goto_target(self, head: Any = None, antennas: Any = None, duration: float = 0.0, **_: Any) -> None:
+        with self._lock:
+            self.goto_calls += 1
+
+    def get_current_head_pose(self) -> NDArray[np.float64]:
+        return np.eye(4)
+
+    def get_current_joint_positions(self) -> Tuple[List[float], List[float]]:
+        return [0.0] * 7, [0.0, 0.0]
+
+    def look_at_image(self, *args: Any, **kwargs: Any) -> NDArray[np.float64]:
+        return np.eye(4)
@@ -0,0 +1,179 @@
+"""Cost of one MovementManager control tick.
+
+Drives one iteration of the manager's ``working_loop`` directly (everything
+but the deadline wait: the tick itself, frequency stats, shared state and
+telemetry) against a fake robot and reports, per scenario:
+
+- ``potential_hz``: 1 / tick compute time, like ``LoopFrequencyStats.potential_freq``
+  (mean, p50 and p1, i.e. the slowest 1 % of ticks)
+- ``transient_b``: peak bytes allocated and freed within one tick (tracemalloc)
+- ``net_b``: bytes still held after all measured ticks (should stay ~0)
+
+Scenarios: idle breathing, a goto move, a goto move with speech offsets
+changing on every tick, and back-to-back dance moves (a repeated ``dance``
+tool call). On trees with the per-stage profiler, a last line reports what its
+bookkeeping alone costs per tick and as a share of the 10 ms tick budget.
+Run on two checkouts to compare::
+
+    python benchmarks/movement_loop.py --ticks 5000
+"""
+
+from __future__ import annotations
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from array import array
+from typing import Any, Dict, List, Callable
+
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+SCENARIOS = ["breathing", "goto", "goto+speech", "dance"]
+
+
+def _tick(manager: Any, count: int, now: float) -> None:
+    """Run loop iteration ``count``, on trees with or without ``_loop_iteration`` or ``_run_tick``."""
+    loop_iteration = getattr(manager, "_loop_iteration", None)
+    if loop_iteration is not None:
+        loop_iteration(count, now, now - 0.01)
+        return
+    run_tick = getattr(manager, "_run_tick", None)
+    if run_tick is not None:
+        run_tick(now)
+        return
+    manager._poll_signals(now)
+    manager._update_primary_motion(now)
+    manager._update_face_tracking(now)
+    head, antennas, body_yaw = manager._compose_full_body_pose(now)
+    manager._issue_control_command(head, manager._calculate_blended_antennas(antennas), body_yaw)
+
+
+def _make_manager(scenario: str) -> tuple[Any, Callable[[int], None]]:
+    from fake_robot import FakeRobot
+
+    from reachy_mini.utils import create_head_pose
+    from reachy_mini_karen_whisperer.moves import MovementManager
+    from reachy_mini_karen_whisperer.dance_emotion_moves import GotoQueueMove, DanceQueueMove
+
+    manager = MovementManager(current_robot=FakeRobot())
+    if hasattr(manager.move_queue, "max_repeats"):
+        manager.move_queue.max_repeats = 1000  # the dance scenario queues 100 repeats, coalesced into one entry
+
+    def no_feed(i: int) -> None:
+        pass
+
+    if scenario == "breathing":
+        return manager, no_feed
+
+    if scenario == "dance":
+        for _ in range(100):
+            manager.queue_move(DanceQueueMove("groovy_sway_and_roll"))
+        return manager, no_feed
+
+    target = create_head_pose(0, 0, 0.01, 5, -10, 20, degrees=True)
+    manager.queue_move(GotoQueueMove(target_head_pose=target, start_head_pose=None, duration=1e9))
+    if scenario == "goto":
+        return manager, no_feed
+
+    def feed_speech(i: int) -> None:
+        phase = (i % 100) / 100.0
+        manager.set_speech_offsets((0.0, 0.0, 0.002 * phase, 0.01 * phase, 0.02 * phase, -0.01 * phase))
+
+    return manager, feed_speech
+
+
+def run_scenario(scenario: str, ticks: int, warmup: int = 500) -> Dict[str, Any]:
+    """Measure ``ticks`` ticks of ``scenario`` after ``warmup`` unmeasured ones."""
+    manager, feed = _make_manager(scenario)
+    now = time.monotonic()
+    # Warm up: start breathing/the goto move and fill any lazily created buffers
+    count = 0
+    for i in range(warmup):
+        now += 0.01
+        count += 1
+        feed(i)
+        _tick(manager, count, now)
+
+    durations: List[float] = []
+    for i in range(ticks):
+        now += 0.01
+        count += 1
+        feed(i)
+        t0 = time.perf_counter()
+        _tick(manager, count, now)
+        durations.append(time.perf_counter() - t0)
+
+    transient = array("q", bytes(8 * ticks))  # C longs, so storing results allocates nothing
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    for i in range(ticks):
+        now += 0.01
+        count += 1
+        feed(i)
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _tick(manager, count, now)
+        transient[i] = tracemalloc.get_traced_memory()[1] - before
+    net = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    durations.sort()
+    transient = array("q", sorted(transient))
+    mean = sum(durations) / len(durations)
+    return {
+        "scenario": scenario,
+        "potential_hz_mean": round(1.0 / mean),
+        "potential_hz_p50": round(1.0 / durations[len(durations) // 2]),
+        "potential_hz_p1": round(1.0 / durations[int(len(durations) * 0.99)]),
+        "transient_b_p50": transient[len(transient) // 2],
+        "transient_b_max": transient[-1],
+        "net_b": net,
+    }
+
+
+def profiler_overhead(ticks: int) -> Dict[str, Any] | None:
+    """Time one tick's worth of ``StageProfiler`` calls (begin, a lap per stage, end) in isolation."""
+    try:
+        from reachy_mini_karen_whisperer.loop_profiler import LOOP_STAGES, StageProfiler
+    except ImportError:
+        return None
+
+    profiler = StageProfiler()
+    move = object()
+    stages = range(len(LOOP_STAGES))
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        profiler.begin()
+        for stage in stages:
+            profiler.lap(stage)
+        profiler.end(move)
+    per_tick = (time.perf_counter() - t0) / ticks
+    t0 = time.perf_counter()
+    profiler.summary()
+    summary_s = time.perf_counter() - t0
+    return {
+        "profiler_us_per_tick": round(per_tick * 1e6, 2),
+        "budget_share": round(per_tick / 0.01, 5),
+        "summary_ms": round(summary_s * 1e3, 2),
+    }
+
+
+def main() -> int:
+    """Run every scenario and print one line each."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append")
+    args = parser.parse_args()
+
+    for scenario in args.scenario or SCENARIOS:
+        print(run_scenario(scenario, args.ticks), flush=True)
+    overhead = profiler_overhead(args.ticks)
+    if overhead is not None:
+        print(overhead, flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Per-operation cost of the motion pipeline's pose math: 4x4 matrices vs ``Pose``.
+
+Times the operations one control tick performs, once with the SDK matrix
+helpers the pipeline used before and once with ``Pose``:
+
+- ``compose``: secondary offsets on top of the primary pose
+  (``compose_world_offset`` + antenna/yaw sums vs ``Pose.set_composed``)
+- ``offsets``: (x, y, z, roll, pitch, yaw) to a head offset
+  (``create_head_pose`` vs ``Pose.set_offsets``)
+- ``interpolate``: a goto step (``linear_pose_interpolation`` + lerps vs ``Pose.set_interpolated``)
+- ``euler``: head matrix to offsets (scipy ``Rotation`` vs ``Pose.as_offsets``)
+- ``to_matrix``: the one conversion left per tick, at the ``set_target`` boundary
+  (the matrix path has nothing to convert; its column is a plain copy)
+
+Prints one line per operation with the mean microseconds per call::
+
+    python benchmarks/pose_math.py --repeat 20000
+"""
+
+from __future__ import annotations
+import sys
+import timeit
+import argparse
+from typing import Any, Dict, Callable
+
+import numpy as np
+
+
+def _cases() -> Dict[str, tuple[Callable[[], Any], Callable[[], Any]]]:
+    from scipy.spatial.transform import Rotation as R
+
+    from reachy_mini.utils import create_head_pose
+    from reachy_mini.utils.interpolation import compose_world_offset, linear_pose_interpolation
+    from reachy_mini_karen_whisperer.pose import Pose
+
+    offsets = (0.001, -0.002, 0.004, 0.05, -0.08, 0.12)
+    primary_head = create_head_pose(0.0, 0.01, 0.02, 0.1, -0.2, 0.3, degrees=False, mm=False)
+    target_head = create_head_pose(0.0, 0.0, 0.01, 5, -10, 20, degrees=True)
+    secondary_head = create_head_pose(*offsets, degrees=False, mm=False)
+    antennas = np.array([0.1, -0.1])
+    secondary_antennas = np.array([0.02, 0.03])
+
+    primary = Pose.from_matrix(primary_head, antennas, 0.2)
+    target = Pose.from_matrix(target_head)
+    secondary = Pose.from_offsets(*offsets)
+    out = Pose()
+    out_matrix = np.eye(4)
+
+    def matrix_compose() -> Any:
+        return (
+            compose_world_offset(primary_head, secondary_head, reorthonormalize=True),
+            antennas + secondary_antennas,
+            0.2 + 0.0,
+        )
+
+    def matrix_interpolate() -> Any:
+        t = 0.37
+        return (
+            linear_pose_interpolation(primary_head, target_head, t),
+            antennas + (secondary_antennas - antennas) * t,
+            0.2 + (0.0 - 0.2) * t,
+        )
+
+    return {
+        "compose": (matrix_compose, lambda: out.set_composed(secondary, primary)),
+        "offsets": (
+            lambda: create_head_pose(*offsets, degrees=False, mm=False),
+            lambda: out.set_offsets(*offsets),
+        ),
+        "interpolate": (matrix_interpolate, lambda: out.set_interpolated(primary, target, 0.37)),
+        "euler": (
+            lambda: R.from_matrix(primary_head[:3, :3]).as_euler("xyz", degrees=False),
+            lambda: primary.as_offsets(),
+        ),
+        "to_matrix": (lambda: primary_head.copy(), lambda: primary.to_matrix(out_matrix)),
+    }
+
+
+def run(repeat: int) -> None:
+    """Time every case and print one line each."""
+    for name, (matrix_fn, pose_fn) in _cases().items():
+        matrix_us = min(timeit.repeat(matrix_fn, number=repeat, repeat=3)) / repeat * 1e6
+        pose_us = min(timeit.repeat(pose_fn, number=repeat, repeat=3)) / repeat * 1e6
+        print(
+            {
+                "op": name,
+                "matrix_us": round(matrix_us, 2),
+                "pose_us": round(pose_us, 2),
+                "speedup": round(matrix_us / pose_us, 1),
+            },
+            flush=True,
+        )
+
+
+def main() -> int:
+    """Parse arguments and run the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Memory and CPU scaling of the session host from 1 to N sessions.
+
+Each session count runs in a fresh subprocess: it starts the local mock
+realtime server, hosts N sessions on fake robots (no camera), lets them talk
+for ``--duration`` seconds and reports resident memory, CPU use and the
+movement loop rate. The results give the per-session memory overhead on top of
+the shared resources (loaded modules included).
+
+    python benchmarks/session_scaling.py --max-sessions 8 --duration 60
+"""
+
+from __future__ import annotations
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+import subprocess
+from typing import Any, Dict, List
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024.0
+    return float("nan")
+
+
+def _start_mock_server(port: int) -> None:
+    from reachy_mini_karen_whisperer.mock_realtime_server import MockOptions, MockRealtimeServer
+
+    ready = threading.Event()
+
+    def _run() -> None:
+        async def _serve() -> None:
+            server = MockRealtimeServer(port=port, options=MockOptions(latency_ms=300.0))
+            await server.start()
+            ready.set()
+            await asyncio.Event().wait()
+
+        asyncio.run(_serve())
+
+    threading.Thread(target=_run, name="mock-realtime", daemon=True).start()
+    ready.wait(timeout=10.0)
+
+
+def run_one(sessions: int, duration_s: float, port: int) -> Dict[str, Any]:
+    """Host ``sessions`` sessions in this process and measure them."""
+    sys.path.insert(0, os.path.dirname(__file__))
+    from fake_robot import FakeRobot
+
+    from reachy_mini_karen_whisperer.config import config
+    from reachy_mini_karen_whisperer.session_host import SessionHost, SharedResources
+
+    _start_mock_server(port)
+    config.OPENAI_API_KEY = "mock"
+    config.OPENAI_WEBSOCKET_BASE_URL = f"ws://127.0.0.1:{port}/v1"
+
+    shared = SharedResources.load(head_tracker=None, local_vision=False)
+    # Import what every session uses, so its code counts as shared and not as the first session's
+    import reachy_mini_karen_whisperer.moves  # noqa: F401
+    import reachy_mini_karen_whisperer.console  # noqa: F401
+    import reachy_mini_karen_whisperer.openai_realtime  # noqa: F401
+
+    rss_shared = _rss_mb()
+
+    host = SessionHost(shared)
+    robots = [FakeRobot() for _ in range(sessions)]
+    for i, robot in enumerate(robots):
+        host.add(f"bench{i}", robot, no_camera=True)
+    host.start()
+
+    time.sleep(3.0)  # let streams connect before measuring
+    set_targets0 = sum(r.set_target_calls for r in robots)
+    played0 = sum(r.media.samples_played for r in robots)
+    cpu0, wall0 = time.process_time(), time.monotonic()
+    time.sleep(duration_s)
+    cpu, wall = time.process_time() - cpu0, time.monotonic() - wall0
+    rss = _rss_mb()
+    set_targets = sum(r.set_target_calls for r in robots) - set_targets0
+    played = sum(r.media.samples_played for r in robots) - played0
+    loop_hz = [s.movement_manager.get_status()["loop_frequency"]["mean"] for s in host.sessions]
+    host.stop()
+
+    return {
+        "sessions": sessions,
+        "rss_shared_mb": round(rss_shared, 1),
+        "rss_mb": round(rss, 1),
+        "per_session_mb": round((rss - rss_shared) / sessions, 1),
+        "cpu_cores": round(cpu / wall, 3),
+        "loop_hz_mean": round(sum(loop_hz) / sessions, 1),
+        "loop_hz_min": round(min(loop_hz), 1),
+        "set_target_hz_per_session": round(set_targets / wall / sessions, 1),
+        "audio_s_played": round(played / 24000.0, 1),
+    }
+
+
+def main() -> int:
+    """Run every session count in its own subprocess and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-sessions", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--only", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.only is not None:
+        print(json.dumps(run_one(args.only, args.duration, args.port)))
+        return 0
+
+    rows: List[Dict[str, Any]] = []
+    for n in range(1, args.max_sessions + 1):
+        out = subprocess.run(
+            [sys.executable, __file__, "--only", str(n), "--duration", str(args.duration), "--port", str(args.port)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        rows.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        print(rows[-1], flush=True)
+
+    print()
+    print(f"{'sessions':>8} {'rss MB':>8} {'MB/session':>10} {'cpu cores':>9} {'loop Hz':>7} {'min':>6}")
+    for r in rows:
+        print(
+            f"{r['sessions']:>8} {r['rss_mb']:>8} {r['per_session_mb']:>10} "
+            f"{r['cpu_cores']:>9} {r['loop_hz_mean']:>7} {r['loop_hz_min']:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
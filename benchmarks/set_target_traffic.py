@@ -0,0 +1,147 @@
+"""set_target traffic of the movement loop in typical conversation phases.
+
+Drives ``MovementManager`` ticks at 100 Hz on a simulated clock (no sleeping)
+against a fake robot and counts the ``set_target`` calls and the bytes of the
+``set_full_target`` message each one would send to the daemon. Phases:
+
+- ``idle``: breathing
+- ``listening``: breathing with the antennas frozen
+- ``speaking``: breathing plus speech sway from ``SwayRollRT`` fed a synthetic,
+  syllable-modulated voice, one offset update per 50 ms hop as ``HeadWobbler`` does
+
+Each phase runs with the dead-band off (every tick sent) and on (defaults),
+and reports commands and bytes per minute. Trees without the dead-band only
+produce the "off" rows::
+
+    python benchmarks/set_target_traffic.py --seconds 60
+"""
+
+from __future__ import annotations
+import os
+import sys
+import json
+import argparse
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+PHASES = ["idle", "listening", "speaking"]
+TICK_S = 0.01
+WARMUP_S = 3.0  # idle delay and breathing's interpolation to neutral
+
+
+def _message_bytes(head: Any, antennas: Any, body_yaw: Any) -> int:
+    """Size of the JSON message ``ReachyMini.set_target`` sends for these fields."""
+    fields = {
+        "head": head.flatten().tolist() if head is not None else None,
+        "antennas": list(antennas) if antennas is not None else None,
+        "body_yaw": body_yaw,
+    }
+    try:
+        from reachy_mini.io.protocol import SetFullTargetCmd
+
+        return len(SetFullTargetCmd(**fields).model_dump_json())
+    except ImportError:
+        return len(json.dumps({"type": "set_full_target", **fields}, separators=(",", ":")))
+
+
+def _speech_offsets(seconds: float) -> List[Any]:
+    """Offsets HeadWobbler would publish, one per hop, for ``seconds`` of synthetic speech."""
+    from reachy_mini_karen_whisperer.pose import Pose
+    from reachy_mini_karen_whisperer.audio.speech_tapper import SR, HOP_MS, SwayRollRT
+
+    rng = np.random.default_rng(7)
+    t = np.arange(int(seconds * SR)) / SR
+    syllables = 0.5 * (1.0 + np.sin(2 * np.pi * 4.0 * t)) * (np.sin(2 * np.pi * 0.3 * t) > -0.6)
+    pcm = (0.2 * syllables * rng.standard_normal(t.size)).astype(np.float32)
+    sway = SwayRollRT()
+    hop = int(SR * HOP_MS / 1000)
+    results: List[Dict[str, float]] = []
+    for start in range(0, pcm.size, hop):
+        results.extend(sway.feed(pcm[start : start + hop], SR))
+    return [
+        Pose.from_offsets(
+            r["x_mm"] / 1000.0,
+            r["y_mm"] / 1000.0,
+            r["z_mm"] / 1000.0,
+            r["roll_rad"],
+            r["pitch_rad"],
+            r["yaw_rad"],
+        )
+        for r in results
+    ]
+
+
+def run_phase(phase: str, seconds: float, deadband: Optional[bool]) -> Dict[str, Any]:
+    """Run ``seconds`` of ``phase``; ``deadband`` None keeps the tree's default manager."""
+    from fake_robot import FakeRobot
+
+    from reachy_mini_karen_whisperer.moves import MovementManager
+
+    sent = {"calls": 0, "bytes": 0}
+
+    class CountingRobot(FakeRobot):  # type: ignore[misc]
+        def set_target(self, head: Any = None, antennas: Any = None, body_yaw: Any = None) -> None:
+            sent["calls"] += 1
+            sent["bytes"] += _message_bytes(head, antennas, body_yaw)
+
+    kwargs: Dict[str, Any] = {}
+    if deadband is not None:
+        from reachy_mini_karen_whisperer.output_deadband import DeadbandOutput
+
+        kwargs["output"] = DeadbandOutput() if deadband else DeadbandOutput(keepalive_s=0.0)
+    manager = MovementManager(current_robot=CountingRobot(), **kwargs)
+    clock = [manager._now()]  # simulated from here on, consistent with the timestamps taken at construction
+    manager._now = lambda: clock[0]
+
+    hops = _speech_offsets(seconds) if phase == "speaking" else []
+    ticks_per_hop = 5
+    warmup = int(WARMUP_S / TICK_S)
+    for i in range(warmup + int(seconds / TICK_S)):
+        if i == warmup:
+            if phase == "listening":
+                manager.set_listening(True)
+            sent["calls"] = sent["bytes"] = 0
+        k = i - warmup
+        if hops and k >= 0 and k % ticks_per_hop == 0 and k // ticks_per_hop < len(hops):
+            manager.set_speech_offsets(hops[k // ticks_per_hop])
+        clock[0] += TICK_S
+        manager._run_tick(clock[0])
+
+    per_min = 60.0 / seconds
+    return {
+        "phase": phase,
+        "deadband": {None: "n/a", False: "off", True: "on"}[deadband],
+        "cmds_per_min": round(sent["calls"] * per_min),
+        "kb_per_min": round(sent["bytes"] * per_min / 1024, 1),
+    }
+
+
+def main() -> int:
+    """Run every phase with the dead-band off and on, and print one line each."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--phase", choices=PHASES, action="append")
+    args = parser.parse_args()
+
+    try:
+        import reachy_mini_karen_whisperer.output_deadband  # noqa: F401
+
+        modes: List[Optional[bool]] = [False, True]
+    except ImportError:
+        modes = [None]
+    for phase in args.phase or PHASES:
+        rows = [run_phase(phase, args.seconds, mode) for mode in modes]
+        for row in rows:
+            print(row, flush=True)
+        if len(rows) == 2 and rows[0]["kb_per_min"]:
+            saved = 1.0 - rows[1]["kb_per_min"] / rows[0]["kb_per_min"]
+            print({"phase": phase, "bandwidth_saved": f"{saved:.0%}"}, flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""Timing of the real 100 Hz movement loop under synthetic CPU load.
+
+Runs ``MovementManager.working_loop`` on its own thread (breathing, fake robot)
+for ``--seconds`` and timestamps every ``set_target`` call. Reports, per load:
+
+- ``hz``: achieved tick rate
+- ``lateness_us``: p50/p99/max of each tick's delay past its slot on an ideal
+  100 Hz grid anchored at the first tick (a slot is never reused, so a loop
+  that drifts shows up here)
+- ``jitter_us``: p50/p99 of |tick interval - 10 ms|
+- ``late_ticks``: ticks more than half a period past their slot
+- ``scheduler``: the manager's own ``loop_timing`` counters, on trees that have them
+
+Loads: ``idle``; ``gil`` (``--threads`` pure-Python threads in this process,
+like the camera, YOLO and asyncio threads contending for the GIL); ``cpu``
+(one busy process per core, contending for the CPUs). Run on two checkouts to
+compare::
+
+    python benchmarks/tick_timing.py --seconds 10
+"""
+
+from __future__ import annotations
+import os
+import sys
+import math
+import time
+import argparse
+import threading
+import multiprocessing
+from array import array
+from typing import Any, Dict, List
+
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+LOADS = ["idle", "gil", "cpu"]
+PERIOD_S = 0.01
+
+
+def _burn_python(stop: threading.Event) -> None:
+    x = 0
+    while not stop.is_set():
+        for i in range(2000):
+            x += i * i
+
+
+def _burn_process(stop: Any) -> None:
+    x = 0.0
+    while not stop.is_set():
+        for i in range(20000):
+            x += math.sqrt(i)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def run_load(load: str, seconds: float, threads: int, **manager_kwargs: Any) -> Dict[str, Any]:
+    """Run the loop for ``seconds`` under ``load`` and summarise its tick times."""
+    from fake_robot import FakeRobot
+
+    from reachy_mini_karen_whisperer.moves import MovementManager
+    from reachy_mini_karen_whisperer.output_deadband import DeadbandOutput
+
+    stamps = array("d", bytes(8 * int(seconds * 200 + 1000)))
+    count = [0]
+
+    class StampingRobot(FakeRobot):  # type: ignore[misc]
+        def set_target(self, head: Any = None, antennas: Any = None, body_yaw: Any = None) -> None:
+            if count[0] < len(stamps):
+                stamps[count[0]] = time.monotonic()
+                count[0] += 1
+
+    stop_thread = threading.Event()
+    stop_proc = multiprocessing.Event()
+    workers: List[Any] = []
+    if load == "gil":
+        workers = [threading.Thread(target=_burn_python, args=(stop_thread,), daemon=True) for _ in range(threads)]
+    elif load == "cpu":
+        workers = [
+            multiprocessing.Process(target=_burn_process, args=(stop_proc,), daemon=True)
+            for _ in range(os.cpu_count() or 1)
+        ]
+    for w in workers:
+        w.start()
+
+    # Ticks are timestamped in set_target, so every tick must reach it
+    output = DeadbandOutput(keepalive_s=0.0)
+    manager = MovementManager(current_robot=StampingRobot(), output=output, **manager_kwargs)
+    manager.start()
+    time.sleep(seconds)
+    status = manager.get_status()
+    manager._stop_event.set()  # skip stop()'s reset-to-neutral goto
+    manager._thread.join()
+    stop_thread.set()
+    stop_proc.set()
+    for w in workers:
+        w.join()
+
+    # Skip the first second (move start-up, worker threads ramping up)
+    t = stamps[: count[0]].tolist()
+    t = t[int(1.0 / PERIOD_S) :]
+    lateness: List[float] = []
+    slot = -1
+    for ts in t:
+        slot = max(slot + 1, int((ts - t[0]) / PERIOD_S))
+        lateness.append((ts - t[0] - slot * PERIOD_S) * 1e6)
+    jitter = sorted(abs(b - a - PERIOD_S) * 1e6 for a, b in zip(t, t[1:]))
+    late_ticks = sum(1 for v in lateness if v > PERIOD_S * 0.5e6)
+    lateness.sort()
+
+    timing = status.get("loop_timing")
+    return {
+        "load": load,
+        "ticks": len(t),
+        "hz": round((len(t) - 1) / (t[-1] - t[0]), 2),
+        "lateness_us": {
+            "p50": round(_percentile(lateness, 0.5)),
+            "p99": round(_percentile(lateness, 0.99)),
+            "max": round(lateness[-1]),
+        },
+        "jitter_us": {"p50": round(_percentile(jitter, 0.5)), "p99": round(_percentile(jitter, 0.99))},
+        "late_ticks": late_ticks,
+        "scheduler": None
+        if timing is None
+        else {
+            "missed_deadlines": timing["missed_deadlines"],
+            "skipped_ticks": timing["skipped_ticks"],
+            "lateness_p99_us": timing["lateness_us"]["p99_us"],
+        },
+    }
+
+
+def main() -> int:
+    """Run every load and print one line each."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=1, help="busy Python threads for the gil load")
+    parser.add_argument("--load", choices=LOADS, action="append")
+    parser.add_argument("--spin-us", type=float, help="MovementManager spin_s, in microseconds")
+    parser.add_argument("--rt-priority", type=int, help="MovementManager realtime_priority (SCHED_FIFO)")
+    parser.add_argument("--cpus", type=int, nargs="+", help="MovementManager cpus")
+    args = parser.parse_args()
+
+    # Only pass what was asked for, so the script also runs against trees without these options
+    manager_kwargs: Dict[str, Any] = {}
+    if args.spin_us is not None:
+        manager_kwargs["spin_s"] = args.spin_us / 1e6
+    if args.rt_priority is not None:
+        manager_kwargs["realtime_priority"] = args.rt_priority
+    if args.cpus:
+        manager_kwargs["cpus"] = args.cpus
+    for load in args.load or LOADS:
+        print(run_load(load, args.seconds, args.threads, **manager_kwargs), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
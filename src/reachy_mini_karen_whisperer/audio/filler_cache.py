@@ -0,0 +1,208 @@
+"""Pre-rendered filler clips ("one sec, let me look") that mask slow tool calls.
+
+While a slow tool runs (local vision, a Slack escalation with a flaky network)
+the customer would otherwise hear silence until the follow-up response. Short
+clips rendered offline per profile and voice are played instead, then faded out
+under the first chunk of the real response.
+
+Cache layout, one pair of files per profile and voice::
+
+    <cache_dir>/<profile>/<voice>.npy   # all clips concatenated, int16 mono
+    <cache_dir>/<profile>/<voice>.json  # {"sample_rate": 24000, "clips": [{"text", "offset", "length"}]}
+
+The ``.npy`` file is opened with ``mmap_mode="r"`` so clips are zero-copy views.
+Build it offline with::
+
+    python -m reachy_mini_karen_whisperer.audio.filler_cache --profile karen_whisperer --voice cedar
+"""
+
+from __future__ import annotations
+import sys
+import json
+import random
+import asyncio
+import logging
+import argparse
+from typing import Any, Dict, List, Optional
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PHRASES: List[str] = [
+    "One sec, let me look.",
+    "Hmm, let me check that.",
+    "Okay, give me a moment.",
+    "Let me see.",
+    "Just a second.",
+]
+PHRASES_FILE = "fillers.txt"  # optional per-profile override, one phrase per line
+CROSSFADE_MS = 30.0
+EDGE_FADE_MS = 10.0
+TTS_MODEL = "gpt-4o-mini-tts"
+
+
+def cache_paths(cache_dir: Path, profile: str, voice: str) -> tuple[Path, Path]:
+    """Return the (samples, index) paths of a profile/voice cache."""
+    base = cache_dir / profile
+    return base / f"{voice}.npy", base / f"{voice}.json"
+
+
+class FillerCache:
+    """Memory-mapped filler clips for one profile and voice."""
+
+    def __init__(self, samples: NDArray[np.int16], clips: List[Dict[str, Any]], sample_rate: int) -> None:
+        """Wrap already loaded samples and clip index."""
+        self._samples = samples
+        self.clips = clips
+        self.sample_rate = sample_rate
+        self._rng = random.Random()
+        self._last: Optional[int] = None
+
+    @classmethod
+    def load(cls, cache_dir: Path, profile: str, voice: str) -> Optional["FillerCache"]:
+        """Open the cache for ``profile``/``voice``; return None when it was not built."""
+        samples_path, index_path = cache_paths(cache_dir, profile, voice)
+        if not samples_path.exists() or not index_path.exists():
+            return None
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            samples = np.load(samples_path, mmap_mode="r")
+        except Exception as e:
+            logger.warning("Failed to load filler cache %s: %s", samples_path, e)
+            return None
+        if samples.dtype != np.int16 or samples.ndim != 1:
+            logger.warning(
+                "Ignoring filler cache %s: expected 1-D int16, got %s%s", samples_path, samples.dtype, samples.shape
+            )
+            return None
+        clips = [c for c in index.get("clips", []) if int(c["offset"]) + int(c["length"]) <= samples.shape[0]]
+        if not clips:
+            return None
+        logger.info("Loaded %d filler clips for profile=%s voice=%s", len(clips), profile, voice)
+        return cls(samples, clips, int(index.get("sample_rate", 24000)))
+
+    def pick(self) -> NDArray[np.int16]:
+        """Return a random clip (never the same twice in a row) as a view into the cache."""
+        choices = [i for i in range(len(self.clips)) if i != self._last] or [0]
+        idx = self._rng.choice(choices)
+        self._last = idx
+        clip = self.clips[idx]
+        start = int(clip["offset"])
+        return self._samples[start : start + int(clip["length"])]
+
+
+class FillerPlayback:
+    """Chunked playback of one clip that can hand over to the real response with a cross-fade."""
+
+    def __init__(self, clip: NDArray[np.int16], sample_rate: int, crossfade_ms: float = CROSSFADE_MS) -> None:
+        """Prepare ``clip`` for playback."""
+        self.clip = clip
+        self.sample_rate = sample_rate
+        self.position = 0
+        self._crossfade = max(1, int(sample_rate * crossfade_ms / 1000.0))
+
+    @property
+    def finished(self) -> bool:
+        """True once the whole clip has been handed out."""
+        return bool(self.position >= self.clip.shape[0])
+
+    def next_chunk(self, samples: int) -> Optional[NDArray[np.int16]]:
+        """Return the next ``samples`` of the clip, or None when it is over."""
+        if self.finished:
+            return None
+        chunk = self.clip[self.position : self.position + samples]
+        self.position += chunk.shape[0]
+        return np.array(chunk, dtype=np.int16)
+
+    def crossfade_into(self, pcm: NDArray[np.int16]) -> NDArray[np.int16]:
+        """Mix the fading clip tail under the start of ``pcm`` and end the filler."""
+        n = min(self._crossfade, pcm.shape[-1], self.clip.shape[0] - self.position)
+        if n <= 0:
+            self.position = self.clip.shape[0]
+            return pcm
+        tail = self.clip[self.position : self.position + n].astype(np.float32)
+        self.position = self.clip.shape[0]
+        fade = np.linspace(1.0, 0.0, n, dtype=np.float32)
+        out = pcm.reshape(-1).astype(np.float32)
+        out[:n] = out[:n] * (1.0 - fade) + tail * fade
+        return np.clip(out, -32768, 32767).astype(np.int16).reshape(pcm.shape)
+
+    def fade_out(self) -> Optional[NDArray[np.int16]]:
+        """Return a short faded tail to end the clip early without a click."""
+        n = min(self._crossfade, self.clip.shape[0] - self.position)
+        if n <= 0:
+            self.position = self.clip.shape[0]
+            return None
+        tail = self.clip[self.position : self.position + n].astype(np.float32)
+        tail *= np.linspace(1.0, 0.0, n, dtype=np.float32)
+        self.position = self.clip.shape[0]
+        return tail.astype(np.int16)
+
+
+# ---- offline generation ----
+def load_phrases(profile: str) -> List[str]:
+    """Return the filler phrases of ``profile`` (``fillers.txt``) or the defaults."""
+    path = Path(__file__).parent.parent / "profiles" / profile / PHRASES_FILE
+    if path.exists():
+        phrases = [ln.strip() for ln in path.read_text(encoding="utf-8").splitlines()]
+        phrases = [p for p in phrases if p and not p.startswith("#")]
+        if phrases:
+            return phrases
+    return list(DEFAULT_PHRASES)
+
+
+def _edge_fade(pcm: NDArray[np.int16], sample_rate: int) -> NDArray[np.int16]:
+    n = min(pcm.shape[0] // 2, int(sample_rate * EDGE_FADE_MS / 1000.0))
+    out = pcm.astype(np.float32)
+    if n > 0:
+        ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+        out[:n] *= ramp
+        out[-n:] *= ramp[::-1]
+    return out.astype(np.int16)
+
+
+async def build_cache(cache_dir: Path, profile: str, voice: str, sample_rate: int = 24000) -> Path:
+    """Render the profile phrases with ``voice`` and write the cache files."""
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI()
+    clips: List[Dict[str, Any]] = []
+    parts: List[NDArray[np.int16]] = []
+    offset = 0
+    for text in load_phrases(profile):
+        response = await client.audio.speech.create(model=TTS_MODEL, voice=voice, input=text, response_format="pcm")
+        pcm = _edge_fade(np.frombuffer(response.content, dtype=np.int16), sample_rate)
+        clips.append({"text": text, "offset": offset, "length": int(pcm.shape[0])})
+        parts.append(pcm)
+        offset += pcm.shape[0]
+        logger.info("Rendered filler %r (%.2fs)", text, pcm.shape[0] / sample_rate)
+
+    samples_path, index_path = cache_paths(cache_dir, profile, voice)
+    samples_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(samples_path, np.concatenate(parts) if parts else np.zeros(0, dtype=np.int16))
+    index_path.write_text(json.dumps({"sample_rate": sample_rate, "clips": clips}, indent=2), encoding="utf-8")
+    return samples_path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point for offline cache generation."""
+    from reachy_mini_karen_whisperer.config import config
+
+    parser = argparse.ArgumentParser(description="Render filler clips for a profile and voice.")
+    parser.add_argument("--profile", default=config.REACHY_MINI_CUSTOM_PROFILE or "default")
+    parser.add_argument("--voice", default="cedar")
+    parser.add_argument("--cache-dir", type=Path, default=Path(config.FILLER_CACHE_DIR))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    path = asyncio.run(build_cache(args.cache_dir, args.profile, args.voice))
+    print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ from collections.abc import Callable
 import numpy as np
 from numpy.typing import NDArray
 
+from reachy_mini_karen_whisperer.pose import Pose
 from reachy_mini_karen_whisperer.audio.speech_tapper import HOP_MS, SwayRollRT
 
 
@@ -22,7 +23,7 @@ logger = logging.getLogger(__name__)
 class HeadWobbler:
     """Converts audio deltas (base64) into head movement offsets."""
 
-    def __init__(self, set_speech_offsets: Callable[[Tuple[float, float, float, float, float, float]], None]) -> None:
+    def __init__(self, set_speech_offsets: Callable[[Pose], None]) -> None:
         """Initialize the head wobbler."""
         self._apply_offsets = set_speech_offsets
         self._base_ts: float | None = None
@@ -124,7 +125,7 @@ class HeadWobbler:
                                 break
 
                     r = results[i]
-                    offsets = (
+                    offsets = Pose.from_offsets(
                         r["x_mm"] / 1000.0,
                         r["y_mm"] / 1000.0,
                         r["z_mm"] / 1000.0,
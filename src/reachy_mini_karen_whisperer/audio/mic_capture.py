@@ -0,0 +1,103 @@
+"""Microphone capture stage running on a dedicated thread.
+
+The media backends only expose a non-blocking ``get_audio_sample()``. Polling it
+from the asyncio loop with ``await asyncio.sleep(0)`` spins a full core while no
+frame is ready and competes for the GIL with the movement and camera threads.
+Here the polling happens on its own thread with a short, adaptive sleep between
+empty reads (releasing the GIL), and frames are handed to the event loop through
+``call_soon_threadsafe`` into a bounded queue.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_FRAMES = 50
+MIN_IDLE_SLEEP_S = 0.002
+MAX_IDLE_SLEEP_S = 0.010
+
+
+class MicCapture:
+    """Pull frames from ``get_sample`` on a thread and queue them on ``loop``."""
+
+    def __init__(
+        self,
+        get_sample: Callable[[], Optional[NDArray[Any]]],
+        loop: asyncio.AbstractEventLoop,
+        *,
+        max_frames: int = DEFAULT_QUEUE_FRAMES,
+    ) -> None:
+        """Initialize the capture stage.
+
+        ``max_frames`` bounds the hand-off queue; when the consumer falls behind
+        the oldest frames are dropped so latency never grows unbounded.
+        """
+        self._get_sample = get_sample
+        self._loop = loop
+        self._queue: "asyncio.Queue[NDArray[Any]]" = asyncio.Queue(maxsize=max(1, max_frames))
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+    def start(self) -> None:
+        """Start the capture thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.working_loop, name="mic-capture", daemon=True)
+        self._thread.start()
+        logger.debug("Mic capture started")
+
+    def stop(self) -> None:
+        """Stop the capture thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        logger.debug("Mic capture stopped (captured=%d dropped=%d)", self.frames_captured, self.frames_dropped)
+
+    async def get(self) -> NDArray[Any]:
+        """Wait for the next captured frame."""
+        return await self._queue.get()
+
+    def _offer(self, frame: NDArray[Any]) -> None:
+        """Enqueue a frame on the loop thread, dropping the oldest one when full."""
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+                self.frames_dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(frame)
+
+    def working_loop(self) -> None:
+        """Read frames from the media backend and forward them to the event loop."""
+        idle_sleep = MIN_IDLE_SLEEP_S
+        while not self._stop_event.is_set():
+            try:
+                frame = self._get_sample()
+            except Exception as e:
+                logger.debug("Mic read failed: %s", e)
+                frame = None
+
+            if frame is None:
+                # Nothing ready: back off a little, up to roughly one audio block
+                self._stop_event.wait(idle_sleep)
+                idle_sleep = min(MAX_IDLE_SLEEP_S, idle_sleep * 2)
+                continue
+
+            idle_sleep = MIN_IDLE_SLEEP_S
+            self.frames_captured += 1
+            try:
+                self._loop.call_soon_threadsafe(self._offer, np.asarray(frame))
+            except RuntimeError:
+                # Event loop closed during shutdown
+                break
+        logger.debug("Mic capture thread exited")
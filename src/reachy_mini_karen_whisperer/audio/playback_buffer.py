@@ -0,0 +1,220 @@
+"""Bounded playback jitter buffer between the realtime handler and the speaker.
+
+The realtime API streams audio deltas faster than real time. Pushing them
+straight into the player means whole responses pile up inside the media
+pipeline and must be flushed on barge-in. This buffer stages the chunks instead
+and releases them against the output sample clock so that the player only ever
+holds about ``lead_ms`` of audio.
+
+- ``target_depth_ms``: audio accumulated before playout (re)starts, to absorb
+  network jitter. Playout also starts once the oldest chunk has waited that long,
+  so short trailing responses are never stuck.
+- ``max_depth_ms``: hard ceiling on buffered audio. Producers awaiting ``put``
+  are held back (backpressure) until playout frees space.
+- ``lead_ms``: how far ahead of the output clock audio is handed to the player.
+"""
+
+from __future__ import annotations
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Tuple, Callable
+from collections import deque
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_DEPTH_MS = 120.0
+DEFAULT_MAX_DEPTH_MS = 3000.0
+DEFAULT_LEAD_MS = 80.0
+# A gap shorter than this between the player draining and new audio arriving is
+# treated as an audible underrun rather than the boundary between two responses.
+UNDERRUN_WINDOW_S = 0.5
+_IDLE_POLL_S = 0.1
+
+Chunk = Tuple[NDArray[np.float32], Any]
+
+
+class PlaybackJitterBuffer:
+    """Duration-bounded FIFO of output audio chunks with real-time pacing."""
+
+    def __init__(
+        self,
+        sample_rate: int,
+        *,
+        target_depth_ms: float = DEFAULT_TARGET_DEPTH_MS,
+        max_depth_ms: float = DEFAULT_MAX_DEPTH_MS,
+        lead_ms: float = DEFAULT_LEAD_MS,
+    ) -> None:
+        """Initialize the buffer for audio at ``sample_rate`` Hz."""
+        self.sample_rate = int(sample_rate)
+        self.target_depth_s = max(0.0, target_depth_ms / 1000.0)
+        self.lead_s = max(0.0, lead_ms / 1000.0)
+        self._target_samples = int(self.target_depth_s * self.sample_rate)
+        self._max_samples = max(1, int(max_depth_ms / 1000.0 * self.sample_rate))
+
+        self._now = time.monotonic
+        self._chunks: deque[Chunk] = deque()
+        self._buffered_samples = 0
+        self._oldest_arrival: float | None = None
+        self._generation = 0
+
+        self._data_event = asyncio.Event()
+        self._space_event = asyncio.Event()
+
+        # Output clock: samples handed to the player since playout (re)started
+        self._playing = False
+        self._clock_start = 0.0
+        self._samples_out = 0
+        self._drained_at: float | None = None
+
+        # Counters
+        self.underruns = 0
+        self.overruns = 0
+        self.chunks_played = 0
+        self.samples_played = 0
+        self.samples_dropped = 0
+
+    @property
+    def buffered_ms(self) -> float:
+        """Duration of audio currently waiting in the buffer."""
+        return 1000.0 * self._buffered_samples / self.sample_rate
+
+    async def put(self, samples: NDArray[np.float32], meta: Any = None) -> bool:
+        """Append a chunk, waiting while the buffer is above its duration ceiling.
+
+        Returns False when the chunk was discarded because ``clear()`` ran while
+        the producer was held back.
+        """
+        n = len(samples)
+        generation = self._generation
+        if self._buffered_samples > 0 and self._buffered_samples + n > self._max_samples:
+            self.overruns += 1
+            while self._buffered_samples > 0 and self._buffered_samples + n > self._max_samples:
+                self._space_event.clear()
+                await self._space_event.wait()
+                if generation != self._generation:
+                    self.samples_dropped += n
+                    return False
+
+        if not self._chunks:
+            self._oldest_arrival = self._now()
+        self._chunks.append((samples, meta))
+        self._buffered_samples += n
+        self._data_event.set()
+        return True
+
+    def clear(self) -> int:
+        """Drop all buffered audio and reset the output clock.
+
+        Returns the number of samples dropped. Producers blocked in ``put`` are
+        released and their chunks discarded.
+        """
+        dropped = self._buffered_samples
+        self._chunks.clear()
+        self._buffered_samples = 0
+        self._oldest_arrival = None
+        self._generation += 1
+        self._playing = False
+        self._drained_at = None
+        self.samples_dropped += dropped
+        self._space_event.set()
+        return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of buffer depth and counters."""
+        return {
+            "buffered_ms": round(self.buffered_ms, 1),
+            "target_depth_ms": round(self.target_depth_s * 1000.0, 1),
+            "max_depth_ms": round(1000.0 * self._max_samples / self.sample_rate, 1),
+            "lead_ms": round(self.lead_s * 1000.0, 1),
+            "playing": self._playing,
+            "underruns": self.underruns,
+            "overruns": self.overruns,
+            "chunks_played": self.chunks_played,
+            "seconds_played": round(self.samples_played / self.sample_rate, 2),
+            "seconds_dropped": round(self.samples_dropped / self.sample_rate, 2),
+        }
+
+    def _device_lead(self, now: float) -> float:
+        """Seconds of audio handed to the player that it has not played yet."""
+        return self._samples_out / self.sample_rate - (now - self._clock_start)
+
+    def _pop(self) -> Chunk:
+        samples, meta = self._chunks.popleft()
+        self._buffered_samples -= len(samples)
+        if not self._chunks:
+            self._oldest_arrival = None
+        self._space_event.set()
+        return samples, meta
+
+    async def _wait_for_data(self, timeout: float) -> None:
+        self._data_event.clear()
+        try:
+            await asyncio.wait_for(self._data_event.wait(), timeout=max(0.0, timeout))
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(
+        self,
+        push: Callable[[NDArray[np.float32], Any], None],
+        stop_event: asyncio.Event,
+    ) -> None:
+        """Release buffered chunks to ``push`` at real-time pace until stopped."""
+        while not stop_event.is_set():
+            now = self._now()
+
+            if not self._chunks:
+                if self._playing:
+                    lead = self._device_lead(now)
+                    if lead > 0:
+                        await self._wait_for_data(lead)
+                        continue
+                    self._playing = False
+                    self._drained_at = now
+                await self._wait_for_data(_IDLE_POLL_S)
+                continue
+
+            if not self._playing:
+                waited = now - (self._oldest_arrival or now)
+                if self._buffered_samples < self._target_samples and waited < self.target_depth_s:
+                    await self._wait_for_data(self.target_depth_s - waited)
+                    continue
+                if self._drained_at is not None and now - self._drained_at < UNDERRUN_WINDOW_S:
+                    self.underruns += 1
+                    logger.debug("Playback underrun (gap %.0f ms)", 1000.0 * (now - self._drained_at))
+                self._drained_at = None
+                self._playing = True
+                self._clock_start = now
+                self._samples_out = 0
+
+            lead = self._device_lead(now)
+            if lead > self.lead_s:
+                await asyncio.sleep(lead - self.lead_s)
+                continue
+            if lead < 0 and self._samples_out > 0:
+                # The loop fell behind and the player starved: restart the clock
+                self.underruns += 1
+                logger.debug("Playback underrun (late by %.0f ms)", -1000.0 * lead)
+                self._clock_start = now
+                self._samples_out = 0
+
+            samples, meta = self._pop()
+            try:
+                push(samples, meta)
+            except Exception as e:
+                logger.warning("Failed to push audio to player: %s", e)
+            self._samples_out += len(samples)
+            self.samples_played += len(samples)
+            self.chunks_played += 1
+
+    def describe(self) -> str:
+        """Return a one-line summary suitable for logs."""
+        s = self.stats()
+        return (
+            f"buffered={s['buffered_ms']}ms underruns={s['underruns']} overruns={s['overruns']} "
+            f"played={s['seconds_played']}s dropped={s['seconds_dropped']}s"
+        )
@@ -0,0 +1,81 @@
+"""Playback cursor mapping speaker output back to realtime response items.
+
+The handler records every audio delta it enqueues (per conversation item, in
+arrival order) and the stream reports how many samples it actually handed to
+the speaker. On barge-in the cursor tells which item was audible and how much of
+it was heard, so the server-side conversation can be truncated to match.
+"""
+
+from __future__ import annotations
+import logging
+from typing import List, Tuple, Optional
+from collections import deque
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Segment:
+    """Audio of one response item, in source samples."""
+
+    item_id: str
+    enqueued: int = 0
+    played: int = 0
+    done: bool = False
+
+
+class PlaybackCursor:
+    """Track samples enqueued and played per response item (FIFO)."""
+
+    def __init__(self, sample_rate: int) -> None:
+        """Initialize the cursor for audio at ``sample_rate`` Hz (the handler's output rate)."""
+        self.sample_rate = int(sample_rate)
+        self._segments: deque[_Segment] = deque()
+
+    def enqueue(self, item_id: str, samples: int) -> None:
+        """Record ``samples`` of ``item_id`` queued for playback."""
+        if self._segments and self._segments[-1].item_id == item_id:
+            self._segments[-1].enqueued += samples
+        else:
+            self._segments.append(_Segment(item_id=item_id, enqueued=samples))
+
+    def mark_done(self, item_id: str) -> None:
+        """Record that the server finished streaming audio for ``item_id``."""
+        for seg in self._segments:
+            if seg.item_id == item_id:
+                seg.done = True
+
+    def advance(self, samples: int) -> None:
+        """Record ``samples`` handed to the speaker, attributed in FIFO order."""
+        remaining = samples
+        while remaining > 0 and self._segments:
+            head = self._segments[0]
+            take = min(head.enqueued - head.played, remaining)
+            head.played += take
+            remaining -= take
+            if head.played >= head.enqueued and len(self._segments) > 1:
+                # Fully heard and a later item is already queued behind it
+                self._segments.popleft()
+            elif take == 0:
+                break
+
+    def interrupt_point(self) -> Optional[Tuple[str, int]]:
+        """Return ``(item_id, audio_end_ms)`` for the item being heard, if it must be truncated.
+
+        Nothing is returned when the last audible item was played to the end and
+        the server has finished streaming it.
+        """
+        for seg in self._segments:
+            if seg.played < seg.enqueued or not seg.done:
+                return seg.item_id, int(1000 * seg.played / self.sample_rate)
+        return None
+
+    def reset(self) -> None:
+        """Forget all tracked items (after an interruption or reconnect)."""
+        self._segments.clear()
+
+    def pending_items(self) -> List[str]:
+        """Return item IDs that still have unplayed audio."""
+        return [seg.item_id for seg in self._segments if seg.played < seg.enqueued]
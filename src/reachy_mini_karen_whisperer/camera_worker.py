@@ -2,21 +2,22 @@
 
 Ported from main_works.py camera_worker() function to provide:
 - 30Hz+ camera polling with thread-safe frame buffering
-- Face tracking integration with smooth interpolation
+- Face tracking integration with smooth interpolation, published to an offset
+  bus channel of the movement manager
 - Latest frame always available for tools
 """
 
 import time
 import logging
 import threading
-from typing import Any, List, Tuple
+from typing import Any, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.transform import Rotation as R
 
 from reachy_mini import ReachyMini
-from reachy_mini.utils.interpolation import linear_pose_interpolation
+from reachy_mini_karen_whisperer.pose import IDENTITY_POSE, Pose
+from reachy_mini_karen_whisperer.offset_bus import OffsetChannel
 
 
 logger = logging.getLogger(__name__)
@@ -36,22 +37,16 @@ class CameraWorker:
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
-        # Face tracking state
+        # Face tracking state: the published offset pose is replaced, never mutated
         self.is_head_tracking_enabled = True
-        self.face_tracking_offsets: List[float] = [
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-        ]  # x, y, z, roll, pitch, yaw
+        self.face_tracking_pose: Pose = IDENTITY_POSE
         self.face_tracking_lock = threading.Lock()
+        self.offset_channel: OffsetChannel | None = None
 
         # Face tracking timing variables (same as main_works.py)
         self.last_face_detected_time: float | None = None
         self.interpolation_start_time: float | None = None
-        self.interpolation_start_pose: NDArray[np.float32] | None = None
+        self.interpolation_start_pose: Pose | None = None
         self.face_lost_delay = 2.0  # seconds to wait before starting interpolation
         self.interpolation_duration = 1.0  # seconds to interpolate back to neutral
 
@@ -66,13 +61,30 @@ class CameraWorker:
             # Return a copy in original BGR format (OpenCV native)
             return self.latest_frame.copy()
 
+    def get_face_tracking_pose(self) -> Pose:
+        """Get the current face tracking offset pose (thread-safe; do not mutate it)."""
+        with self.face_tracking_lock:
+            return self.face_tracking_pose
+
+    def set_offset_channel(self, channel: OffsetChannel | None) -> None:
+        """Publish face tracking offsets to ``channel`` (the movement manager's "face" channel)."""
+        self.offset_channel = channel
+        if channel is not None:
+            channel.publish(self.get_face_tracking_pose())
+
+    def _publish_face_tracking_pose(self, pose: Pose) -> None:
+        """Replace the face tracking offset pose and publish it to the offset channel."""
+        with self.face_tracking_lock:
+            self.face_tracking_pose = pose
+        channel = self.offset_channel
+        if channel is not None:
+            channel.publish(pose)
+
     def get_face_tracking_offsets(
         self,
     ) -> Tuple[float, float, float, float, float, float]:
-        """Get current face tracking offsets (thread-safe)."""
-        with self.face_tracking_lock:
-            offsets = self.face_tracking_offsets
-            return (offsets[0], offsets[1], offsets[2], offsets[3], offsets[4], offsets[5])
+        """Get current face tracking offsets as (x, y, z, roll, pitch, yaw) (thread-safe)."""
+        return self.get_face_tracking_pose().as_offsets()
 
     def set_head_tracking_enabled(self, enabled: bool) -> None:
         """Enable/disable head tracking."""
@@ -101,8 +113,6 @@ class CameraWorker:
         """
         logger.debug("Starting camera working loop")
 
-        # Initialize head tracker if available
-        neutral_pose = np.eye(4)  # Neutral pose (identity matrix)
         self.previous_head_tracking_state = self.is_head_tracking_enabled
 
         while not self._stop_event.is_set():
@@ -152,24 +162,11 @@ class CameraWorker:
                                 perform_movement=False,
                             )
 
-                            # Extract translation and rotation from the target pose directly
-                            translation = target_pose[:3, 3]
-                            rotation = R.from_matrix(target_pose[:3, :3]).as_euler("xyz", degrees=False)
-
-                            # Scale down translation and rotation because smaller FOV
-                            translation *= 0.6
-                            rotation *= 0.6
+                            # Scale down translation and rotation (along the geodesic) because smaller FOV
+                            offset = Pose().set_interpolated(IDENTITY_POSE, Pose.from_matrix(target_pose), 0.6)
 
                             # Thread-safe update of face tracking offsets (use pose as-is)
-                            with self.face_tracking_lock:
-                                self.face_tracking_offsets = [
-                                    translation[0],
-                                    translation[1],
-                                    translation[2],  # x, y, z
-                                    rotation[0],
-                                    rotation[1],
-                                    rotation[2],  # roll, pitch, yaw
-                                ]
+                            self._publish_face_tracking_pose(offset)
 
                         # No face detected while tracking enabled - set face lost timestamp
                         elif self.last_face_detected_time is None or self.last_face_detected_time == current_time:
@@ -187,42 +184,18 @@ class CameraWorker:
                                 self.interpolation_start_time = current_time
                                 # Capture current pose as start of interpolation
                                 with self.face_tracking_lock:
-                                    current_translation = self.face_tracking_offsets[:3]
-                                    current_rotation_euler = self.face_tracking_offsets[3:]
-                                    # Convert to 4x4 pose matrix
-                                    pose_matrix = np.eye(4, dtype=np.float32)
-                                    pose_matrix[:3, 3] = current_translation
-                                    pose_matrix[:3, :3] = R.from_euler(
-                                        "xyz",
-                                        current_rotation_euler,
-                                    ).as_matrix()
-                                    self.interpolation_start_pose = pose_matrix
+                                    self.interpolation_start_pose = self.face_tracking_pose
 
                             # Calculate interpolation progress (t from 0 to 1)
                             elapsed_interpolation = current_time - self.interpolation_start_time
                             t = min(1.0, elapsed_interpolation / self.interpolation_duration)
 
                             # Interpolate between current pose and neutral pose
-                            interpolated_pose = linear_pose_interpolation(
-                                self.interpolation_start_pose,
-                                neutral_pose,
-                                t,
-                            )
-
-                            # Extract translation and rotation from interpolated pose
-                            translation = interpolated_pose[:3, 3]
-                            rotation = R.from_matrix(interpolated_pose[:3, :3]).as_euler("xyz", degrees=False)
+                            start_pose = self.interpolation_start_pose or IDENTITY_POSE
+                            interpolated_pose = Pose().set_interpolated(start_pose, IDENTITY_POSE, t)
 
                             # Thread-safe update of face tracking offsets
-                            with self.face_tracking_lock:
-                                self.face_tracking_offsets = [
-                                    translation[0],
-                                    translation[1],
-                                    translation[2],  # x, y, z
-                                    rotation[0],
-                                    rotation[1],
-                                    rotation[2],  # roll, pitch, yaw
-                                ]
+                            self._publish_face_tracking_pose(interpolated_pose)
 
                             # If interpolation is complete, reset timing
                             if t >= 1.0:
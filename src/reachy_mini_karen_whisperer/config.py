@@ -35,6 +35,18 @@ else:
     logger.warning("No .env file found, using environment variables")
 
 
+def _optional_int_env(name: str) -> int | None:
+    """Return the integer in environment variable ``name``, or None when it is unset or invalid."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={raw!r}: not an integer")
+        return None
+
+
 class Config:
     """Configuration class for the conversation app."""
 
@@ -55,6 +67,62 @@ class Config:
     logger.debug(f"Model: {MODEL_NAME}, HF_HOME: {HF_HOME}, Vision Model: {LOCAL_VISION_MODEL}")
     logger.debug(f"Slack webhook configured: {bool(SLACK_WEBHOOK_URL)}")
 
+    # Headless playback jitter buffer (console mode)
+    PLAYBACK_TARGET_DEPTH_MS = float(os.getenv("PLAYBACK_TARGET_DEPTH_MS", "120"))
+    PLAYBACK_MAX_DEPTH_MS = float(os.getenv("PLAYBACK_MAX_DEPTH_MS", "3000"))
+
+    # Warm standby realtime session (second connection promoted on drop/personality switch)
+    REALTIME_WARM_STANDBY = os.getenv("REALTIME_WARM_STANDBY", "").strip().lower() in {"1", "true", "yes", "on"}
+    REALTIME_STANDBY_MAX_LIFETIME_S = float(os.getenv("REALTIME_STANDBY_MAX_LIFETIME_S", "600"))
+
+    # Conversation context trimming (estimated tokens kept server-side; camera image lifetime)
+    REALTIME_CONTEXT_TOKEN_BUDGET = int(os.getenv("REALTIME_CONTEXT_TOKEN_BUDGET", "16000"))
+    REALTIME_CONTEXT_IMAGE_TTL_S = float(os.getenv("REALTIME_CONTEXT_IMAGE_TTL_S", "120"))
+
+    # Conversation replay into a new session after a reconnect (0 tokens disables)
+    REALTIME_RESUME_TOKEN_BUDGET = int(os.getenv("REALTIME_RESUME_TOKEN_BUDGET", "1500"))
+    REALTIME_RESUME_MAX_SEED_MS = float(os.getenv("REALTIME_RESUME_MAX_SEED_MS", "500"))
+    REALTIME_RESUME_MAX_AGE_S = float(os.getenv("REALTIME_RESUME_MAX_AGE_S", "300"))
+
+    # Idle behaviour: "local" (planner, no model calls) or "model" (ask the realtime model)
+    IDLE_MODE = os.getenv("IDLE_MODE", "local").strip().lower()
+    IDLE_MODEL_FALLBACK = os.getenv("IDLE_MODEL_FALLBACK", "").strip().lower() in {"1", "true", "yes", "on"}
+    IDLE_SEED = _optional_int_env("IDLE_SEED")
+    IDLE_EMOTIONS = [e.strip() for e in os.getenv("IDLE_EMOTIONS", "").split(",") if e.strip()] or None
+
+    # Filler clips played while slow tools run (0 disables); built offline into FILLER_CACHE_DIR
+    FILLER_LATENCY_THRESHOLD_S = float(os.getenv("FILLER_LATENCY_THRESHOLD_S", "1.0"))
+    FILLER_CACHE_DIR = os.getenv("FILLER_CACHE_DIR", "").strip() or os.path.join(HF_HOME, "fillers")
+
+    # Record realtime traffic (events, client calls, PCM sidecars) for offline replay; empty disables
+    REALTIME_RECORD_DIR = os.getenv("REALTIME_RECORD_DIR", "").strip() or None
+
+    # Realtime websocket endpoint override, e.g. ws://127.0.0.1:8765/v1 for the local mock server
+    OPENAI_WEBSOCKET_BASE_URL = os.getenv("OPENAI_WEBSOCKET_BASE_URL", "").strip() or None
+
+    # Log the stack of whatever blocks the asyncio loop for longer than this (0 disables)
+    LOOP_LAG_THRESHOLD_MS = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "100"))
+
+    # Dances and emotions sampled into memory-mapped arrays, one file per library version
+    TRAJECTORY_CACHE_DIR = os.getenv("TRAJECTORY_CACHE_DIR", "").strip() or os.path.join(HF_HOME, "trajectories")
+
+    # Movement control loop: busy-wait this long before each 100 Hz deadline instead of sleeping
+    CONTROL_LOOP_SPIN_US = float(os.getenv("CONTROL_LOOP_SPIN_US", "500"))
+    # Opt-in Linux real-time mode for the control thread: SCHED_FIFO priority (0 disables) and CPUs to pin it to
+    CONTROL_LOOP_RT_PRIORITY = int(os.getenv("CONTROL_LOOP_RT_PRIORITY", "0"))
+    CONTROL_LOOP_CPUS = [int(c) for c in os.getenv("CONTROL_LOOP_CPUS", "").split(",") if c.strip()]
+    # Skip set_target while the command stays within this dead-band of the last one sent; resend at least every
+    # CONTROL_KEEPALIVE_S seconds (0 sends every tick)
+    CONTROL_DEADBAND_MM = float(os.getenv("CONTROL_DEADBAND_MM", "0.1"))
+    CONTROL_DEADBAND_DEG = float(os.getenv("CONTROL_DEADBAND_DEG", "0.05"))
+    CONTROL_KEEPALIVE_S = float(os.getenv("CONTROL_KEEPALIVE_S", "0.5"))
+    # Primary move queue: most moves queued at once, and most plays of one move coalesced into an entry
+    MOVE_QUEUE_CAPACITY = int(os.getenv("MOVE_QUEUE_CAPACITY", "8"))
+    MOVE_QUEUE_MAX_REPEATS = int(os.getenv("MOVE_QUEUE_MAX_REPEATS", "5"))
+    # Control loop flight recorder: seconds of ticks kept in memory (0 disables) and where dumps are written
+    FLIGHT_RECORDER_S = float(os.getenv("FLIGHT_RECORDER_S", "120"))
+    FLIGHT_RECORDER_DIR = os.getenv("FLIGHT_RECORDER_DIR", "flight_recordings").strip() or "flight_recordings"
+
     REACHY_MINI_CUSTOM_PROFILE = LOCKED_PROFILE or os.getenv("REACHY_MINI_CUSTOM_PROFILE")
     logger.debug(f"Custom Profile: {REACHY_MINI_CUSTOM_PROFILE}")
 
@@ -11,19 +11,27 @@ app instance's ``.env`` file (if available) and proceed to start streaming.
 
 import os
 import sys
+import math
 import time
 import asyncio
 import logging
 from typing import List, Optional
 from pathlib import Path
 
+import numpy as np
 from fastrtc import AdditionalOutputs, audio_to_float32
+from numpy.typing import NDArray
 from scipy.signal import resample
 
 from reachy_mini import ReachyMini
 from reachy_mini.media.media_manager import MediaBackend
 from reachy_mini_karen_whisperer.config import LOCKED_PROFILE, config
-from reachy_mini_karen_whisperer.openai_realtime import OpenaiRealtimeHandler
+from reachy_mini_karen_whisperer.turn_latency import FIRST_AUDIO_PLAYED
+from reachy_mini_karen_whisperer.loop_watchdog import LoopLagMonitor, monitor_running_loop
+from reachy_mini_karen_whisperer.openai_realtime import ResponseAudio, OpenaiRealtimeHandler
+from reachy_mini_karen_whisperer.audio.mic_capture import MicCapture
+from reachy_mini_karen_whisperer.audio.playback_buffer import PlaybackJitterBuffer
+from reachy_mini_karen_whisperer.audio.playback_cursor import PlaybackCursor
 from reachy_mini_karen_whisperer.headless_personality_ui import mount_personality_routes
 
 
@@ -66,10 +74,15 @@ class LocalStream:
         self._tasks: List[asyncio.Task[None]] = []
         # Allow the handler to flush the player queue when appropriate.
         self.handler._clear_queue = self.clear_audio_queue
+        # Report samples handed to the speaker so interruptions truncate precisely.
+        self.handler.playback_cursor = PlaybackCursor(self.handler.output_sample_rate)
         self._settings_app: Optional[FastAPI] = settings_app
         self._instance_path: Optional[str] = instance_path
         self._settings_initialized = False
         self._asyncio_loop = None
+        # Created once the player is started and its sample rate is known
+        self._playback: Optional[PlaybackJitterBuffer] = None
+        self._loop_monitor: Optional[LoopLagMonitor] = None
 
     # ---- Settings UI (only when API key is missing) ----
     def _read_env_lines(self, env_path: Path) -> list[str]:
@@ -268,6 +281,62 @@ class LocalStream:
                 ready = False
             return JSONResponse({"ready": ready})
 
+        # GET /latency -> per-turn voice latency percentiles
+        @self._settings_app.get("/latency")
+        def _latency() -> JSONResponse:
+            summary = self.handler.latency.summary()
+            summary["barge_in_ms"] = list(self.handler.barge_in_latencies_ms)
+            summary["context"] = self.handler.context.stats()
+            summary["resume"] = self.handler.last_resume
+            summary["reconnect_gap_ms"] = self.handler.last_reconnect_gap_ms
+            if self._playback is not None:
+                summary["playback"] = self._playback.stats()
+            if self._loop_monitor is not None:
+                summary["loop_lag"] = self._loop_monitor.stats()
+            return JSONResponse(summary)
+
+        # GET /motion -> movement loop frequency, deadline timing, per-stage cost and set_target traffic
+        @self._settings_app.get("/motion")
+        def _motion() -> JSONResponse:
+            movement_manager = self.handler.deps.movement_manager
+            if movement_manager is None:
+                return JSONResponse({"error": "no movement manager"}, status_code=503)
+            status = movement_manager.get_status()
+            # Frequencies start at inf (no samples yet), which JSON cannot carry
+            frequency = {k: v if math.isfinite(v) else None for k, v in status["loop_frequency"].items()}
+            return JSONResponse(
+                {
+                    "queue_size": status["queue_size"],
+                    "move_queue": status["move_queue"],
+                    "loop_frequency": frequency,
+                    "loop_timing": status["loop_timing"],
+                    "loop_profile": status["loop_profile"],
+                    "output": status["output"],
+                    "flight_recorder": status["flight_recorder"],
+                }
+            )
+
+        # GET /motion/flight_recorder?seconds=60 -> dump the control loop flight recorder and download it
+        @self._settings_app.get("/motion/flight_recorder")
+        def _flight_recorder(seconds: Optional[float] = None) -> Response:
+            movement_manager = self.handler.deps.movement_manager
+            if movement_manager is None or movement_manager.recorder is None:
+                return JSONResponse({"error": "flight recorder disabled (FLIGHT_RECORDER_S=0)"}, status_code=503)
+            path = movement_manager.dump_flight_recorder(config.FLIGHT_RECORDER_DIR, seconds)
+            return FileResponse(str(path), media_type="application/octet-stream", filename=path.name)
+
+        # GET /idle -> idle behaviour counters
+        @self._settings_app.get("/idle")
+        def _idle() -> JSONResponse:
+            engine = self.handler.idle_engine
+            return JSONResponse(
+                {
+                    "mode": config.IDLE_MODE,
+                    "model_calls": self.handler.model_idle_calls,
+                    "local": engine.stats() if engine is not None else None,
+                }
+            )
+
         # POST /openai_api_key -> set/persist key
         @self._settings_app.post("/openai_api_key")
         def _set_key(payload: ApiKeyPayload) -> JSONResponse:
@@ -378,6 +447,7 @@ class LocalStream:
             # Capture loop for cross-thread personality actions
             loop = asyncio.get_running_loop()
             self._asyncio_loop = loop  # type: ignore[assignment]
+            self._loop_monitor = monitor_running_loop(config.LOOP_LAG_THRESHOLD_MS)
             # Mount personality routes now that loop and handler are available
             try:
                 if self._settings_app is not None:
@@ -390,10 +460,16 @@ class LocalStream:
                     )
             except Exception:
                 pass
+            self._playback = PlaybackJitterBuffer(
+                self._robot.media.get_output_audio_samplerate(),
+                target_depth_ms=config.PLAYBACK_TARGET_DEPTH_MS,
+                max_depth_ms=config.PLAYBACK_MAX_DEPTH_MS,
+            )
             self._tasks = [
                 asyncio.create_task(self.handler.start_up(), name="openai-handler"),
                 asyncio.create_task(self.record_loop(), name="stream-record-loop"),
                 asyncio.create_task(self.play_loop(), name="stream-play-loop"),
+                asyncio.create_task(self.playout_loop(), name="stream-playout-loop"),
             ]
             try:
                 await asyncio.gather(*self._tasks)
@@ -402,6 +478,8 @@ class LocalStream:
             finally:
                 # Ensure handler connection is closed
                 await self.handler.shutdown()
+                if self._loop_monitor is not None:
+                    self._loop_monitor.stop()
 
         asyncio.run(runner())
 
@@ -411,7 +489,7 @@ class LocalStream:
         This method:
         - Stops audio recording and playback first
         - Sets the stop event to signal async loops to terminate
-        - Cancels all pending async tasks (openai-handler, record-loop, play-loop)
+        - Cancels all pending async tasks (openai-handler, record-loop, play-loop, playout-loop)
         """
         logger.info("Stopping LocalStream...")
 
@@ -436,8 +514,10 @@ class LocalStream:
                 task.cancel()
 
     def clear_audio_queue(self) -> None:
-        """Flush the player's appsrc to drop any queued audio immediately."""
+        """Drop the audio staged in the jitter buffer, then flush the player's appsrc."""
         logger.info("User intervention: flushing player queue")
+        if self._playback is not None:
+            self._playback.clear()
         if self._robot.media.backend == MediaBackend.GSTREAMER:
             # Directly flush gstreamer audio pipe
             self._robot.media.audio.clear_player()
@@ -450,14 +530,20 @@ class LocalStream:
         input_sample_rate = self._robot.media.get_input_audio_samplerate()
         logger.debug(f"Audio recording started at {input_sample_rate} Hz")
 
-        while not self._stop_event.is_set():
-            audio_frame = self._robot.media.get_audio_sample()
-            if audio_frame is not None:
+        capture = MicCapture(self._robot.media.get_audio_sample, asyncio.get_running_loop())
+        capture.start()
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    audio_frame = await asyncio.wait_for(capture.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
                 await self.handler.receive((input_sample_rate, audio_frame))
-            await asyncio.sleep(0)  # avoid busy loop
+        finally:
+            capture.stop()
 
     async def play_loop(self) -> None:
-        """Fetch outputs from the handler: log text and play audio frames."""
+        """Fetch outputs from the handler: log text and stage audio frames for playout."""
         while not self._stop_event.is_set():
             handler_output = await self.handler.emit()
 
@@ -474,6 +560,9 @@ class LocalStream:
             elif isinstance(handler_output, tuple):
                 input_sample_rate, audio_data = handler_output
                 output_sample_rate = self._robot.media.get_output_audio_samplerate()
+                source_samples = int(max(audio_data.shape)) if audio_data.ndim == 2 else len(audio_data)
+                # Only response audio moves the playback cursor; filler clips were never enqueued on it
+                response_samples = source_samples if isinstance(handler_output, ResponseAudio) else 0
 
                 # Reshape if needed
                 if audio_data.ndim == 2:
@@ -494,9 +583,32 @@ class LocalStream:
                         int(len(audio_frame) * output_sample_rate / input_sample_rate),
                     )
 
-                self._robot.media.push_audio_sample(audio_frame)
+                if self._playback is not None:
+                    await self._playback.put(audio_frame, response_samples)
+                else:
+                    self._robot.media.push_audio_sample(audio_frame)
 
             else:
                 logger.debug("Ignoring output type=%s", type(handler_output).__name__)
 
             await asyncio.sleep(0)  # yield to event loop
+
+    async def playout_loop(self) -> None:
+        """Drain the jitter buffer into the player at the output sample rate."""
+        if self._playback is None:
+            return
+        playback = self._playback
+
+        def _push(audio_frame: NDArray[np.float32], response_samples: int) -> None:
+            self._robot.media.push_audio_sample(audio_frame)
+            if not response_samples:
+                return  # filler clip: neither the response's first audio nor on the cursor
+            self.handler.latency.mark(FIRST_AUDIO_PLAYED)
+            cursor = self.handler.playback_cursor
+            if cursor is not None:
+                cursor.advance(response_samples)
+
+        try:
+            await playback.run(_push, self._stop_event)
+        finally:
+            logger.info("Playback stats: %s", playback.describe())
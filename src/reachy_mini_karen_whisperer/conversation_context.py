@@ -0,0 +1,255 @@
+"""Local mirror of the server-side realtime conversation, bounded by a token budget.
+
+A single realtime session on a kiosk runs for hours. Every transcript, tool
+output (whole JSON blobs) and camera image stays in the server conversation, so
+later responses get slower and more expensive. This module tracks the items the
+server reports, with an estimated token size, and plans which ones to remove
+with ``conversation.item.delete``:
+
+1. Images older than ``image_ttl_s`` are always dropped: they only serve the
+   answer to the question that triggered the camera tool.
+2. Once the total exceeds ``token_budget``, remaining images go first, then the
+   oldest items, never touching the ``keep_recent`` newest ones.
+3. A function call and its output are removed together.
+
+Token sizes are estimates (characters for text, seconds for audio, a flat cost
+for images); they only need to be good enough to keep the session bounded.
+"""
+
+from __future__ import annotations
+import time
+import logging
+from typing import Any, Dict, List, Iterable, Optional
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4.0
+INPUT_AUDIO_TOKENS_PER_S = 10.0
+OUTPUT_AUDIO_TOKENS_PER_S = 20.0
+SPEECH_CHARS_PER_S = 15.0  # used when only a transcript is known
+IMAGE_TOKENS = 1000
+ITEM_OVERHEAD_TOKENS = 4
+
+DEFAULT_TOKEN_BUDGET = 16000
+DEFAULT_KEEP_RECENT = 8
+DEFAULT_IMAGE_TTL_S = 120.0
+
+
+def as_dict(obj: Any) -> Dict[str, Any]:
+    """Convert an SDK model (or plain dict) into a dict."""
+    if isinstance(obj, dict):
+        return obj
+    for attr in ("model_dump", "to_dict"):
+        fn = getattr(obj, attr, None)
+        if callable(fn):
+            try:
+                out = fn()
+                if isinstance(out, dict):
+                    return out
+            except Exception:
+                pass
+    return {}
+
+
+@dataclass
+class ContextItem:
+    """One server-side conversation item as seen locally."""
+
+    item_id: str
+    kind: str
+    role: Optional[str] = None
+    call_id: Optional[str] = None
+    text: str = ""
+    text_tokens: int = 0
+    audio_s: float = 0.0
+    has_audio: bool = False
+    has_image: bool = False
+    created_at: float = 0.0
+    deleting: bool = False
+
+    @property
+    def tokens(self) -> int:
+        """Estimated token cost of this item."""
+        rate = OUTPUT_AUDIO_TOKENS_PER_S if self.role == "assistant" else INPUT_AUDIO_TOKENS_PER_S
+        audio_s = self.audio_s
+        if self.has_audio and audio_s <= 0.0 and self.text:
+            audio_s = len(self.text) / SPEECH_CHARS_PER_S
+        return ITEM_OVERHEAD_TOKENS + self.text_tokens + int(audio_s * rate) + (IMAGE_TOKENS if self.has_image else 0)
+
+
+def _text_tokens(text: str) -> int:
+    return int(len(text) / CHARS_PER_TOKEN)
+
+
+class ConversationContext:
+    """Track conversation items and plan deletions to respect a token budget."""
+
+    def __init__(
+        self,
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+        image_ttl_s: float = DEFAULT_IMAGE_TTL_S,
+    ) -> None:
+        """Initialize an empty context."""
+        self.token_budget = int(token_budget)
+        self.keep_recent = max(0, int(keep_recent))
+        self.image_ttl_s = image_ttl_s
+        self._now = time.monotonic
+        self._items: Dict[str, ContextItem] = {}  # insertion order == conversation order
+        self.evicted_items = 0
+        self.evicted_tokens = 0
+
+    # ---- observation ----
+    def observe_item(self, raw_item: Any) -> None:
+        """Record or refresh an item from a ``conversation.item.*`` event."""
+        item = as_dict(raw_item)
+        item_id = item.get("id")
+        if not isinstance(item_id, str):
+            return
+        entry = self._items.get(item_id)
+        if entry is None:
+            entry = ContextItem(item_id=item_id, kind=str(item.get("type") or "message"), created_at=self._now())
+            self._items[item_id] = entry
+        entry.role = item.get("role") or entry.role
+        entry.call_id = item.get("call_id") or entry.call_id
+
+        texts: List[str] = []
+        if entry.kind == "function_call":
+            texts.append(f"{item.get('name') or ''}({item.get('arguments') or ''})")
+        elif entry.kind == "function_call_output":
+            texts.append(str(item.get("output") or ""))
+        for part in item.get("content") or []:
+            part = as_dict(part)
+            ptype = str(part.get("type") or "")
+            if ptype in ("input_image", "image"):
+                entry.has_image = True
+            elif ptype in ("input_audio", "output_audio", "audio"):
+                entry.has_audio = True
+                if part.get("transcript"):
+                    texts.append(str(part["transcript"]))
+            elif part.get("text"):
+                texts.append(str(part["text"]))
+        text = "\n".join(t for t in texts if t)
+        if text:
+            entry.text = text
+            entry.text_tokens = 0 if entry.has_audio else _text_tokens(text)
+
+    def set_transcript(self, item_id: str, transcript: str) -> None:
+        """Attach a completed transcript to an audio item."""
+        entry = self._items.get(item_id)
+        if entry is not None and transcript:
+            entry.text = transcript
+            entry.has_audio = True
+            entry.text_tokens = 0
+
+    def add_audio(self, item_id: str, seconds: float) -> None:
+        """Account for ``seconds`` of audio belonging to ``item_id``."""
+        entry = self._items.get(item_id)
+        if entry is None:
+            entry = ContextItem(item_id=item_id, kind="message", created_at=self._now())
+            self._items[item_id] = entry
+        entry.has_audio = True
+        entry.audio_s += seconds
+
+    def set_audio_length(self, item_id: str, seconds: float) -> None:
+        """Set the audio length of an item (e.g. after truncation)."""
+        entry = self._items.get(item_id)
+        if entry is not None:
+            entry.has_audio = True
+            entry.audio_s = max(0.0, seconds)
+
+    def forget(self, item_id: str) -> None:
+        """Drop an item that the server reports as deleted."""
+        self._items.pop(item_id, None)
+
+    def reset(self) -> None:
+        """Forget everything (new server-side conversation)."""
+        self._items.clear()
+
+    # ---- accounting ----
+    @property
+    def total_tokens(self) -> int:
+        """Estimated tokens of all live items."""
+        return sum(e.tokens for e in self._items.values() if not e.deleting)
+
+    def items(self) -> Iterable[ContextItem]:
+        """Live items in conversation order."""
+        return [e for e in self._items.values() if not e.deleting]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot for logs and status endpoints."""
+        live = list(self.items())
+        return {
+            "items": len(live),
+            "tokens": sum(e.tokens for e in live),
+            "budget": self.token_budget,
+            "images": sum(1 for e in live if e.has_image),
+            "evicted_items": self.evicted_items,
+            "evicted_tokens": self.evicted_tokens,
+        }
+
+    # ---- eviction ----
+    def _with_partners(self, entry: ContextItem) -> List[ContextItem]:
+        """Return ``entry`` plus the other half of its function call pair, if any."""
+        group = [entry]
+        if entry.call_id and entry.kind in ("function_call", "function_call_output"):
+            for other in self._items.values():
+                if other is not entry and other.call_id == entry.call_id and not other.deleting:
+                    group.append(other)
+        return group
+
+    def plan_evictions(self) -> List[str]:
+        """Choose items to delete and mark them as pending deletion."""
+        now = self._now()
+        live = list(self.items())
+        protected = {e.item_id for e in live[len(live) - self.keep_recent :]} if self.keep_recent else set()
+        total = sum(e.tokens for e in live)
+        chosen: List[ContextItem] = []
+
+        def _take(entry: ContextItem) -> None:
+            nonlocal total
+            group = [e for e in self._with_partners(entry) if not e.deleting]
+            if any(e.item_id in protected for e in group):
+                return
+            for e in group:
+                e.deleting = True
+                chosen.append(e)
+                total -= e.tokens
+
+        # Stale images are dropped regardless of budget
+        for e in live:
+            if e.has_image and now - e.created_at >= self.image_ttl_s:
+                _take(e)
+
+        if total > self.token_budget:
+            for e in live:
+                if total <= self.token_budget:
+                    break
+                if e.has_image:
+                    _take(e)
+            for e in live:
+                if total <= self.token_budget:
+                    break
+                _take(e)
+
+        if chosen:
+            freed = sum(e.tokens for e in chosen)
+            self.evicted_items += len(chosen)
+            self.evicted_tokens += freed
+            logger.info(
+                "Context over budget or stale: deleting %d items (~%d tokens), ~%d tokens remain",
+                len(chosen),
+                freed,
+                total,
+            )
+        return [e.item_id for e in chosen]
+
+    def restore(self, item_id: str) -> None:
+        """Undo a planned deletion that failed on the server."""
+        entry = self._items.get(item_id)
+        if entry is not None and entry.deleting:
+            entry.deleting = False
+            self.evicted_items -= 1
+            self.evicted_tokens -= entry.tokens
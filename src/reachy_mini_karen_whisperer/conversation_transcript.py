@@ -0,0 +1,122 @@
+"""Compact local transcript used to resume a conversation on a new realtime session.
+
+A new realtime session starts with an empty conversation. After a dropped
+websocket or a forced restart the customer would have to repeat themselves, so
+the handler keeps the recent turns as plain text (user transcripts, assistant
+transcripts and tool results not yet spoken about) and replays a bounded slice
+of them into the new session as ``conversation.item.create`` text items.
+"""
+
+from __future__ import annotations
+import json
+import time
+import logging
+from typing import Any, Dict, List
+from collections import deque
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+USER = "user"
+ASSISTANT = "assistant"
+TOOL = "tool"
+
+CHARS_PER_TOKEN = 4.0
+MAX_ENTRY_CHARS = 600
+DEFAULT_CAPACITY = 40
+RESUME_NOTE = (
+    "The realtime connection was re-established. The messages that follow are a compact recap of the "
+    "conversation so far; continue it naturally without greeting the customer again."
+)
+
+
+@dataclass
+class TranscriptEntry:
+    """One recorded line of the conversation."""
+
+    role: str
+    text: str
+    at: float
+
+    @property
+    def tokens(self) -> int:
+        """Estimated token cost when replayed."""
+        return int(len(self.text) / CHARS_PER_TOKEN) + 4
+
+
+def _clip(text: str, limit: int = MAX_ENTRY_CHARS) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+class ConversationTranscript:
+    """Ring buffer of recent turns that can be rendered as seed items."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize an empty transcript."""
+        self._now = time.monotonic
+        self._entries: deque[TranscriptEntry] = deque(maxlen=max(1, capacity))
+
+    def __len__(self) -> int:
+        """Return the number of recorded entries."""
+        return len(self._entries)
+
+    def add_user(self, text: str) -> None:
+        """Record a completed user transcript."""
+        if text and text.strip():
+            self._entries.append(TranscriptEntry(USER, _clip(text), self._now()))
+
+    def add_assistant(self, text: str) -> None:
+        """Record a completed assistant transcript."""
+        if text and text.strip():
+            self._entries.append(TranscriptEntry(ASSISTANT, _clip(text), self._now()))
+
+    def add_tool_result(self, tool_name: str, result: Dict[str, Any]) -> None:
+        """Record a tool result, leaving out bulky binary payloads such as camera frames."""
+        compact = {k: v for k, v in result.items() if not k.startswith("b64_")}
+        text = f"Result of tool {tool_name}: {json.dumps(compact, default=str)}"
+        self._entries.append(TranscriptEntry(TOOL, _clip(text), self._now()))
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        self._entries.clear()
+
+    def select(self, token_budget: int, max_age_s: float) -> List[TranscriptEntry]:
+        """Return the newest entries that fit ``token_budget``, oldest first.
+
+        Entries older than ``max_age_s`` are skipped, and tool results are only
+        kept when the assistant has not spoken since (i.e. they are outstanding).
+        """
+        now = self._now()
+        entries = [e for e in self._entries if now - e.at <= max_age_s]
+        last_assistant = max((i for i, e in enumerate(entries) if e.role == ASSISTANT), default=-1)
+        picked: List[TranscriptEntry] = []
+        used = 0
+        for i in range(len(entries) - 1, -1, -1):
+            entry = entries[i]
+            if entry.role == TOOL and i < last_assistant:
+                continue
+            if used + entry.tokens > token_budget:
+                break
+            picked.append(entry)
+            used += entry.tokens
+        picked.reverse()
+        return picked
+
+
+def seed_item(entry: TranscriptEntry) -> Dict[str, Any]:
+    """Render a transcript entry as a ``conversation.item.create`` payload."""
+    if entry.role == ASSISTANT:
+        return {
+            "type": "message",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": entry.text}],
+        }
+    role = "user" if entry.role == USER else "system"
+    return {"type": "message", "role": role, "content": [{"type": "input_text", "text": entry.text}]}
+
+
+def resume_note_item() -> Dict[str, Any]:
+    """Return the system item that introduces a replayed recap."""
+    return {"type": "message", "role": "system", "content": [{"type": "input_text", "text": RESUME_NOTE}]}
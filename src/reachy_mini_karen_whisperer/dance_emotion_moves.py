@@ -1,12 +1,18 @@
 """Dance and emotion moves for the movement queue system.
 
 This module implements dance moves and emotions as Move objects that can be queued
-and executed sequentially by the MovementManager.
+and executed sequentially by the MovementManager. Library moves play back from
+their precompiled trajectories (see ``trajectory_cache``) and fall back to live
+evaluation when a move could not be compiled. Gestures made of several poses
+are one ``KeyframeMove`` rather than a chain of goto moves.
 """
 
 from __future__ import annotations
+import math
+import bisect
 import logging
-from typing import Tuple
+from typing import Any, List, Tuple, Sequence
+from dataclasses import dataclass
 
 import numpy as np
 from numpy.typing import NDArray
@@ -14,6 +20,9 @@ from numpy.typing import NDArray
 from reachy_mini.motion.move import Move
 from reachy_mini.motion.recorded_move import RecordedMoves
 from reachy_mini_dances_library.dance_move import DanceMove
+from reachy_mini_karen_whisperer.pose import Pose
+from reachy_mini_karen_whisperer.moves import NEUTRAL_HEAD_POSE
+from reachy_mini_karen_whisperer.trajectory_cache import dance_trajectories, emotion_trajectories
 
 
 logger = logging.getLogger(__name__)
@@ -24,17 +33,34 @@ class DanceQueueMove(Move):  # type: ignore
 
     def __init__(self, move_name: str):
         """Initialize a DanceQueueMove."""
-        self.dance_move = DanceMove(move_name)
+        library = dance_trajectories()
+        self.trajectory = library.get(move_name) if library is not None else None
+        # Live fallback, only built when the move has no compiled trajectory
+        self.dance_move: Any = DanceMove(move_name) if self.trajectory is None else None
         self.move_name = move_name
+        self.coalesce_key = ("dance", move_name)  # back-to-back repeats share one queue entry
+        self._pose = Pose()
+        self._head = np.eye(4)
+        self._antennas = np.zeros(2)
 
     @property
     def duration(self) -> float:
         """Duration property required by official Move interface."""
+        if self.trajectory is not None:
+            return self.trajectory.duration
         return float(self.dance_move.duration)
 
     def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
-        """Evaluate dance move at time t."""
+        """Evaluate dance move at time t.
+
+        Compiled moves write into arrays reused by the next call; callers copy what they keep.
+        """
         try:
+            if self.trajectory is not None:
+                self.trajectory.evaluate_pose(t, self._pose)
+                self._antennas[0], self._antennas[1] = self._pose.antennas
+                return (self._pose.to_matrix(self._head), self._antennas, self._pose.body_yaw)
+
             # Get the pose from the dance move
             head_pose, antennas, body_yaw = self.dance_move.evaluate(t)
 
@@ -52,23 +78,52 @@ class DanceQueueMove(Move):  # type: ignore
             neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
             return (neutral_head_pose, np.array([0.0, 0.0], dtype=np.float64), 0.0)
 
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time t into ``out`` (fast path used by MovementManager)."""
+        if self.trajectory is not None:
+            self.trajectory.evaluate_pose(t, out)
+            return
+        head_pose, antennas, body_yaw = self.evaluate(t)
+        out.set_matrix(
+            NEUTRAL_HEAD_POSE if head_pose is None else head_pose,
+            (0.0, 0.0) if antennas is None else antennas,
+            0.0 if body_yaw is None else body_yaw,
+        )
+
 
 class EmotionQueueMove(Move):  # type: ignore
     """Wrapper for emotion moves to work with the movement queue system."""
 
     def __init__(self, emotion_name: str, recorded_moves: RecordedMoves):
         """Initialize an EmotionQueueMove."""
-        self.emotion_move = recorded_moves.get(emotion_name)
+        library = emotion_trajectories(recorded_moves)
+        self.trajectory = library.get(emotion_name) if library is not None else None
+        # Live fallback, only built when the move has no compiled trajectory
+        self.emotion_move: Any = recorded_moves.get(emotion_name) if self.trajectory is None else None
         self.emotion_name = emotion_name
+        self.coalesce_key = ("emotion", emotion_name)  # back-to-back repeats share one queue entry
+        self._pose = Pose()
+        self._head = np.eye(4)
+        self._antennas = np.zeros(2)
 
     @property
     def duration(self) -> float:
         """Duration property required by official Move interface."""
+        if self.trajectory is not None:
+            return self.trajectory.duration
         return float(self.emotion_move.duration)
 
     def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
-        """Evaluate emotion move at time t."""
+        """Evaluate emotion move at time t.
+
+        Compiled moves write into arrays reused by the next call; callers copy what they keep.
+        """
         try:
+            if self.trajectory is not None:
+                self.trajectory.evaluate_pose(t, self._pose)
+                self._antennas[0], self._antennas[1] = self._pose.antennas
+                return (self._pose.to_matrix(self._head), self._antennas, self._pose.body_yaw)
+
             # Get the pose from the emotion move
             head_pose, antennas, body_yaw = self.emotion_move.evaluate(t)
 
@@ -86,6 +141,18 @@ class EmotionQueueMove(Move):  # type: ignore
             neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
             return (neutral_head_pose, np.array([0.0, 0.0], dtype=np.float64), 0.0)
 
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time t into ``out`` (fast path used by MovementManager)."""
+        if self.trajectory is not None:
+            self.trajectory.evaluate_pose(t, out)
+            return
+        head_pose, antennas, body_yaw = self.evaluate(t)
+        out.set_matrix(
+            NEUTRAL_HEAD_POSE if head_pose is None else head_pose,
+            (0.0, 0.0) if antennas is None else antennas,
+            0.0 if body_yaw is None else body_yaw,
+        )
+
 
 class GotoQueueMove(Move):  # type: ignore
     """Wrapper for goto moves to work with the movement queue system."""
@@ -109,42 +176,33 @@ class GotoQueueMove(Move):  # type: ignore
         self.target_body_yaw = target_body_yaw
         self.start_body_yaw = start_body_yaw or 0
 
+        # Both ends are converted to poses once; evaluation writes into reused buffers
+        start_head = start_head_pose if start_head_pose is not None else NEUTRAL_HEAD_POSE
+        self._start = Pose.from_matrix(start_head, self.start_antennas, self.start_body_yaw)
+        self._target = Pose.from_matrix(target_head_pose, target_antennas, target_body_yaw)
+        self._pose = Pose()
+        self._head = np.eye(4)
+        self._antennas = np.zeros(2)
+
     @property
     def duration(self) -> float:
         """Duration property required by official Move interface."""
         return self._duration
 
-    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
-        """Evaluate goto move at time t using linear interpolation."""
-        try:
-            from reachy_mini.utils import create_head_pose
-            from reachy_mini.utils.interpolation import linear_pose_interpolation
-
-            # Clamp t to [0, 1] for interpolation
-            t_clamped = max(0, min(1, t / self.duration))
-
-            # Use start pose if available, otherwise neutral
-            if self.start_head_pose is not None:
-                start_pose = self.start_head_pose
-            else:
-                start_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-
-            # Interpolate head pose
-            head_pose = linear_pose_interpolation(start_pose, self.target_head_pose, t_clamped)
-
-            # Interpolate antennas - return as numpy array
-            antennas = np.array(
-                [
-                    self.start_antennas[0] + (self.target_antennas[0] - self.start_antennas[0]) * t_clamped,
-                    self.start_antennas[1] + (self.target_antennas[1] - self.start_antennas[1]) * t_clamped,
-                ],
-                dtype=np.float64,
-            )
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time t into ``out`` (fast path used by MovementManager)."""
+        # Clamp t to [0, 1]; head rotation is slerped, everything else interpolated linearly
+        out.set_interpolated(self._start, self._target, max(0, min(1, t / self.duration)))
 
-            # Interpolate body yaw
-            body_yaw = self.start_body_yaw + (self.target_body_yaw - self.start_body_yaw) * t_clamped
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Evaluate goto move at time t using linear interpolation.
 
-            return (head_pose, antennas, body_yaw)
+        The returned arrays are reused by the next call; callers copy what they keep.
+        """
+        try:
+            self.evaluate_pose(t, self._pose)
+            self._antennas[0], self._antennas[1] = self._pose.antennas
+            return (self._pose.to_matrix(self._head), self._antennas, self._pose.body_yaw)
 
         except Exception as e:
             logger.error(f"Error evaluating goto move at t={t}: {e}")
@@ -152,3 +210,134 @@ class GotoQueueMove(Move):  # type: ignore
             target_head_pose_f64 = self.target_head_pose.astype(np.float64)
             target_antennas_array = np.array([self.target_antennas[0], self.target_antennas[1]], dtype=np.float64)
             return (target_head_pose_f64, target_antennas_array, self.target_body_yaw)
+
+
+@dataclass(frozen=True)
+class Keyframe:
+    """A timed waypoint of a ``KeyframeMove``; ``time`` is in seconds from the start of the move."""
+
+    time: float
+    head_pose: NDArray[np.float64]
+    antennas: Tuple[float, float] = (0.0, 0.0)
+    body_yaw: float = 0.0
+
+
+def _pchip_slopes(times: NDArray[np.float64], values: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Fritsch-Carlson slopes of a monotone cubic through ``values`` (one column per channel).
+
+    Slopes are zero at both ends (the move starts and ends at rest) and at every
+    local extremum, so holds stay flat and the curve never overshoots a keyframe.
+    """
+    h = np.diff(times)[:, None]
+    delta = np.diff(values, axis=0) / h
+    slopes = np.zeros_like(values)
+    if len(delta) > 1:
+        d0, d1 = delta[:-1], delta[1:]
+        w0 = 2.0 * h[1:] + h[:-1]
+        w1 = h[1:] + 2.0 * h[:-1]
+        same_sign = d0 * d1 > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            harmonic = (w0 + w1) / (w0 / d0 + w1 / d1)
+        slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+    return slopes
+
+
+def _nearest_rotation_vector(rotvec: NDArray[np.float64], previous: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Return the rotation vector equivalent to ``rotvec`` (same rotation) closest to ``previous``."""
+    angle = float(np.linalg.norm(rotvec))
+    if angle < 1e-9:
+        return rotvec
+    axis = rotvec / angle
+    candidates = [rotvec + axis * (2.0 * math.pi * n) for n in (-1, 0, 1)]
+    return min(candidates, key=lambda r: float(np.linalg.norm(r - previous)))
+
+
+class KeyframeMove(Move):  # type: ignore
+    """Smooth move through timed keyframes, evaluated from a precomputed cubic spline.
+
+    Each keyframe becomes a 9-value row (head rotation vector, head translation,
+    antennas, body yaw) and every channel gets a monotone cubic Hermite spline,
+    so velocity is continuous across keyframes, the move starts and ends at rest,
+    and two equal consecutive keyframes make an exact hold. Per-segment
+    polynomial coefficients are computed once; a tick bisects the keyframe
+    times and evaluates one cubic, or copies a pose when the segment is constant.
+
+    Head rotations are splined as rotation vectors, unwrapped so consecutive
+    keyframes take the short way; rotations between keyframes are smooth but not
+    geodesic, which only shows for keyframes far apart on different axes.
+    """
+
+    def __init__(self, keyframes: Sequence[Keyframe]):
+        """Precompute the spline; keyframe times must be strictly increasing and start at or after 0."""
+        if not keyframes:
+            raise ValueError("KeyframeMove needs at least one keyframe")
+        times = np.array([k.time for k in keyframes], dtype=np.float64)
+        if times[0] < 0 or np.any(np.diff(times) <= 0):
+            raise ValueError(f"Keyframe times must be >= 0 and strictly increasing, got {times.tolist()}")
+        self.keyframes = list(keyframes)
+        self._duration = float(times[-1])
+
+        poses = [Pose.from_matrix(k.head_pose, k.antennas, k.body_yaw) for k in keyframes]
+        values = np.array([(*p.as_rotation_vector(), *p.data[4:].tolist()) for p in poses])
+        for i in range(1, len(values)):
+            values[i, :3] = _nearest_rotation_vector(values[i, :3], values[i - 1, :3])
+
+        # Segment k covers [times[k], times[k + 1]]: value = ((d * s + c) * s + b) * s + a with s = t - times[k]
+        self._times: List[float] = times.tolist()
+        self._segments: List[Tuple[NDArray[np.float64], ...] | Pose] = []
+        if len(times) > 1:
+            slopes = _pchip_slopes(times, values)
+            h = np.diff(times)[:, None]
+            delta = np.diff(values, axis=0) / h
+            c = (3.0 * delta - 2.0 * slopes[:-1] - slopes[1:]) / h
+            d = (slopes[:-1] + slopes[1:] - 2.0 * delta) / (h * h)
+            for k in range(len(h)):
+                if not (slopes[k].any() or c[k].any() or d[k].any()):
+                    self._segments.append(poses[k])  # constant segment: no spline to evaluate
+                else:
+                    self._segments.append((values[k].copy(), slopes[k].copy(), c[k].copy(), d[k].copy()))
+        self._first = poses[0]
+        self._last = poses[-1]
+        self._row = np.zeros(9)
+        self._pose = Pose()
+        self._head = np.eye(4)
+        self._antennas = np.zeros(2)
+
+    @property
+    def duration(self) -> float:
+        """Duration property required by official Move interface."""
+        return self._duration
+
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time t into ``out`` (fast path used by MovementManager)."""
+        times = self._times
+        if t <= times[0]:
+            out.set_from(self._first)
+            return
+        if t >= times[-1]:
+            out.set_from(self._last)
+            return
+        k = bisect.bisect_right(times, t) - 1
+        segment = self._segments[k]
+        if isinstance(segment, Pose):
+            out.set_from(segment)
+            return
+        a, b, c, d = segment
+        s = t - times[k]
+        row = self._row
+        np.multiply(d, s, out=row)
+        row += c
+        row *= s
+        row += b
+        row *= s
+        row += a
+        out.set_rotation_vector(*row.tolist())
+
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Evaluate the keyframe move at time t.
+
+        The returned arrays are reused by the next call; callers copy what they keep.
+        """
+        self.evaluate_pose(t, self._pose)
+        self._antennas[0], self._antennas[1] = self._pose.antennas
+        return (self._pose.to_matrix(self._head), self._antennas, self._pose.body_yaw)
@@ -0,0 +1,206 @@
+"""Flight recorder of the movement control loop, dumped on demand.
+
+When the robot jerks or freezes there is nothing left to look at afterwards.
+``FlightRecorder`` keeps the last ``capacity`` ticks in a NumPy structured
+array used as a ring: per tick the wake time, lateness past the deadline, the
+primary move playing, the primary pose, the fused secondary offsets, the
+command pose, the antennas actually commanded and whether ``set_target`` was
+called. Poses are the compact ``Pose`` layout (quaternion, translation,
+antennas, body yaw) in float32.
+
+``record`` writes into preallocated per-field views of the ring, so a tick
+costs a few element assignments and allocates no arrays. ``snapshot`` copies
+the ring without stopping the loop and drops the rows written during the
+copy. ``dump`` saves the last ``seconds`` as a compressed ``.npz`` with the
+ticks, the names of the moves they refer to and the loop period.
+``install_dump_signal`` dumps on ``SIGUSR1``.
+"""
+
+from __future__ import annotations
+import time
+import signal
+import logging
+import threading
+from typing import Any, Dict, Tuple, Callable, Optional
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+from reachy_mini_karen_whisperer.pose import POSE_SIZE, Pose
+
+
+logger = logging.getLogger(__name__)
+
+FLIGHT_DTYPE = np.dtype(
+    [
+        ("t", np.float64),  # tick wake time, monotonic seconds
+        ("lateness_us", np.float32),  # wake time minus deadline
+        ("move_id", np.int32),  # key into the dump's move names; 0 when no primary move plays
+        ("sent", np.bool_),  # set_target was called (False inside the dead-band or on error)
+        ("primary", np.float32, (POSE_SIZE,)),
+        ("secondary", np.float32, (POSE_SIZE,)),
+        ("command", np.float32, (POSE_SIZE,)),
+        ("antennas", np.float32, (2,)),  # after the listening freeze/blend
+    ]
+)
+MAX_MOVE_NAMES = 4096
+
+
+def _move_name(move: Any) -> str:
+    """Return a readable name for a move: its type, plus the dance or emotion played."""
+    inner = getattr(move, "move", None)  # LoopedMove
+    label = getattr(move, "move_name", None) or getattr(move, "emotion_name", None)
+    if inner is not None:
+        return f"{type(move).__name__}({_move_name(inner)} x{getattr(move, 'repeats', '?')})"
+    return f"{type(move).__name__}:{label}" if label else type(move).__name__
+
+
+class FlightRecorder:
+    """Ring buffer of the last ``capacity`` control ticks."""
+
+    def __init__(self, capacity: int) -> None:
+        """Allocate the ring (about 150 bytes per tick)."""
+        self.capacity = max(1, capacity)
+        self._ring: NDArray[Any] = np.zeros(self.capacity, dtype=FLIGHT_DTYPE)
+        self._t = self._ring["t"]
+        self._lateness = self._ring["lateness_us"]
+        self._move_id = self._ring["move_id"]
+        self._sent = self._ring["sent"]
+        self._primary = self._ring["primary"]
+        self._secondary = self._ring["secondary"]
+        self._command = self._ring["command"]
+        self._antennas = self._ring["antennas"]
+        self._index = 0
+        self._count = 0  # ticks recorded so far; bumped after each row is complete
+        self._move: Any = None
+        self._current_id = 0
+        self._next_id = 1
+        self._move_names: Dict[int, str] = {}
+        self._dump_lock = threading.Lock()
+
+    def record(
+        self,
+        t: float,
+        lateness_s: float,
+        move: Any,
+        primary: Pose,
+        secondary: Pose,
+        command: Pose,
+        antennas: Tuple[float, float],
+        sent: bool,
+    ) -> None:
+        """Record one tick (control loop thread only)."""
+        if move is not self._move:
+            self._move = move
+            if move is None:
+                self._current_id = 0
+            else:
+                self._current_id = self._next_id
+                self._next_id += 1
+                self._move_names[self._current_id] = _move_name(move)
+                if len(self._move_names) > MAX_MOVE_NAMES:
+                    del self._move_names[next(iter(self._move_names))]
+        i = self._index
+        self._t[i] = t
+        self._lateness[i] = lateness_s * 1e6
+        self._move_id[i] = self._current_id
+        self._sent[i] = sent
+        self._primary[i] = primary.data
+        self._secondary[i] = secondary.data
+        self._command[i] = command.data
+        self._antennas[i] = antennas
+        self._index = i + 1 if i + 1 < self.capacity else 0
+        self._count += 1
+
+    def snapshot(self, seconds: Optional[float] = None) -> Tuple[NDArray[Any], Dict[int, str]]:
+        """Return the recorded ticks, oldest first, and the names of the moves they refer to.
+
+        Safe to call from any thread while the loop keeps recording.
+        """
+        start = self._count
+        ring = self._ring.copy()
+        names = dict(self._move_names)
+        end = self._count
+        if end <= self.capacity:
+            ticks = ring[:end]
+        else:
+            split = end % self.capacity
+            ticks = np.concatenate((ring[split:], ring[:split]))
+            # The slot being written when the copy ended holds the oldest row: it may be torn
+            ticks = ticks[1:]
+        # Rows written during the copy may be torn, or hold the old tick they replaced
+        if end > start:
+            ticks = ticks[: len(ticks) - (end - start)]
+        if seconds is not None and len(ticks):
+            ticks = ticks[ticks["t"] >= ticks["t"][-1] - seconds]
+        used = set(np.unique(ticks["move_id"]).tolist())
+        return ticks, {move_id: name for move_id, name in names.items() if move_id in used}
+
+    def dump(self, directory: Path | str, seconds: Optional[float] = None, period_s: float = 0.01) -> Path:
+        """Write the last ``seconds`` (all recorded ticks by default) to a new ``.npz`` in ``directory``."""
+        ticks, names = self.snapshot(seconds)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._dump_lock:
+            path = directory / time.strftime("flight-%Y%m%d-%H%M%S.npz")
+            suffix = 1
+            while path.exists():
+                path = directory / time.strftime(f"flight-%Y%m%d-%H%M%S-{suffix}.npz")
+                suffix += 1
+            ids = sorted(names)
+            np.savez_compressed(
+                path,
+                ticks=ticks,
+                move_ids=np.array(ids, dtype=np.int32),
+                move_names=np.array([names[i] for i in ids], dtype=np.str_),
+                period_s=np.float64(period_s),
+            )
+        logger.info("Flight recorder: %d ticks written to %s", len(ticks), path)
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the ring size, how many ticks it holds and the time they span."""
+        held = min(self._count, self.capacity)
+        span = 0.0
+        if held > 1:
+            newest = self._t[self._index - 1]
+            oldest = self._t[self._index] if self._count > self.capacity else self._t[0]
+            span = float(newest - oldest)
+        return {"capacity": self.capacity, "ticks_held": held, "seconds_held": round(span, 1)}
+
+
+def load_flight(path: Path | str) -> Tuple[NDArray[Any], Dict[int, str]]:
+    """Read a dump back as (ticks, move names by id)."""
+    with np.load(path) as data:
+        names = dict(zip(data["move_ids"].tolist(), data["move_names"].tolist()))
+        return data["ticks"], names
+
+
+def flight_recorder_from_config(frequency_hz: float) -> Optional[FlightRecorder]:
+    """Build the recorder holding ``FLIGHT_RECORDER_S`` seconds of ticks, or None when it is 0."""
+    from reachy_mini_karen_whisperer.config import config
+
+    if config.FLIGHT_RECORDER_S <= 0:
+        return None
+    return FlightRecorder(int(config.FLIGHT_RECORDER_S * frequency_hz))
+
+
+def install_dump_signal(dump: Callable[[], Any], signum: int = getattr(signal, "SIGUSR1", 0)) -> bool:
+    """Call ``dump`` on ``signum`` (``SIGUSR1``); only possible from the main thread on POSIX."""
+    if not signum or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def _handler(_signum: int, _frame: Any) -> None:
+        # Dump off the signal handler so a slow disk cannot stall the main thread
+        threading.Thread(target=_safe_dump, args=(dump,), daemon=True).start()
+
+    signal.signal(signum, _handler)
+    return True
+
+
+def _safe_dump(dump: Callable[[], Any]) -> None:
+    try:
+        dump()
+    except Exception as e:
+        logger.error("Flight recorder dump failed: %s", e)
@@ -11,6 +11,7 @@ from pathlib import Path
 import gradio as gr
 
 from .config import LOCKED_PROFILE, config
+from .prompts import list_profiles
 
 
 class PersonalityUI:
@@ -39,22 +40,10 @@ class PersonalityUI:
 
     # ---------- Filesystem helpers ----------
     def _list_personalities(self) -> list[str]:
-        names: list[str] = []
         try:
-            if self._profiles_root.exists():
-                for p in sorted(self._profiles_root.iterdir()):
-                    if p.name == "user_personalities":
-                        continue
-                    if p.is_dir() and (p / "instructions.txt").exists():
-                        names.append(p.name)
-                user_dir = self._profiles_root / "user_personalities"
-                if user_dir.exists():
-                    for p in sorted(user_dir.iterdir()):
-                        if p.is_dir() and (p / "instructions.txt").exists():
-                            names.append(f"user_personalities/{p.name}")
+            return list_profiles()
         except Exception:
-            pass
-        return names
+            return []
 
     def _resolve_profile_dir(self, selection: str) -> Path:
         return self._profiles_root / selection
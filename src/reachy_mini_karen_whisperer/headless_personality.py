@@ -37,24 +37,13 @@ def _sanitize_name(name: str) -> str:
 
 
 def list_personalities() -> List[str]:
-    """List available personality profile names."""
-    names: List[str] = []
-    root = _profiles_root()
+    """List available personality profile names (cached until the profiles tree changes)."""
+    from .prompts import list_profiles
+
     try:
-        if root.exists():
-            for p in sorted(root.iterdir()):
-                if p.name == "user_personalities":
-                    continue
-                if p.is_dir() and (p / "instructions.txt").exists():
-                    names.append(p.name)
-        udir = root / "user_personalities"
-        if udir.exists():
-            for p in sorted(udir.iterdir()):
-                if p.is_dir() and (p / "instructions.txt").exists():
-                    names.append(f"user_personalities/{p.name}")
+        return list_profiles()
     except Exception:
-        pass
-    return names
+        return []
 
 
 def resolve_profile_dir(selection: str) -> Path:
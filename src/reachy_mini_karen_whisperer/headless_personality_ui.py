@@ -264,7 +264,12 @@ def mount_personality_routes(
                     persisted_choice = _startup_choice()
                 except Exception as e:
                     logger.warning("Failed to persist startup personality: %s", e)
-            return {"ok": True, "status": status, "startup": persisted_choice}
+            return {
+                "ok": True,
+                "status": status,
+                "startup": persisted_choice,
+                "switch": handler.last_personality_switch,
+            }
         except Exception as e:
             return JSONResponse({"ok": False, "error": str(e)}, status_code=500)  # type: ignore
 
@@ -0,0 +1,233 @@
+"""Local idle behaviour planner.
+
+When nobody talks to the robot, it should still look alive. Asking the realtime
+model to pick a dance or emotion every ~15 s costs a round trip and tokens all
+shift long, so idle actions are chosen locally instead:
+
+- Candidates are the dances from ``AVAILABLE_MOVES``, the recorded emotions and
+  a few gentle head glances.
+- Each category has a weight (split evenly across its actions) and a cooldown;
+  the last few actions are never repeated.
+- The random generator can be seeded so that a shift is reproducible.
+
+Chosen actions are queued directly on the ``MovementManager``.
+"""
+
+from __future__ import annotations
+import time
+import random
+import logging
+from typing import Any, Dict, List, Tuple, Iterable, Optional
+from collections import deque
+from dataclasses import dataclass
+
+from reachy_mini.utils import create_head_pose
+from reachy_mini.motion.move import Move
+from reachy_mini_karen_whisperer.move_queue import DROP_IF_BUSY
+
+
+logger = logging.getLogger(__name__)
+
+DANCE = "dance"
+EMOTION = "emotion"
+GLANCE = "glance"
+
+# Category -> (total weight, cooldown in seconds after any action of that category)
+DEFAULT_POLICY: Dict[str, Tuple[float, float]] = {
+    GLANCE: (0.5, 20.0),
+    EMOTION: (0.3, 60.0),
+    DANCE: (0.2, 120.0),
+}
+DEFAULT_NO_REPEAT = 3
+
+# Head glances: name -> (yaw, pitch) in radians
+GLANCES: Dict[str, Tuple[float, float]] = {
+    "glance_left": (0.5, 0.0),
+    "glance_right": (-0.5, 0.0),
+    "glance_up_left": (0.35, -0.15),
+    "glance_up_right": (-0.35, -0.15),
+    "glance_down": (0.0, 0.2),
+}
+GLANCE_TRANSITION_S = 1.2
+GLANCE_HOLD_S = 1.5
+
+
+@dataclass(frozen=True)
+class IdleAction:
+    """One candidate idle action."""
+
+    kind: str
+    name: str
+    weight: float
+
+
+class IdlePlanner:
+    """Seeded weighted choice with per-category cooldowns and no-repeat rules."""
+
+    def __init__(
+        self,
+        actions: Iterable[IdleAction],
+        cooldowns: Dict[str, float],
+        *,
+        no_repeat: int = DEFAULT_NO_REPEAT,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the planner."""
+        self.actions = [a for a in actions if a.weight > 0.0]
+        self.cooldowns = dict(cooldowns)
+        self._rng = random.Random(seed)
+        self._recent: deque[str] = deque(maxlen=max(0, no_repeat))
+        self._last_by_kind: Dict[str, float] = {}
+
+    def eligible(self, now: float) -> List[IdleAction]:
+        """Return the actions allowed at ``now``."""
+        out = []
+        for action in self.actions:
+            if action.name in self._recent:
+                continue
+            last = self._last_by_kind.get(action.kind)
+            if last is not None and now - last < self.cooldowns.get(action.kind, 0.0):
+                continue
+            out.append(action)
+        return out
+
+    def choose(self, now: float) -> Optional[IdleAction]:
+        """Pick an action and record it, or return None when everything is cooling down."""
+        candidates = self.eligible(now)
+        if not candidates:
+            return None
+        action = self._rng.choices(candidates, weights=[a.weight for a in candidates], k=1)[0]
+        if self._recent.maxlen:
+            self._recent.append(action.name)
+        self._last_by_kind[action.kind] = now
+        return action
+
+
+def _build_actions(
+    dances: Iterable[str],
+    emotions: Iterable[str],
+    policy: Dict[str, Tuple[float, float]],
+) -> List[IdleAction]:
+    """Spread each category weight evenly over its actions."""
+    by_kind = {DANCE: list(dances), EMOTION: list(emotions), GLANCE: list(GLANCES)}
+    actions: List[IdleAction] = []
+    for kind, names in by_kind.items():
+        total = policy.get(kind, (0.0, 0.0))[0]
+        if not names or total <= 0.0:
+            continue
+        actions.extend(IdleAction(kind, name, total / len(names)) for name in names)
+    return actions
+
+
+def _glance_moves(yaw: float, pitch: float) -> List[Move]:
+    """Look towards (yaw, pitch), hold, then come back to neutral."""
+    from reachy_mini_karen_whisperer.dance_emotion_moves import GotoQueueMove
+
+    neutral = create_head_pose(0, 0, 0, 0, 0, 0, degrees=False)
+    target = create_head_pose(0, 0, 0, 0, pitch, yaw, degrees=False)
+    return [
+        GotoQueueMove(target_head_pose=target, start_head_pose=neutral, duration=GLANCE_TRANSITION_S),
+        GotoQueueMove(target_head_pose=target, start_head_pose=target, duration=GLANCE_HOLD_S),
+        GotoQueueMove(target_head_pose=neutral, start_head_pose=target, duration=GLANCE_TRANSITION_S),
+    ]
+
+
+class IdleBehaviourEngine:
+    """Choose idle actions locally and queue them on the movement manager."""
+
+    def __init__(
+        self,
+        movement_manager: Any,
+        *,
+        seed: Optional[int] = None,
+        emotions: Optional[List[str]] = None,
+        policy: Optional[Dict[str, Tuple[float, float]]] = None,
+        no_repeat: int = DEFAULT_NO_REPEAT,
+    ) -> None:
+        """Initialize the engine from the dance and emotion libraries that are installed.
+
+        ``emotions`` restricts the recorded emotions used while idle (all when None).
+        """
+        from reachy_mini_karen_whisperer.tools.dance import DANCE_AVAILABLE
+        from reachy_mini_karen_whisperer.tools.play_emotion import RECORDED_MOVES, EMOTION_AVAILABLE
+
+        self.movement_manager = movement_manager
+        self._recorded_moves = RECORDED_MOVES
+
+        dances: List[str] = []
+        if DANCE_AVAILABLE:
+            from reachy_mini_dances_library.collection.dance import AVAILABLE_MOVES
+
+            dances = list(AVAILABLE_MOVES)
+        emotion_names: List[str] = []
+        if EMOTION_AVAILABLE:
+            try:
+                emotion_names = list(RECORDED_MOVES.list_moves())
+            except Exception as e:
+                logger.warning("Could not list recorded emotions for idle behaviour: %s", e)
+        if emotions:
+            emotion_names = [name for name in emotion_names if name in emotions]
+
+        policy = policy or DEFAULT_POLICY
+        self.planner = IdlePlanner(
+            _build_actions(dances, emotion_names, policy),
+            {kind: cooldown for kind, (_, cooldown) in policy.items()},
+            no_repeat=no_repeat,
+            seed=seed,
+        )
+        self.actions_played: Dict[str, int] = {DANCE: 0, EMOTION: 0, GLANCE: 0}
+        self.skipped = 0
+        self.cut_short = 0  # actions whose follow-up moves the queue refused
+        logger.info(
+            "Idle behaviour engine ready: %d dances, %d emotions, %d glances (seed=%s)",
+            len(dances),
+            len(emotion_names),
+            len(GLANCES),
+            seed,
+        )
+
+    def _moves_for(self, action: IdleAction) -> List[Move]:
+        if action.kind == DANCE:
+            from reachy_mini_karen_whisperer.dance_emotion_moves import DanceQueueMove
+
+            return [DanceQueueMove(action.name)]
+        if action.kind == EMOTION:
+            from reachy_mini_karen_whisperer.dance_emotion_moves import EmotionQueueMove
+
+            return [EmotionQueueMove(action.name, self._recorded_moves)]
+        yaw, pitch = GLANCES[action.name]
+        return _glance_moves(yaw, pitch)
+
+    def step(self) -> Optional[IdleAction]:
+        """Queue one idle action, if any is allowed right now."""
+        action = self.planner.choose(time.monotonic())
+        if action is None:
+            self.skipped += 1
+            return None
+        try:
+            moves = self._moves_for(action)
+        except Exception as e:
+            logger.warning("Idle action %s/%s failed: %s", action.kind, action.name, e)
+            return None
+        # Idle actions never queue behind (or delay) a move the conversation asked for
+        if not self.movement_manager.queue_move(moves[0], DROP_IF_BUSY).accepted:
+            self.skipped += 1
+            return None
+        for move in moves[1:]:
+            result = self.movement_manager.queue_move(move)
+            if not result.accepted:
+                self.cut_short += 1
+                logger.info("Idle action %s %s cut short: %s", action.kind, action.name, result.status)
+                break
+        self.actions_played[action.kind] += 1
+        logger.info("Idle action: %s %s", action.kind, action.name)
+        return action
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for status endpoints."""
+        return {
+            "actions": dict(self.actions_played),
+            "skipped": self.skipped,
+            "cut_short": self.cut_short,
+            "candidates": len(self.planner.actions),
+        }
@@ -0,0 +1,127 @@
+"""Per-stage timing of the movement control loop.
+
+``LoopFrequencyStats.potential_freq`` says a tick got slower, not where the
+time went. ``StageProfiler`` splits each tick into named stages: the loop calls
+``begin()`` once, ``lap(stage)`` after each stage and ``end(move)`` at the end
+of the tick. Laps are ``perf_counter_ns`` deltas written into a preallocated
+ring of the last ``capacity`` ticks, so recording costs a few hundred
+nanoseconds per tick and allocates nothing once every move type has been seen.
+
+``summary()`` turns the ring into per-stage percentiles and also reports,
+per move type, what its ``evaluate`` stage has cost since the last reset; the
+type with the highest mean is the worst offender.
+"""
+
+from __future__ import annotations
+import time
+import threading
+from array import array
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+
+# Stages of MovementManager._run_tick, in order
+LOOP_STAGES = ("poll_signals", "primary_motion", "offsets", "evaluate", "compose", "set_target", "record")
+POLL_SIGNALS, PRIMARY_MOTION, OFFSETS, EVALUATE, COMPOSE, SET_TARGET, RECORD = range(len(LOOP_STAGES))
+DEFAULT_CAPACITY = 1024  # ticks kept, ~10 s at 100 Hz
+
+
+class StageProfiler:
+    """Ring buffer of per-stage tick durations with percentile summaries."""
+
+    def __init__(self, stages: Sequence[str] = LOOP_STAGES, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Allocate room for ``capacity`` ticks of ``stages``."""
+        self.stages = tuple(stages)
+        self.capacity = capacity
+        self._width = len(self.stages)
+        self._laps = array("q", bytes(8 * capacity * self._width))
+        self._totals = array("q", bytes(8 * capacity))
+        self._row = 0  # first lap slot of the current tick
+        self._tick = 0  # ring index of the current tick
+        self._filled = 0
+        self._tick_start = 0
+        self._last = 0
+        self._evaluate = self.stages.index("evaluate") if "evaluate" in self.stages else -1
+        # Move type -> [ticks, total ns, max ns] of its evaluate stage
+        self._moves: Dict[str, List[int]] = {}
+        self._move: Any = None  # last move seen by end() and its entry in _moves
+        self._move_stats: List[int] = []
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        """Mark the start of a tick."""
+        self._tick_start = self._last = time.perf_counter_ns()
+
+    def lap(self, stage: int) -> None:
+        """Charge the time since the previous mark to ``stage`` (an index into ``stages``)."""
+        now = time.perf_counter_ns()
+        self._laps[self._row + stage] = now - self._last
+        self._last = now
+
+    def end(self, move: Any = None) -> None:
+        """Close the tick; its evaluate time is charged to ``move``'s type (the wrapped move's for a ``LoopedMove``)."""
+        with self._lock:
+            self._totals[self._tick] = self._last - self._tick_start
+            if move is not None and self._evaluate >= 0:
+                elapsed = self._laps[self._row + self._evaluate]
+                if move is not self._move:
+                    self._move = move
+                    # Key repeated moves (LoopedMove) on the move they play
+                    self._move_stats = self._moves.setdefault(type(getattr(move, "move", move)).__name__, [0, 0, 0])
+                stats = self._move_stats
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+            self._tick = (self._tick + 1) % self.capacity
+            self._row = self._tick * self._width
+            if self._filled < self.capacity:
+                self._filled += 1
+
+    def reset(self) -> None:
+        """Forget all recorded ticks and move statistics."""
+        with self._lock:
+            self._tick = self._row = self._filled = 0
+            self._moves.clear()
+            self._move = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Return p50/p99/max (us) and mean share of the tick per stage, plus per-move-type evaluate cost."""
+        with self._lock:
+            n = self._filled
+            laps = np.frombuffer(self._laps, dtype=np.int64).reshape(self.capacity, self._width)[:n].copy()
+            totals = np.frombuffer(self._totals, dtype=np.int64)[:n].copy()
+            moves = {name: list(stats) for name, stats in self._moves.items()}
+        if n == 0:
+            return {"ticks": 0, "stages": {}, "tick_us": None, "moves": {}, "worst_move": None}
+
+        total_mean = float(totals.mean()) or 1.0
+        stages: Dict[str, Any] = {}
+        for i, name in enumerate(self.stages):
+            column = laps[:, i] / 1000.0
+            p50, p99 = np.percentile(column, [50, 99])
+            stages[name] = {
+                "p50_us": round(float(p50), 2),
+                "p99_us": round(float(p99), 2),
+                "max_us": round(float(column.max()), 2),
+                "share": round(float(laps[:, i].mean()) / total_mean, 3),
+            }
+        tick_p50, tick_p99 = np.percentile(totals / 1000.0, [50, 99])
+        move_stats = {
+            name: {"ticks": count, "mean_us": round(total / count / 1000.0, 2), "max_us": round(worst / 1000.0, 2)}
+            for name, (count, total, worst) in moves.items()
+            if count
+        }
+        worst = max(move_stats, key=lambda name: move_stats[name]["mean_us"], default=None)
+        return {
+            "ticks": n,
+            "tick_us": {
+                "p50": round(float(tick_p50), 2),
+                "p99": round(float(tick_p99), 2),
+                "max": round(float(totals.max()) / 1000.0, 2),
+            },
+            "stages": stages,
+            "moves": move_stats,
+            "worst_move": worst,
+        }
@@ -0,0 +1,216 @@
+"""Event-loop lag monitor that captures the stack of whatever blocks the loop.
+
+The loop that carries realtime audio also runs tool calls and UI callbacks, and
+some of them are synchronous (JSON file I/O, ``cv2.imencode``, ``cv2.cvtColor``).
+Every stall delays mic frames and playback, but nothing measured it.
+
+Two parts work together:
+
+- A heartbeat task on the loop sleeps ``interval_s`` and records how late it
+  woke up into a histogram.
+- A helper thread watches the heartbeat. When it has not beaten for longer
+  than the threshold, the loop is blocked *right now*, so the helper grabs the
+  loop thread's stack with ``sys._current_frames()`` and logs the offending
+  call site, at most once per ``log_interval_s`` per site.
+"""
+
+from __future__ import annotations
+import sys
+import time
+import asyncio
+import logging
+import weakref
+import threading
+import traceback
+from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the lag histogram buckets; the last bucket is open-ended
+LAG_BUCKETS_MS: List[float] = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+DEFAULT_INTERVAL_S = 0.05
+DEFAULT_LOG_INTERVAL_S = 30.0
+MAX_SITES = 50
+STACK_DEPTH = 8
+
+
+@dataclass
+class BlockingSite:
+    """A call site seen on the loop thread during a stall."""
+
+    site: str
+    stack: str
+    count: int = 0
+    worst_ms: float = 0.0
+    last_logged: float = 0.0
+    suppressed: int = 0
+
+
+def _site_of(stack: traceback.StackSummary) -> str:
+    """Name a stall after its innermost frame (the Python caller of any C call)."""
+    if not stack:
+        return "<unknown>"
+    frame = stack[-1]
+    return f"{frame.filename}:{frame.lineno} in {frame.name}"
+
+
+class LoopLagMonitor:
+    """Heartbeat on one event loop plus a helper thread that samples it when stalled."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        threshold_ms: float,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        log_interval_s: float = DEFAULT_LOG_INTERVAL_S,
+    ) -> None:
+        """Prepare a monitor for ``loop``; call ``start()`` from the loop thread."""
+        self.loop = loop
+        self.threshold_ms = threshold_ms
+        self.interval_s = interval_s
+        self.log_interval_s = log_interval_s
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+
+        self._last_beat = time.monotonic()
+        self._beat = 0
+        self._captured_beat = -1
+        self._pending_site: Optional[BlockingSite] = None  # captured, waiting for the stall to end
+
+        self.histogram: List[int] = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.samples = 0
+        self.max_lag_ms = 0.0
+        self.stalls = 0
+        self._sites: Dict[str, BlockingSite] = {}
+
+    # ---- lifecycle ----
+    def start(self) -> None:
+        """Start the heartbeat task and the helper thread (call from the loop thread)."""
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self.loop.create_task(self._heartbeat(), name="loop-lag-heartbeat")
+        self._thread = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._thread.start()
+        logger.info("Event loop lag monitor started (threshold %.0f ms)", self.threshold_ms)
+
+    def stop(self) -> None:
+        """Stop the helper thread and the heartbeat task."""
+        self._stop.set()
+        if _MONITORS.get(self.loop) is self:
+            del _MONITORS[self.loop]
+        if self._task is not None and not self._task.done():
+            self.loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+
+    # ---- loop side ----
+    async def _heartbeat(self) -> None:
+        while not self._stop.is_set():
+            expected = time.monotonic() + self.interval_s
+            await asyncio.sleep(self.interval_s)
+            now = time.monotonic()
+            self._record((now - expected) * 1000.0)
+            with self._lock:
+                self._last_beat = now
+                self._beat += 1
+
+    def _record(self, lag_ms: float) -> None:
+        lag_ms = max(0.0, lag_ms)
+        idx = len(LAG_BUCKETS_MS)
+        for i, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                idx = i
+                break
+        with self._lock:
+            self.histogram[idx] += 1
+            self.samples += 1
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            # The stall is over: charge its full length to the site captured during it
+            if self._pending_site is not None:
+                self._pending_site.worst_ms = max(self._pending_site.worst_ms, lag_ms)
+                self._pending_site = None
+
+    # ---- helper thread ----
+    def _watch(self) -> None:
+        period = max(0.005, self.threshold_ms / 2000.0)
+        while not self._stop.wait(period):
+            with self._lock:
+                stalled_ms = (time.monotonic() - self._last_beat - self.interval_s) * 1000.0
+                beat = self._beat
+                already = self._captured_beat == beat
+            if stalled_ms < self.threshold_ms or already:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            del frame
+            with self._lock:
+                self._captured_beat = beat
+                self.stalls += 1
+            self._report(stack, stalled_ms)
+
+    def _report(self, stack: traceback.StackSummary, stalled_ms: float) -> None:
+        site_name = _site_of(stack)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(site_name)
+            if site is None:
+                if len(self._sites) >= MAX_SITES:
+                    self._sites.pop(min(self._sites, key=lambda k: self._sites[k].count))
+                site = BlockingSite(site_name, "".join(traceback.format_list(stack[-STACK_DEPTH:])))
+                self._sites[site_name] = site
+            site.count += 1
+            site.worst_ms = max(site.worst_ms, stalled_ms)
+            self._pending_site = site
+            if site.last_logged and now - site.last_logged < self.log_interval_s:
+                site.suppressed += 1
+                return
+            suppressed, site.suppressed = site.suppressed, 0
+            site.last_logged = now
+        logger.warning(
+            "Event loop blocked for >= %.0f ms at %s (%d similar stalls not logged)\n%s",
+            stalled_ms,
+            site_name,
+            suppressed,
+            site.stack.rstrip(),
+        )
+
+    # ---- reporting ----
+    def stats(self, top: int = 10) -> Dict[str, Any]:
+        """Return the lag histogram and the worst blocking sites."""
+        with self._lock:
+            labels = [f"<={b:g}ms" for b in LAG_BUCKETS_MS] + [f">{LAG_BUCKETS_MS[-1]:g}ms"]
+            sites = sorted(self._sites.values(), key=lambda s: s.count, reverse=True)[:top]
+            return {
+                "threshold_ms": self.threshold_ms,
+                "samples": self.samples,
+                "max_lag_ms": round(self.max_lag_ms, 1),
+                "stalls": self.stalls,
+                "histogram": dict(zip(labels, self.histogram)),
+                "sites": [{"site": s.site, "count": s.count, "worst_ms": round(s.worst_ms, 1)} for s in sites],
+            }
+
+
+_MONITORS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopLagMonitor]" = weakref.WeakKeyDictionary()
+
+
+def monitor_running_loop(threshold_ms: float) -> Optional[LoopLagMonitor]:
+    """Start (once per loop) a monitor on the running loop; None when ``threshold_ms`` <= 0."""
+    if threshold_ms <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    monitor = _MONITORS.get(loop)
+    if monitor is None:
+        monitor = LoopLagMonitor(loop, threshold_ms=threshold_ms)
+        monitor.start()
+        _MONITORS[loop] = monitor
+    return monitor
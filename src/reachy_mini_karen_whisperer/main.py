@@ -43,10 +43,15 @@ def run(
 ) -> None:
     """Run the Reachy Mini conversation app."""
     # Putting these dependencies here makes the dashboard faster to load when the conversation app is installed
-    from reachy_mini_karen_whisperer.moves import MovementManager
+    from reachy_mini_karen_whisperer.moves import CONTROL_LOOP_FREQUENCY_HZ, MovementManager
+    from reachy_mini_karen_whisperer.config import config
     from reachy_mini_karen_whisperer.console import LocalStream
+    from reachy_mini_karen_whisperer.session_host import RobotLease
+    from reachy_mini_karen_whisperer.flight_recorder import install_dump_signal, flight_recorder_from_config
     from reachy_mini_karen_whisperer.openai_realtime import OpenaiRealtimeHandler
+    from reachy_mini_karen_whisperer.output_deadband import deadband_from_config
     from reachy_mini_karen_whisperer.tools.core_tools import ToolDependencies
+    from reachy_mini_karen_whisperer.trajectory_cache import warm_trajectories
     from reachy_mini_karen_whisperer.audio.head_wobbler import HeadWobbler
 
     logger = setup_logger(args.debug)
@@ -103,9 +108,23 @@ def run(
     movement_manager = MovementManager(
         current_robot=robot,
         camera_worker=camera_worker,
+        spin_s=config.CONTROL_LOOP_SPIN_US / 1e6,
+        realtime_priority=config.CONTROL_LOOP_RT_PRIORITY,
+        cpus=config.CONTROL_LOOP_CPUS,
+        output=deadband_from_config(),
+        queue_capacity=config.MOVE_QUEUE_CAPACITY,
+        max_repeats=config.MOVE_QUEUE_MAX_REPEATS,
+        recorder=flight_recorder_from_config(CONTROL_LOOP_FREQUENCY_HZ),
     )
 
+    # Compile (or load the cached) move trajectories before the first dance or emotion asks for them
+    warm_trajectories()
+
     head_wobbler = HeadWobbler(set_speech_offsets=movement_manager.set_speech_offsets)
+    if movement_manager.recorder is not None and install_dump_signal(
+        lambda: movement_manager.dump_flight_recorder(config.FLIGHT_RECORDER_DIR)
+    ):
+        logger.info("Send SIGUSR1 (kill -USR1 %d) to dump the control loop flight recorder", os.getpid())
 
     deps = ToolDependencies(
         reachy_mini=robot,
@@ -127,6 +146,8 @@ def run(
     logger.debug(f"Chatbot avatar images: {chatbot.avatar_images}")
 
     handler = OpenaiRealtimeHandler(deps, gradio_mode=args.gradio, instance_path=instance_path)
+    # Gradio copies the handler per browser connection; only one of them may drive the robot
+    handler.robot_lease = RobotLease(args.robot_name or "robot")
 
     stream_manager: gr.Blocks | LocalStream | None = None
 
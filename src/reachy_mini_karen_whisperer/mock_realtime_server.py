@@ -0,0 +1,435 @@
+"""Local mock of the realtime websocket API, for load and soak testing.
+
+Implements the subset of the protocol this app uses, without calling OpenAI:
+
+- ``session.update`` -> ``session.updated``
+- ``input_audio_buffer.append`` with an energy-based ``server_vad``:
+  ``speech_started`` / ``speech_stopped`` / ``committed``, a user item, a scripted
+  transcription and (unless disabled in the session) an automatic response
+- ``conversation.item.create`` / ``delete`` / ``truncate``
+- ``response.create`` / ``response.cancel``: after ``latency_ms``, either a
+  scripted function call or a streamed ``response.output_audio.delta`` tone
+  followed by its transcript and ``response.done``
+
+Each connection sizes its conversation with the app's own token estimates
+(``ConversationContext``); ``latency_ms_per_1k_tokens`` adds response latency in
+proportion, to model a server that slows down as the context grows.
+
+Point the handler at it with ``OPENAI_WEBSOCKET_BASE_URL=ws://127.0.0.1:8765/v1``
+(any API key works), then run::
+
+    python -m reachy_mini_karen_whisperer.mock_realtime_server --latency-ms 400 --script turns.json
+
+A script is a JSON list of turns used in order and cycled, e.g.
+``[{"text": "Hello!"}, {"tool": "dance", "arguments": {"move": "simple_nod"}}]``.
+"""
+
+from __future__ import annotations
+import sys
+import json
+import time
+import uuid
+import base64
+import asyncio
+import logging
+import argparse
+import resource
+from typing import Any, Dict, List, Optional
+from dataclasses import field, dataclass
+
+import numpy as np
+from websockets.exceptions import ConnectionClosed
+from websockets.asyncio.server import Server, ServerConnection, serve
+
+from reachy_mini_karen_whisperer.conversation_context import ConversationContext
+
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 24000
+
+
+@dataclass
+class MockOptions:
+    """Behaviour of the mock server."""
+
+    latency_ms: float = 300.0  # response.create -> first event
+    latency_ms_per_1k_tokens: float = 0.0  # added to latency_ms per 1000 tokens of conversation
+    audio_rate: float = 1.0  # speed of streamed audio relative to real time (0 = unthrottled)
+    response_s: float = 2.0  # length of each spoken response
+    chunk_ms: float = 40.0  # audio per delta
+    vad_threshold: float = 500.0  # RMS (int16) above which input counts as speech
+    vad_silence_ms: float = 500.0  # silence that ends a speech turn
+    transcript: str = "This is a scripted user turn."
+    script: List[Dict[str, Any]] = field(default_factory=lambda: [{"text": "Sure, happy to help with that."}])
+
+
+def _eid() -> str:
+    return f"event_{uuid.uuid4().hex[:20]}"
+
+
+def _iid(prefix: str = "item") -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:20]}"
+
+
+class _Session:
+    """State of one client connection."""
+
+    def __init__(self, ws: ServerConnection, server: "MockRealtimeServer") -> None:
+        self.ws = ws
+        self.server = server
+        self.opts = server.options
+        self.session: Dict[str, Any] = {"type": "realtime", "id": _iid("sess")}
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.context = ConversationContext(token_budget=sys.maxsize)  # only used for its token estimates
+        self.response_task: Optional[asyncio.Task[None]] = None
+        self.audio_ms = 0.0
+        self.in_speech = False
+        self.speech_item: Optional[str] = None
+        self.speech_start_ms = 0.0
+        self.silence_ms = 0.0
+        self.turn = 0
+
+    def _store(self, item: Dict[str, Any]) -> None:
+        self.items[item["id"]] = item
+        self.context.observe_item(item)
+
+    async def send(self, event: Dict[str, Any]) -> None:
+        event.setdefault("event_id", _eid())
+        await self.ws.send(json.dumps(event))
+        self.server.events_sent += 1
+
+    # ---- client events ----
+    async def handle(self, msg: Dict[str, Any]) -> None:
+        kind = msg.get("type")
+        if kind == "session.update":
+            self.session.update(msg.get("session") or {})
+            await self.send({"type": "session.updated", "session": self.session})
+        elif kind == "input_audio_buffer.append":
+            await self._on_audio(msg.get("audio") or "")
+        elif kind == "conversation.item.create":
+            item = dict(msg.get("item") or {})
+            item.setdefault("id", _iid())
+            item.setdefault("object", "realtime.item")
+            item.setdefault("status", "completed")
+            self._store(item)
+            await self.send({"type": "conversation.item.added", "previous_item_id": None, "item": item})
+            await self.send({"type": "conversation.item.done", "previous_item_id": None, "item": item})
+        elif kind == "conversation.item.delete":
+            item_id = msg.get("item_id")
+            if not isinstance(item_id, str) or self.items.pop(item_id, None) is None:
+                await self._error("item_delete_invalid_item_id", f"Item {item_id} does not exist")
+            else:
+                self.context.forget(item_id)
+                await self.send({"type": "conversation.item.deleted", "item_id": item_id})
+        elif kind == "conversation.item.truncate":
+            if isinstance(msg.get("item_id"), str):
+                self.context.set_audio_length(msg["item_id"], float(msg.get("audio_end_ms", 0)) / 1000.0)
+            await self.send(
+                {
+                    "type": "conversation.item.truncated",
+                    "item_id": msg.get("item_id"),
+                    "content_index": msg.get("content_index", 0),
+                    "audio_end_ms": msg.get("audio_end_ms", 0),
+                }
+            )
+        elif kind == "response.create":
+            if self.response_task is not None and not self.response_task.done():
+                await self._error("conversation_already_has_active_response", "A response is already in progress")
+            else:
+                self._start_response()
+        elif kind == "response.cancel":
+            await self._cancel_response()
+        else:
+            logger.debug("Ignoring client event %s", kind)
+
+    async def _error(self, code: str, message: str) -> None:
+        error = {"type": "invalid_request_error", "code": code, "message": message}
+        await self.send({"type": "error", "error": error})
+
+    # ---- server VAD ----
+    def _vad_enabled(self) -> bool:
+        td = ((self.session.get("audio") or {}).get("input") or {}).get("turn_detection")
+        return td is None or (isinstance(td, dict) and td.get("type") == "server_vad")
+
+    def _auto_response(self) -> bool:
+        td = ((self.session.get("audio") or {}).get("input") or {}).get("turn_detection") or {}
+        return bool(td.get("create_response", True))
+
+    async def _on_audio(self, b64: str) -> None:
+        pcm = np.frombuffer(base64.b64decode(b64), dtype=np.int16)
+        if pcm.size == 0:
+            return
+        frame_ms = 1000.0 * pcm.size / SAMPLE_RATE
+        start_ms = self.audio_ms
+        self.audio_ms += frame_ms
+        if not self._vad_enabled():
+            return
+        rms = float(np.sqrt(np.mean(pcm.astype(np.float32) ** 2)))
+        if rms >= self.opts.vad_threshold:
+            self.silence_ms = 0.0
+            if not self.in_speech:
+                self.in_speech = True
+                self.speech_item = _iid()
+                self.speech_start_ms = start_ms
+                if self.response_task is not None and not self.response_task.done():
+                    await self._cancel_response()
+                await self.send(
+                    {
+                        "type": "input_audio_buffer.speech_started",
+                        "audio_start_ms": int(start_ms),
+                        "item_id": self.speech_item,
+                    }
+                )
+            return
+        if self.in_speech:
+            self.silence_ms += frame_ms
+            if self.silence_ms >= self.opts.vad_silence_ms:
+                await self._end_speech()
+
+    async def _end_speech(self) -> None:
+        self.in_speech = False
+        item_id = self.speech_item or _iid()
+        await self.send(
+            {"type": "input_audio_buffer.speech_stopped", "audio_end_ms": int(self.audio_ms), "item_id": item_id}
+        )
+        await self.send({"type": "input_audio_buffer.committed", "previous_item_id": None, "item_id": item_id})
+        item = {
+            "id": item_id,
+            "object": "realtime.item",
+            "type": "message",
+            "role": "user",
+            "status": "completed",
+            "content": [{"type": "input_audio", "transcript": None}],
+        }
+        self._store(item)
+        self.context.add_audio(item_id, (self.audio_ms - self.speech_start_ms) / 1000.0)
+        await self.send({"type": "conversation.item.added", "previous_item_id": None, "item": item})
+        await self.send(
+            {
+                "type": "conversation.item.input_audio_transcription.completed",
+                "item_id": item_id,
+                "content_index": 0,
+                "transcript": self.opts.transcript,
+            }
+        )
+        if self._auto_response():
+            self._start_response()
+
+    # ---- responses ----
+    def _start_response(self) -> None:
+        turn = self.opts.script[self.turn % len(self.opts.script)] if self.opts.script else {"text": ""}
+        self.turn += 1
+        self.response_task = asyncio.create_task(self._respond(turn))
+
+    async def _cancel_response(self) -> None:
+        task = self.response_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _respond(self, turn: Dict[str, Any]) -> None:
+        response_id = _iid("resp")
+        response = {"id": response_id, "object": "realtime.response", "status": "in_progress", "output": []}
+        status = "completed"
+        created = False
+        try:
+            latency_ms = self.opts.latency_ms + self.opts.latency_ms_per_1k_tokens * self.context.total_tokens / 1000.0
+            await asyncio.sleep(latency_ms / 1000.0)
+            await self.send({"type": "response.created", "response": response})
+            created = True
+            if "tool" in turn:
+                await self._function_call(response_id, turn)
+            else:
+                await self._speak(response_id, str(turn.get("text", "")))
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            response["status"] = status
+            try:
+                if created:
+                    await self.send({"type": "response.done", "response": response})
+            except ConnectionClosed:
+                pass
+
+    async def _function_call(self, response_id: str, turn: Dict[str, Any]) -> None:
+        item_id = _iid()
+        call_id = _iid("call")
+        arguments = json.dumps(turn.get("arguments") or {})
+        item = {
+            "id": item_id,
+            "object": "realtime.item",
+            "type": "function_call",
+            "status": "completed",
+            "name": turn["tool"],
+            "call_id": call_id,
+            "arguments": arguments,
+        }
+        self._store(item)
+        base = {"response_id": response_id, "output_index": 0}
+        await self.send({"type": "conversation.item.added", "previous_item_id": None, "item": item})
+        await self.send({"type": "response.output_item.added", **base, "item": item})
+        await self.send(
+            {
+                "type": "response.function_call_arguments.done",
+                **base,
+                "item_id": item_id,
+                "call_id": call_id,
+                "name": turn["tool"],
+                "arguments": arguments,
+            }
+        )
+        await self.send({"type": "conversation.item.done", "previous_item_id": None, "item": item})
+        await self.send({"type": "response.output_item.done", **base, "item": item})
+
+    async def _speak(self, response_id: str, text: str) -> None:
+        item_id = _iid()
+        item: Dict[str, Any] = {
+            "id": item_id,
+            "object": "realtime.item",
+            "type": "message",
+            "role": "assistant",
+            "status": "in_progress",
+            "content": [],
+        }
+        self._store(item)
+        base = {"response_id": response_id, "item_id": item_id, "output_index": 0, "content_index": 0}
+        await self.send({"type": "conversation.item.added", "previous_item_id": None, "item": item})
+
+        chunk = int(SAMPLE_RATE * self.opts.chunk_ms / 1000.0)
+        total = int(SAMPLE_RATE * self.opts.response_s)
+        tone = (3000 * np.sin(2 * np.pi * 220.0 * np.arange(total) / SAMPLE_RATE)).astype(np.int16)
+        started = time.monotonic()
+        for start in range(0, total, chunk):
+            delta = base64.b64encode(tone[start : start + chunk].tobytes()).decode("ascii")
+            await self.send({"type": "response.output_audio.delta", **base, "delta": delta})
+            if self.opts.audio_rate > 0:
+                due = started + (start + chunk) / SAMPLE_RATE / self.opts.audio_rate
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+        await self.send({"type": "response.output_audio.done", **base})
+        await self.send({"type": "response.output_audio_transcript.done", **base, "transcript": text})
+        item["status"] = "completed"
+        item["content"] = [{"type": "output_audio", "transcript": text}]
+        self.context.observe_item(item)
+        self.context.add_audio(item_id, total / SAMPLE_RATE)
+        await self.send({"type": "conversation.item.done", "previous_item_id": None, "item": item})
+
+
+class MockRealtimeServer:
+    """Websocket server speaking the realtime protocol subset used by the app."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, options: Optional[MockOptions] = None) -> None:
+        """Configure the server; call ``start()`` to listen."""
+        self.host = host
+        self.port = port
+        self.options = options or MockOptions()
+        self._server: Optional[Server] = None
+        self.connections = 0
+        self.active = 0
+        self.events_sent = 0
+        self.events_received = 0
+
+    @property
+    def websocket_base_url(self) -> str:
+        """Value for ``AsyncOpenAI(websocket_base_url=...)``."""
+        return f"ws://{self.host}:{self.port}/v1"
+
+    async def _serve(self, ws: ServerConnection) -> None:
+        self.connections += 1
+        self.active += 1
+        session = _Session(ws, self)
+        try:
+            await session.send({"type": "session.created", "session": session.session})
+            async for raw in ws:
+                self.events_received += 1
+                try:
+                    msg = json.loads(raw)
+                except ValueError:
+                    await session._error("invalid_json", "Could not parse message")
+                    continue
+                await session.handle(msg)
+        except ConnectionClosed:
+            pass
+        finally:
+            self.active -= 1
+            await session._cancel_response()
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await serve(self._serve, self.host, self.port, max_size=None)
+        logger.info("Mock realtime server listening on %s", self.websocket_base_url)
+
+    async def stop(self) -> None:
+        """Stop listening and close connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and the process peak RSS."""
+        return {
+            "connections": self.connections,
+            "active": self.active,
+            "events_sent": self.events_sent,
+            "events_received": self.events_received,
+            "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+        }
+
+
+async def _run(server: MockRealtimeServer, stats_interval_s: float) -> None:
+    await server.start()
+    try:
+        while True:
+            await asyncio.sleep(stats_interval_s)
+            logger.info("Mock realtime stats: %s", server.stats())
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Run a local mock of the realtime websocket API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=MockOptions.latency_ms)
+    parser.add_argument(
+        "--latency-ms-per-1k-tokens",
+        type=float,
+        default=MockOptions.latency_ms_per_1k_tokens,
+        help="Extra response latency per 1000 tokens of conversation",
+    )
+    parser.add_argument(
+        "--audio-rate", type=float, default=MockOptions.audio_rate, help="1 = real time, 0 = unthrottled"
+    )
+    parser.add_argument("--response-s", type=float, default=MockOptions.response_s)
+    parser.add_argument("--vad-threshold", type=float, default=MockOptions.vad_threshold)
+    parser.add_argument("--script", type=str, default=None, help="JSON file with a list of scripted turns")
+    parser.add_argument("--stats-interval", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    options = MockOptions(
+        latency_ms=args.latency_ms,
+        latency_ms_per_1k_tokens=args.latency_ms_per_1k_tokens,
+        audio_rate=args.audio_rate,
+        response_s=args.response_s,
+        vad_threshold=args.vad_threshold,
+    )
+    if args.script:
+        with open(args.script, encoding="utf-8") as f:
+            options.script = list(json.load(f))
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_run(MockRealtimeServer(args.host, args.port, options), args.stats_interval))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
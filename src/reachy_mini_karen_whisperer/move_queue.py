@@ -0,0 +1,198 @@
+"""Bounded primary move queue with admission policies and coalescing of repeats.
+
+``MovementManager`` used to keep primary moves in an unbounded deque fed
+through its command queue: a tool asking for ``repeat=500`` queued 500 dance
+objects and minutes of motion, and the tool could not tell what it got.
+``MoveQueue`` is checked and updated under a lock by the caller, so
+``queue_move`` answers immediately with a ``QueueResult``:
+
+- ``APPEND`` queues after the current move, unless the queue holds
+  ``capacity`` entries already (``dropped_full``);
+- ``INTERRUPT`` discards the queued moves and asks the worker to stop the
+  current one before the new move starts;
+- ``DROP_IF_BUSY`` only queues when nothing but breathing is playing or
+  queued (``dropped_busy``), for opportunistic moves such as idle gestures.
+
+Moves with the same ``coalesce_key`` queued back to back share one entry: a
+``LoopedMove`` playing the move ``repeats`` times, capped at ``max_repeats``
+(further repeats are ``dropped_max_repeats``).
+The worker thread still owns the current move; it only pops entries and
+reports whether a non-idle move is active.
+"""
+
+from __future__ import annotations
+import logging
+import threading
+from typing import Any, Dict, Tuple, Hashable, Optional
+from collections import deque
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from reachy_mini.motion.move import Move
+from reachy_mini_karen_whisperer.pose import Pose
+
+
+logger = logging.getLogger(__name__)
+
+APPEND = "append"
+INTERRUPT = "interrupt"
+DROP_IF_BUSY = "drop_if_busy"
+POLICIES = (APPEND, INTERRUPT, DROP_IF_BUSY)
+
+DEFAULT_CAPACITY = 8
+DEFAULT_MAX_REPEATS = 5
+
+
+@dataclass(frozen=True)
+class QueueResult:
+    """What ``MoveQueue.offer`` did with a move."""
+
+    accepted: bool
+    status: str  # queued, coalesced, interrupted, dropped_full, dropped_max_repeats or dropped_busy
+    repeats: int  # plays of the move accepted (0 when dropped)
+    queue_size: int  # entries queued afterwards
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the result as plain values for tool responses."""
+        return asdict(self)
+
+
+class LoopedMove(Move):  # type: ignore
+    """Play another move ``repeats`` times back to back as a single queue entry."""
+
+    def __init__(self, move: Move, repeats: int) -> None:
+        """Wrap ``move``; ``repeats`` may grow while the entry is still queued."""
+        self.move = move
+        self.repeats = repeats
+        self.coalesce_key = getattr(move, "coalesce_key", None)
+        self._evaluate_pose = getattr(move, "evaluate_pose", None)
+
+    @property
+    def duration(self) -> float:
+        """Duration property required by official Move interface."""
+        return float(self.move.duration) * self.repeats
+
+    def _local_time(self, t: float) -> float:
+        period = float(self.move.duration)
+        if period <= 0 or t >= period * self.repeats:
+            return period
+        return t % period
+
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time t into ``out`` (fast path used by MovementManager)."""
+        t = self._local_time(t)
+        if self._evaluate_pose is not None:
+            self._evaluate_pose(t, out)
+            return
+        head, antennas, body_yaw = self.move.evaluate(t)
+        out.set_matrix(head, (0.0, 0.0) if antennas is None else antennas, 0.0 if body_yaw is None else body_yaw)
+
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Evaluate the wrapped move at the matching time of its current repetition."""
+        pose: tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]
+        pose = self.move.evaluate(self._local_time(t))
+        return pose
+
+
+class MoveQueue:
+    """Thread-safe queue of primary moves, bounded to ``capacity`` entries."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, max_repeats: int = DEFAULT_MAX_REPEATS) -> None:
+        """Create an empty queue; ``max_repeats`` caps the plays of one coalesced entry."""
+        self.capacity = max(1, capacity)
+        self.max_repeats = max(1, max_repeats)
+        self._lock = threading.Lock()
+        self._moves: deque[Move] = deque()
+        self._busy = False  # a non-idle move is playing, as reported by the worker
+        self._idle_move: Optional[Move] = None  # last move pushed by the worker itself
+        self._stop_requested = False
+        self.counts: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of queued entries."""
+        return len(self._moves)
+
+    def __bool__(self) -> bool:
+        """Return True when a move is queued."""
+        return bool(self._moves)
+
+    def offer(self, move: Move, policy: str = APPEND, repeat: int = 1) -> QueueResult:
+        """Queue ``move`` (``repeat`` times) under ``policy`` and report what was accepted."""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy {policy!r}; expected one of {POLICIES}")
+        repeat = max(1, int(repeat))
+        key: Optional[Hashable] = getattr(move, "coalesce_key", None)
+        with self._lock:
+            if policy == DROP_IF_BUSY and (self._busy or any(m is not self._idle_move for m in self._moves)):
+                return self._result(False, "dropped_busy", 0)
+            if policy == INTERRUPT:
+                self._moves.clear()
+                self._stop_requested = True
+
+            tail = self._moves[-1] if self._moves else None
+            if key is not None and tail is not None and getattr(tail, "coalesce_key", None) == key:
+                if not isinstance(tail, LoopedMove):
+                    tail = LoopedMove(tail, 1)
+                    self._moves[-1] = tail
+                accepted = min(repeat, self.max_repeats - tail.repeats)
+                if accepted <= 0:
+                    return self._result(False, "dropped_max_repeats", 0)
+                tail.repeats += accepted
+                return self._result(True, "coalesced", accepted)
+
+            if len(self._moves) >= self.capacity:
+                return self._result(False, "dropped_full", 0)
+            accepted = min(repeat, self.max_repeats) if key is not None else 1
+            self._moves.append(move if accepted == 1 else LoopedMove(move, accepted))
+            return self._result(True, "interrupted" if policy == INTERRUPT else "queued", accepted)
+
+    def _result(self, accepted: bool, status: str, repeats: int) -> QueueResult:
+        self.counts[status] = self.counts.get(status, 0) + 1
+        return QueueResult(accepted, status, repeats, len(self._moves))
+
+    def clear(self, stop_current: bool = True) -> None:
+        """Discard queued moves and, with ``stop_current``, ask the worker to stop the current one."""
+        with self._lock:
+            self._moves.clear()
+            if stop_current:
+                self._stop_requested = True
+
+    def push(self, move: Move) -> None:
+        """Queue a move from the worker itself (breathing), bypassing policy and capacity."""
+        with self._lock:
+            self._moves.append(move)
+            self._idle_move = move
+
+    def popleft(self) -> Optional[Move]:
+        """Return the next move, or None; the queue counts as busy until the worker says otherwise."""
+        with self._lock:
+            if not self._moves:
+                return None
+            self._busy = True
+            return self._moves.popleft()
+
+    def take_stop_request(self) -> bool:
+        """Return True once after ``clear`` or an interrupting ``offer`` asked to stop the current move."""
+        if not self._stop_requested:
+            return False
+        with self._lock:
+            requested, self._stop_requested = self._stop_requested, False
+        return requested
+
+    def set_busy(self, busy: bool) -> None:
+        """Record whether the worker is playing a non-idle move (checked by ``DROP_IF_BUSY``)."""
+        self._busy = busy
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the queue size, limits and counts of each admission outcome."""
+        with self._lock:
+            queued: Tuple[str, ...] = tuple(type(m).__name__ for m in self._moves)
+            return {
+                "size": len(queued),
+                "capacity": self.capacity,
+                "max_repeats": self.max_repeats,
+                "moves": list(queued),
+                "outcomes": dict(self.counts),
+            }
@@ -4,40 +4,50 @@ Design overview
 - Primary moves (emotions, dances, goto, breathing) are mutually exclusive and run
   sequentially.
 - Secondary moves (speech sway, face tracking) are additive offsets applied on top
-  of the current primary pose.
+  of the current primary pose. Each producer publishes to a named channel of an
+  `OffsetBus`, with its own weight, clamp and staleness decay.
 - There is a single control point to the robot: `ReachyMini.set_target`.
-- The control loop runs near 100 Hz and is phase-aligned via a monotonic clock.
+- The control loop runs near 100 Hz on a grid of absolute deadlines from a
+  monotonic clock (`DeadlineScheduler`); late ticks are counted, not bunched.
 - Idle behaviour starts an infinite `BreathingMove` after a short inactivity delay
   unless listening is active.
 
 Threading model
 - A dedicated worker thread owns all real-time state and issues `set_target`
   commands.
-- Other threads communicate via a command queue (enqueue moves, mark activity,
-  toggle listening).
-- Secondary offset producers set pending values guarded by locks; the worker
-  snaps them atomically.
+- Other threads communicate via a command queue (mark activity, toggle
+  listening). Primary moves go into a bounded `MoveQueue` that accepts or
+  refuses them immediately (append, interrupt or drop-if-busy).
+- Secondary offset producers publish immutable samples to their `OffsetBus`
+  channel without locking; the worker fuses the latest ones once per tick.
 
 Units and frames
 - Secondary offsets are interpreted as metres for x/y/z and radians for
   roll/pitch/yaw in the world frame (unless noted by `compose_world_offset`).
 - Antennas and `body_yaw` are in radians.
-- Head pose composition uses `compose_world_offset(primary_head, secondary_head)`;
+- Head pose composition follows `compose_world_offset(primary_head, secondary_head)`;
   the secondary offset must therefore be expressed in the world frame.
+- Inside the loop poses are compact `Pose` values (quaternion, translation,
+  antennas, body yaw); the head only becomes a 4x4 matrix for `set_target`.
 
 Safety
 - Listening freezes antennas, then blends them back on unfreeze.
 - Interpolations and blends are used to avoid jumps at all times.
 - `set_target` errors are rate-limited in logs.
+- Commands within a small dead-band of the last one sent are skipped
+  (`DeadbandOutput`), with a keep-alive at a lower rate.
+- An optional `FlightRecorder` keeps the last ticks (timing, poses, commands)
+  for post-mortem dumps.
 """
 
 from __future__ import annotations
+import math
 import time
 import logging
 import threading
 from queue import Empty, Queue
-from typing import Any, Dict, Tuple
-from collections import deque
+from typing import Any, Dict, Tuple, Sequence
+from pathlib import Path
 from dataclasses import dataclass
 
 import numpy as np
@@ -46,20 +56,44 @@ from numpy.typing import NDArray
 from reachy_mini import ReachyMini
 from reachy_mini.utils import create_head_pose
 from reachy_mini.motion.move import Move
-from reachy_mini.utils.interpolation import (
-    compose_world_offset,
-    linear_pose_interpolation,
+from reachy_mini.utils.interpolation import compose_world_offset
+from reachy_mini_karen_whisperer.pose import IDENTITY_POSE, Pose, Offsets
+from reachy_mini_karen_whisperer.move_queue import (
+    APPEND,
+    DEFAULT_CAPACITY,
+    DEFAULT_MAX_REPEATS,
+    MoveQueue,
+    QueueResult,
 )
+from reachy_mini_karen_whisperer.offset_bus import OffsetBus
+from reachy_mini_karen_whisperer.loop_profiler import (
+    RECORD,
+    COMPOSE,
+    OFFSETS,
+    EVALUATE,
+    SET_TARGET,
+    POLL_SIGNALS,
+    PRIMARY_MOTION,
+    StageProfiler,
+)
+from reachy_mini_karen_whisperer.tick_scheduler import DEFAULT_SPIN_S, DeadlineScheduler, apply_realtime_policy
+from reachy_mini_karen_whisperer.flight_recorder import FlightRecorder
+from reachy_mini_karen_whisperer.output_deadband import DeadbandOutput
 
 
 logger = logging.getLogger(__name__)
 
 # Configuration constants
 CONTROL_LOOP_FREQUENCY_HZ = 100.0  # Hz - Target frequency for the movement control loop
+SPEECH_OFFSET_HOLD_S = 0.3  # speech sway publishes every 50 ms; after this long without one it fades out
+SPEECH_OFFSET_DECAY_S = 0.5
 
 # Type definitions
 FullBodyPose = Tuple[NDArray[np.float32], Tuple[float, float], float]  # (head_pose_4x4, antennas, body_yaw)
 
+NEUTRAL_HEAD_POSE: NDArray[np.float64] = np.eye(4)
+NEUTRAL_HEAD_POSE.flags.writeable = False
+
 
 class BreathingMove(Move):  # type: ignore
     """Breathing move with interpolation to neutral and then continuous breathing patterns."""
@@ -79,12 +113,18 @@ class BreathingMove(Move):  # type: ignore
 
         """
         self.interpolation_start_pose = interpolation_start_pose
-        self.interpolation_start_antennas = np.array(interpolation_start_antennas)
+        self.interpolation_start_antennas = np.array(interpolation_start_antennas, dtype=np.float64)
         self.interpolation_duration = interpolation_duration
 
         # Neutral positions for breathing base
-        self.neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
+        self.neutral_head_pose = NEUTRAL_HEAD_POSE
         self.neutral_antennas = np.array([0.0, 0.0])
+        self._start = Pose.from_matrix(interpolation_start_pose, self.interpolation_start_antennas)
+
+        # Output buffers reused on every evaluation
+        self._pose = Pose()
+        self._head = np.eye(4)
+        self._antennas = np.zeros(2)
 
         # Breathing parameters
         self.breathing_z_amplitude = 0.005  # 5mm gentle breathing
@@ -97,37 +137,35 @@ class BreathingMove(Move):  # type: ignore
         """Duration property required by official Move interface."""
         return float("inf")  # Continuous breathing (never ends naturally)
 
-    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
-        """Evaluate breathing move at time t."""
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the breathing pose at time t into ``out`` (fast path used by MovementManager)."""
         if t < self.interpolation_duration:
-            # Phase 1: Interpolate to neutral base position
-            interpolation_t = t / self.interpolation_duration
-
-            # Interpolate head pose
-            head_pose = linear_pose_interpolation(
-                self.interpolation_start_pose, self.neutral_head_pose, interpolation_t,
-            )
-
-            # Interpolate antennas
-            antennas_interp = (
-                1 - interpolation_t
-            ) * self.interpolation_start_antennas + interpolation_t * self.neutral_antennas
-            antennas = antennas_interp.astype(np.float64)
-
+            # Phase 1: Interpolate head and antennas to the neutral base position
+            out.set_interpolated(self._start, IDENTITY_POSE, t / self.interpolation_duration)
         else:
             # Phase 2: Breathing patterns from neutral base
             breathing_time = t - self.interpolation_duration
+            out.set_identity()
 
             # Gentle z-axis breathing
-            z_offset = self.breathing_z_amplitude * np.sin(2 * np.pi * self.breathing_frequency * breathing_time)
-            head_pose = create_head_pose(x=0, y=0, z=z_offset, roll=0, pitch=0, yaw=0, degrees=True, mm=False)
+            breathing_phase = 2 * math.pi * self.breathing_frequency * breathing_time
+            out.data[6] = self.breathing_z_amplitude * math.sin(breathing_phase)
 
             # Antenna sway (opposite directions)
-            antenna_sway = self.antenna_sway_amplitude * np.sin(2 * np.pi * self.antenna_frequency * breathing_time)
-            antennas = np.array([antenna_sway, -antenna_sway], dtype=np.float64)
+            sway_phase = 2 * math.pi * self.antenna_frequency * breathing_time
+            antenna_sway = self.antenna_sway_amplitude * math.sin(sway_phase)
+            out.data[7] = antenna_sway
+            out.data[8] = -antenna_sway
+
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Evaluate breathing move at time t.
 
-        # Return in official Move interface format: (head_pose, antennas_array, body_yaw)
-        return (head_pose, antennas, 0.0)
+        Returns the official Move interface format (head_pose, antennas_array, body_yaw).
+        The arrays are reused by the next call; callers copy what they keep.
+        """
+        self.evaluate_pose(t, self._pose)
+        self._antennas[0], self._antennas[1] = self._pose.antennas
+        return (self._pose.to_matrix(self._head), self._antennas, self._pose.body_yaw)
 
 
 def combine_full_body(primary_pose: FullBodyPose, secondary_pose: FullBodyPose) -> FullBodyPose:
@@ -174,26 +212,8 @@ class MovementState:
     move_start_time: float | None = None
     last_activity_time: float = 0.0
 
-    # Secondary move state (offsets)
-    speech_offsets: Tuple[float, float, float, float, float, float] = (
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-    )
-    face_tracking_offsets: Tuple[float, float, float, float, float, float] = (
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-        0.0,
-    )
-
     # Status flags
-    last_primary_pose: FullBodyPose | None = None
+    last_primary_pose: Pose | None = None
 
     def update_activity(self) -> None:
         """Update the last activity time."""
@@ -233,20 +253,46 @@ class MovementManager:
     Timing:
     - All elapsed-time calculations rely on `time.monotonic()` through `self._now`
       to avoid wall-clock jumps.
-    - The loop attempts 100 Hz
+    - The loop attempts 100 Hz on absolute deadlines, sleeping and then spinning
+      the last `spin_s` before each one; lateness, jitter and missed deadlines
+      are reported by `get_status()`, with a per-stage cost breakdown of the last
+      ticks (`StageProfiler`).
+    - Optionally (`realtime_priority`, `cpus`) the worker thread runs under Linux
+      `SCHED_FIFO` and is pinned to the given CPUs.
 
     Concurrency:
-    - External threads communicate via `_command_queue` messages.
-    - Secondary offsets are staged via dirty flags guarded by locks and consumed
-      atomically inside the worker loop.
+    - External threads communicate via `_command_queue` messages; `queue_move`
+      admits primary moves into the lock-protected `move_queue` and returns the outcome.
+    - Secondary offsets go through `offsets`, an `OffsetBus` with a "speech"
+      and a "face" channel; other producers can register their own channels.
     """
 
     def __init__(
         self,
         current_robot: ReachyMini,
         camera_worker: "Any" = None,
+        spin_s: float = DEFAULT_SPIN_S,
+        realtime_priority: int = 0,
+        cpus: Sequence[int] | None = None,
+        output: DeadbandOutput | None = None,
+        queue_capacity: int = DEFAULT_CAPACITY,
+        max_repeats: int = DEFAULT_MAX_REPEATS,
+        recorder: FlightRecorder | None = None,
     ):
-        """Initialize movement manager."""
+        """Initialize movement manager.
+
+        Args:
+            current_robot: Robot that receives the `set_target` commands
+            camera_worker: Optional source of face tracking offsets, given the bus's "face" channel
+            spin_s: Busy-wait this long before each tick deadline instead of sleeping
+            realtime_priority: SCHED_FIFO priority for the worker thread (0 keeps the default policy)
+            cpus: CPUs to pin the worker thread to (None or empty leaves it unpinned)
+            output: Dead-band deciding which commands reach `set_target` (default thresholds when None)
+            queue_capacity: Most primary moves queued at once; further ones are refused
+            max_repeats: Most plays of one move coalesced into a single queue entry
+            recorder: Flight recorder of every tick (None records nothing)
+
+        """
         self.current_robot = current_robot
         self.camera_worker = camera_worker
 
@@ -256,11 +302,18 @@ class MovementManager:
         # Movement state
         self.state = MovementState()
         self.state.last_activity_time = self._now()
-        neutral_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-        self.state.last_primary_pose = (neutral_pose, (0.0, 0.0), 0.0)
+
+        # Poses owned by the worker and rewritten in place on every tick: primary (last
+        # sampled move pose), secondary (fused offsets) and the command, whose head is
+        # written into a matrix only for set_target.
+        self._primary = Pose()
+        self._secondary = Pose()
+        self._command = Pose()
+        self._command_head: NDArray[np.float64] = np.eye(4)
+        self.state.last_primary_pose = self._primary
 
         # Move queue (primary moves)
-        self.move_queue: deque[Move] = deque()
+        self.move_queue = MoveQueue(queue_capacity, max_repeats)
 
         # Configuration
         self.idle_inactivity_delay = 0.3  # seconds
@@ -270,8 +323,11 @@ class MovementManager:
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._is_listening = False
-        self._last_commanded_pose: FullBodyPose = clone_full_body_pose(self.state.last_primary_pose)
-        self._listening_antennas: Tuple[float, float] = self._last_commanded_pose[1]
+        self._last_commanded_head: NDArray[np.float64] = np.eye(4)
+        # Kept as separate fields so the loop publishes a command without building a tuple
+        self._last_commanded_antennas: Tuple[float, float] = (0.0, 0.0)
+        self._last_commanded_body_yaw = 0.0
+        self._listening_antennas: Tuple[float, float] = self._last_commanded_antennas
         self._antenna_unfreeze_blend = 1.0
         self._antenna_blend_duration = 0.4  # seconds to blend back after listening
         self._last_listening_blend_time = self._now()
@@ -284,27 +340,19 @@ class MovementManager:
 
         # Cross-thread signalling
         self._command_queue: "Queue[Tuple[str, Any]]" = Queue()
-        self._speech_offsets_lock = threading.Lock()
-        self._pending_speech_offsets: Tuple[float, float, float, float, float, float] = (
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-        )
-        self._speech_offsets_dirty = False
-
-        self._face_offsets_lock = threading.Lock()
-        self._pending_face_offsets: Tuple[float, float, float, float, float, float] = (
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
-            0.0,
+
+        # Secondary offsets: speech sway fades out when it stops publishing, face tracking
+        # manages its own return to neutral
+        self.offsets = OffsetBus()
+        self._speech_channel = self.offsets.register(
+            "speech",
+            hold_s=SPEECH_OFFSET_HOLD_S,
+            decay_s=SPEECH_OFFSET_DECAY_S,
+            marks_activity=True,
         )
-        self._face_offsets_dirty = False
+        face_channel = self.offsets.register("face")
+        if camera_worker is not None:
+            camera_worker.set_offset_channel(face_channel)
 
         self._shared_state_lock = threading.Lock()
         self._shared_last_activity_time = self.state.last_activity_time
@@ -312,31 +360,52 @@ class MovementManager:
         self._status_lock = threading.Lock()
         self._freq_stats = LoopFrequencyStats()
         self._freq_snapshot = LoopFrequencyStats()
-
-    def queue_move(self, move: Move) -> None:
-        """Queue a primary move to run after the currently executing one.
-
-        Thread-safe: the move is enqueued via the worker command queue so the
-        control loop remains the sole mutator of movement state.
+        self._print_interval_loops = max(1, int(self.target_frequency * 2))
+        self._scheduler = DeadlineScheduler(self.target_period, spin_s=spin_s, clock=self._now)
+        self._realtime_priority = realtime_priority
+        self._cpus = list(cpus or [])
+        self._realtime_applied: Dict[str, Any] = {"sched_fifo_priority": None, "cpus": None}
+        self._profiler = StageProfiler()
+        self._output = output if output is not None else DeadbandOutput()
+        self.recorder = recorder
+
+    def queue_move(self, move: Move, policy: str = APPEND, repeat: int = 1) -> QueueResult:
+        """Queue a primary move under ``policy`` (append, interrupt or drop_if_busy) and return what was accepted.
+
+        Consecutive moves with the same ``coalesce_key`` are played as one entry,
+        up to ``max_repeats`` times. Thread-safe: the bounded `MoveQueue` decides
+        immediately; the worker picks the move up on its next tick and remains
+        the sole mutator of the current move.
         """
-        self._command_queue.put(("queue_move", move))
+        result = self.move_queue.offer(move, policy, repeat)
+        if result.accepted:
+            self._command_queue.put(("mark_activity", None))
+            logger.debug(
+                "Queued move with duration %.2fs (%s, x%d), queue size: %d",
+                float(getattr(move, "duration", 0.0) or 0.0),
+                result.status,
+                result.repeats,
+                result.queue_size,
+            )
+        else:
+            logger.info("Refused %s move: %s (queue size %d)", type(move).__name__, result.status, result.queue_size)
+        return result
 
     def clear_move_queue(self) -> None:
         """Stop the active move and discard any queued primary moves.
 
-        Thread-safe: executed by the worker thread via the command queue.
+        Thread-safe: the queue is emptied now and the worker stops the current move on its next tick.
         """
-        self._command_queue.put(("clear_queue", None))
+        self.move_queue.clear()
 
-    def set_speech_offsets(self, offsets: Tuple[float, float, float, float, float, float]) -> None:
-        """Update speech-induced secondary offsets (x, y, z, roll, pitch, yaw).
+    def set_speech_offsets(self, offsets: Pose | Offsets) -> None:
+        """Update speech-induced secondary offsets, as a ``Pose`` or (x, y, z, roll, pitch, yaw).
 
         Offsets are interpreted as metres for translation and radians for
-        rotation in the world frame. Thread-safe via a pending snapshot.
+        rotation in the world frame. Thread-safe: published to the "speech"
+        channel of `offsets`.
         """
-        with self._speech_offsets_lock:
-            self._pending_speech_offsets = offsets
-            self._speech_offsets_dirty = True
+        self._speech_channel.publish(offsets)
 
     def set_moving_state(self, duration: float) -> None:
         """Mark the robot as actively moving for the provided duration.
@@ -373,68 +442,20 @@ class MovementManager:
         self._command_queue.put(("set_listening", listening))
 
     def _poll_signals(self, current_time: float) -> None:
-        """Apply queued commands and pending offset updates."""
-        self._apply_pending_offsets()
-
-        while True:
+        """Apply queued commands."""
+        # Check before reading: raising Empty on every idle tick would allocate an exception
+        while not self._command_queue.empty():
             try:
                 command, payload = self._command_queue.get_nowait()
             except Empty:
                 break
             self._handle_command(command, payload, current_time)
 
-    def _apply_pending_offsets(self) -> None:
-        """Apply the most recent speech/face offset updates."""
-        speech_offsets: Tuple[float, float, float, float, float, float] | None = None
-        with self._speech_offsets_lock:
-            if self._speech_offsets_dirty:
-                speech_offsets = self._pending_speech_offsets
-                self._speech_offsets_dirty = False
-
-        if speech_offsets is not None:
-            self.state.speech_offsets = speech_offsets
-            self.state.update_activity()
-
-        face_offsets: Tuple[float, float, float, float, float, float] | None = None
-        with self._face_offsets_lock:
-            if self._face_offsets_dirty:
-                face_offsets = self._pending_face_offsets
-                self._face_offsets_dirty = False
-
-        if face_offsets is not None:
-            self.state.face_tracking_offsets = face_offsets
-            self.state.update_activity()
-
     def _handle_command(self, command: str, payload: Any, current_time: float) -> None:
         """Handle a single cross-thread command."""
-        if command == "queue_move":
-            if isinstance(payload, Move):
-                self.move_queue.append(payload)
-                self.state.update_activity()
-                duration = getattr(payload, "duration", None)
-                if duration is not None:
-                    try:
-                        duration_str = f"{float(duration):.2f}"
-                    except (TypeError, ValueError):
-                        duration_str = str(duration)
-                else:
-                    duration_str = "?"
-                logger.debug(
-                    "Queued move with duration %ss, queue size: %s",
-                    duration_str,
-                    len(self.move_queue),
-                )
-            else:
-                logger.warning("Ignored queue_move command with invalid payload: %s", payload)
-        elif command == "clear_queue":
-            self.move_queue.clear()
-            self.state.current_move = None
-            self.state.move_start_time = None
-            self._breathing_active = False
-            logger.info("Cleared move queue and stopped current move")
-        elif command == "set_moving_state":
+        if command == "set_moving_state":
             try:
-                duration = float(payload)
+                float(payload)
             except (TypeError, ValueError):
                 logger.warning("Invalid moving state duration: %s", payload)
                 return
@@ -456,8 +477,8 @@ class MovementManager:
             if desired_state:
                 # Freeze: snapshot current commanded antennas and reset blend
                 self._listening_antennas = (
-                    float(self._last_commanded_pose[1][0]),
-                    float(self._last_commanded_pose[1][1]),
+                    float(self._last_commanded_antennas[0]),
+                    float(self._last_commanded_antennas[1]),
                 )
                 self._antenna_unfreeze_blend = 0.0
             else:
@@ -475,6 +496,12 @@ class MovementManager:
 
     def _manage_move_queue(self, current_time: float) -> None:
         """Manage the primary move queue (sequential execution)."""
+        if self.move_queue.take_stop_request():
+            self.state.current_move = None
+            self.state.move_start_time = None
+            self._breathing_active = False
+            logger.info("Cleared move queue and stopped current move")
+
         if self.state.current_move is None or (
             self.state.move_start_time is not None
             and current_time - self.state.move_start_time >= self.state.current_move.duration
@@ -482,12 +509,14 @@ class MovementManager:
             self.state.current_move = None
             self.state.move_start_time = None
 
-            if self.move_queue:
-                self.state.current_move = self.move_queue.popleft()
+            move = self.move_queue.popleft()
+            if move is not None:
+                self.state.current_move = move
                 self.state.move_start_time = current_time
                 # Any real move cancels breathing mode flag
-                self._breathing_active = isinstance(self.state.current_move, BreathingMove)
-                logger.debug(f"Starting new move, duration: {self.state.current_move.duration}s")
+                self._breathing_active = isinstance(move, BreathingMove)
+                logger.debug(f"Starting new move, duration: {move.duration}s")
+            self.move_queue.set_busy(move is not None and not self._breathing_active)
 
     def _manage_breathing(self, current_time: float) -> None:
         """Manage automatic breathing when idle."""
@@ -513,7 +542,7 @@ class MovementManager:
                         interpolation_start_antennas=current_antennas,
                         interpolation_duration=1.0,
                     )
-                    self.move_queue.append(breathing_move)
+                    self.move_queue.push(breathing_move)
                     logger.debug("Started breathing after %.1fs of inactivity", idle_for)
                 except Exception as e:
                     self._breathing_active = False
@@ -528,68 +557,44 @@ class MovementManager:
         if self.state.current_move is not None and not isinstance(self.state.current_move, BreathingMove):
             self._breathing_active = False
 
-    def _get_primary_pose(self, current_time: float) -> FullBodyPose:
-        """Get the primary full body pose from current move or neutral."""
-        # When a primary move is playing, sample it and cache the resulting pose
-        if self.state.current_move is not None and self.state.move_start_time is not None:
+    def _get_primary_pose(self, current_time: float) -> Pose:
+        """Get the primary full body pose from current move or neutral.
+
+        Returns the manager's primary pose, overwritten on the next tick. Moves with an
+        ``evaluate_pose(t, out)`` method write into it directly; others go through the
+        official ``evaluate`` and their head matrix is converted.
+        """
+        move = self.state.current_move
+        # When a primary move is playing, sample it into the primary pose
+        if move is not None and self.state.move_start_time is not None:
             move_time = current_time - self.state.move_start_time
-            head, antennas, body_yaw = self.state.current_move.evaluate(move_time)
-
-            if head is None:
-                head = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-            if antennas is None:
-                antennas = np.array([0.0, 0.0])
-            if body_yaw is None:
-                body_yaw = 0.0
-
-            antennas_tuple = (float(antennas[0]), float(antennas[1]))
-            head_copy = head.copy()
-            primary_full_body_pose = (
-                head_copy,
-                antennas_tuple,
-                float(body_yaw),
-            )
+            evaluate_pose = getattr(move, "evaluate_pose", None)
+            if evaluate_pose is not None:
+                evaluate_pose(move_time, self._primary)
+            else:
+                head, antennas, body_yaw = move.evaluate(move_time)
+                self._primary.set_matrix(
+                    NEUTRAL_HEAD_POSE if head is None else head,
+                    (0.0, 0.0) if antennas is None else antennas,
+                    0.0 if body_yaw is None else body_yaw,
+                )
+            self.state.last_primary_pose = self._primary
+        # Otherwise the pose still holds the last primary pose, so we avoid jumps between moves
+        return self._primary
 
-            self.state.last_primary_pose = clone_full_body_pose(primary_full_body_pose)
-        # Otherwise reuse the last primary pose so we avoid jumps between moves
-        elif self.state.last_primary_pose is not None:
-            primary_full_body_pose = clone_full_body_pose(self.state.last_primary_pose)
-        else:
-            neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-            primary_full_body_pose = (neutral_head_pose, (0.0, 0.0), 0.0)
-            self.state.last_primary_pose = clone_full_body_pose(primary_full_body_pose)
-
-        return primary_full_body_pose
-
-    def _get_secondary_pose(self) -> FullBodyPose:
-        """Get the secondary full body pose from speech and face tracking offsets."""
-        # Combine speech sway offsets + face tracking offsets for secondary pose
-        secondary_offsets = [
-            self.state.speech_offsets[0] + self.state.face_tracking_offsets[0],
-            self.state.speech_offsets[1] + self.state.face_tracking_offsets[1],
-            self.state.speech_offsets[2] + self.state.face_tracking_offsets[2],
-            self.state.speech_offsets[3] + self.state.face_tracking_offsets[3],
-            self.state.speech_offsets[4] + self.state.face_tracking_offsets[4],
-            self.state.speech_offsets[5] + self.state.face_tracking_offsets[5],
-        ]
-
-        secondary_head_pose = create_head_pose(
-            x=secondary_offsets[0],
-            y=secondary_offsets[1],
-            z=secondary_offsets[2],
-            roll=secondary_offsets[3],
-            pitch=secondary_offsets[4],
-            yaw=secondary_offsets[5],
-            degrees=False,
-            mm=False,
-        )
-        return (secondary_head_pose, (0.0, 0.0), 0.0)
+    def _update_secondary_offsets(self, current_time: float) -> None:
+        """Fuse the offset bus channels into the secondary pose."""
+        if self.offsets.fuse(current_time, self._secondary):
+            self.state.update_activity()
 
-    def _compose_full_body_pose(self, current_time: float) -> FullBodyPose:
-        """Compose primary and secondary poses into a single command pose."""
+    def _compose_full_body_pose(self, current_time: float) -> Pose:
+        """Compose primary and secondary poses into a single command pose.
+
+        Same result as ``combine_full_body``; the returned pose is reused on the next tick.
+        """
         primary = self._get_primary_pose(current_time)
-        secondary = self._get_secondary_pose()
-        return combine_full_body(primary, secondary)
+        self._profiler.lap(EVALUATE)
+        return self._command.set_composed(self._secondary, primary)
 
     def _update_primary_motion(self, current_time: float) -> None:
         """Advance queue state and idle behaviours for this tick."""
@@ -632,8 +637,10 @@ class MovementManager:
 
         return antennas_cmd
 
-    def _issue_control_command(self, head: NDArray[np.float32], antennas: Tuple[float, float], body_yaw: float) -> None:
-        """Send the fused pose to the robot with throttled error logging."""
+    def _issue_control_command(
+        self, head: NDArray[np.float32], antennas: Tuple[float, float], body_yaw: float
+    ) -> bool:
+        """Send the fused pose to the robot with throttled error logging; return whether it was accepted."""
         try:
             self.current_robot.set_target(head=head, antennas=antennas, body_yaw=body_yaw)
         except Exception as e:
@@ -647,9 +654,12 @@ class MovementManager:
                 self._last_set_target_err = now
             else:
                 self._set_target_err_suppressed += 1
-        else:
-            with self._status_lock:
-                self._last_commanded_pose = clone_full_body_pose((head, antennas, body_yaw))
+            return False
+        with self._status_lock:
+            np.copyto(self._last_commanded_head, head)
+            self._last_commanded_antennas = antennas
+            self._last_commanded_body_yaw = body_yaw
+        return True
 
     def _update_frequency_stats(
         self, loop_start: float, prev_loop_start: float, stats: LoopFrequencyStats,
@@ -665,24 +675,22 @@ class MovementManager:
             stats.min_freq = min(stats.min_freq, stats.last_freq)
         return stats
 
-    def _schedule_next_tick(self, loop_start: float, stats: LoopFrequencyStats) -> Tuple[float, LoopFrequencyStats]:
-        """Compute sleep time to maintain target frequency and update potential freq."""
+    def _update_potential_frequency(self, loop_start: float, stats: LoopFrequencyStats) -> LoopFrequencyStats:
+        """Record the frequency the loop could reach given this tick's computation time."""
         computation_time = self._now() - loop_start
         stats.potential_freq = 1.0 / computation_time if computation_time > 0 else float("inf")
-        sleep_time = max(0.0, self.target_period - computation_time)
-        return sleep_time, stats
+        return stats
 
     def _record_frequency_snapshot(self, stats: LoopFrequencyStats) -> None:
-        """Store a thread-safe snapshot of current frequency statistics."""
+        """Store a thread-safe snapshot of current frequency statistics (updated in place, no allocation)."""
+        snapshot = self._freq_snapshot
         with self._status_lock:
-            self._freq_snapshot = LoopFrequencyStats(
-                mean=stats.mean,
-                m2=stats.m2,
-                min_freq=stats.min_freq,
-                count=stats.count,
-                last_freq=stats.last_freq,
-                potential_freq=stats.potential_freq,
-            )
+            snapshot.mean = stats.mean
+            snapshot.m2 = stats.m2
+            snapshot.min_freq = stats.min_freq
+            snapshot.count = stats.count
+            snapshot.last_freq = stats.last_freq
+            snapshot.potential_freq = stats.potential_freq
 
     def _maybe_log_frequency(self, loop_count: int, print_interval_loops: int, stats: LoopFrequencyStats) -> None:
         """Emit frequency telemetry when enough loops have elapsed."""
@@ -692,25 +700,25 @@ class MovementManager:
         variance = stats.m2 / stats.count if stats.count > 0 else 0.0
         lowest = stats.min_freq if stats.min_freq != float("inf") else 0.0
         logger.debug(
-            "Loop freq - avg: %.2fHz, variance: %.4f, min: %.2fHz, last: %.2fHz, potential: %.2fHz, target: %.1fHz",
+            "Loop freq - avg: %.2fHz, variance: %.4f, min: %.2fHz, last: %.2fHz, potential: %.2fHz, target: %.1fHz, "
+            "missed deadlines: %d",
             stats.mean,
             variance,
             lowest,
             stats.last_freq,
             stats.potential_freq,
             self.target_frequency,
+            self._scheduler.missed_deadlines,
         )
         stats.reset()
 
-    def _update_face_tracking(self, current_time: float) -> None:
-        """Get face tracking offsets from camera worker thread."""
-        if self.camera_worker is not None:
-            # Get face tracking offsets from camera worker thread
-            offsets = self.camera_worker.get_face_tracking_offsets()
-            self.state.face_tracking_offsets = offsets
-        else:
-            # No camera worker, use neutral offsets
-            self.state.face_tracking_offsets = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    def _maybe_log_profile(self, loop_count: int) -> None:
+        """Log the per-stage p99 once per profiler window, when debug logging is on."""
+        if loop_count % self._profiler.capacity != 0 or not logger.isEnabledFor(logging.DEBUG):
+            return
+        summary = self._profiler.summary()
+        stages = ", ".join(f"{name}: {s['p99_us']:.1f}us" for name, s in summary["stages"].items())
+        logger.debug("Loop stage p99 - %s; worst move: %s", stages, summary["worst_move"])
 
     def start(self) -> None:
         """Start the worker thread that drives the 100 Hz control loop."""
@@ -762,10 +770,21 @@ class MovementManager:
         except Exception as e:
             logger.error(f"Failed to reset to neutral position: {e}")
 
+    def dump_flight_recorder(self, directory: Path | str, seconds: float | None = None) -> Path | None:
+        """Write the last ``seconds`` of recorded ticks to a new ``.npz`` in ``directory`` (None without a recorder).
+
+        Thread-safe: the ring is copied while the loop keeps recording.
+        """
+        if self.recorder is None:
+            return None
+        return self.recorder.dump(directory, seconds, self.target_period)
+
     def get_status(self) -> Dict[str, Any]:
         """Return a lightweight status snapshot for observability."""
         with self._status_lock:
-            pose_snapshot = clone_full_body_pose(self._last_commanded_pose)
+            pose_snapshot = clone_full_body_pose(
+                (self._last_commanded_head, self._last_commanded_antennas, self._last_commanded_body_yaw)
+            )
             freq_snapshot = LoopFrequencyStats(
                 mean=self._freq_snapshot.mean,
                 m2=self._freq_snapshot.m2,
@@ -781,6 +800,7 @@ class MovementManager:
 
         return {
             "queue_size": len(self.move_queue),
+            "move_queue": self.move_queue.stats(),
             "is_listening": self._is_listening,
             "breathing_active": self._breathing_active,
             "last_commanded_pose": {
@@ -795,55 +815,97 @@ class MovementManager:
                 "potential": freq_snapshot.potential_freq,
                 "samples": freq_snapshot.count,
             },
+            "loop_timing": {**self._scheduler.stats(), "realtime": dict(self._realtime_applied)},
+            "loop_profile": self._profiler.summary(),
+            "output": self._output.stats(),
+            "offsets": self.offsets.stats(self._now()),
+            "flight_recorder": self.recorder.stats() if self.recorder is not None else None,
         }
 
+    def _run_tick(self, loop_start: float) -> None:
+        """Run the work of one control tick (everything except timing and telemetry)."""
+        profiler = self._profiler
+        profiler.begin()
+
+        # 1) Poll external commands
+        self._poll_signals(loop_start)
+        profiler.lap(POLL_SIGNALS)
+
+        # 2) Manage the primary move queue (start new move, end finished move, breathing)
+        self._update_primary_motion(loop_start)
+        profiler.lap(PRIMARY_MOTION)
+
+        # 3) Fuse the secondary offsets (speech, face tracking, other producers) published since the last tick
+        self._update_secondary_offsets(loop_start)
+        profiler.lap(OFFSETS)
+
+        # 4) Build primary and secondary full-body poses, then fuse them (the move is timed as "evaluate")
+        pose = self._compose_full_body_pose(loop_start)
+
+        # 5) Apply listening antenna freeze or blend-back
+        antennas_cmd = self._calculate_blended_antennas(pose.antennas)
+        send = self._output.should_send(pose, antennas_cmd, loop_start)
+        profiler.lap(COMPOSE)
+
+        # 6) Single set_target call unless within the dead-band - the only control point and the only place
+        # the head becomes a matrix
+        sent = send and self._issue_control_command(pose.to_matrix(self._command_head), antennas_cmd, pose.body_yaw)
+        if sent:
+            self._output.mark_sent(pose, antennas_cmd, loop_start)
+        profiler.lap(SET_TARGET)
+
+        # 7) Flight recorder
+        if self.recorder is not None:
+            self.recorder.record(
+                loop_start,
+                self._scheduler.last_lateness_s,
+                self.state.current_move,
+                self._primary,
+                self._secondary,
+                pose,
+                antennas_cmd,
+                sent,
+            )
+        profiler.lap(RECORD)
+        profiler.end(self.state.current_move)
+
     def working_loop(self) -> None:
         """Control loop main movements - reproduces main_works.py control architecture.
 
         Single set_target() call with pose fusion.
         """
         logger.debug("Starting enhanced movement control loop (100Hz)")
+        if self._realtime_priority > 0 or self._cpus:
+            self._realtime_applied = apply_realtime_policy(self._realtime_priority, self._cpus)
 
         loop_count = 0
         prev_loop_start = self._now()
-        print_interval_loops = max(1, int(self.target_frequency * 2))
-        freq_stats = self._freq_stats
+        scheduler = self._scheduler
+        scheduler.start(prev_loop_start)
 
         while not self._stop_event.is_set():
-            loop_start = self._now()
+            # 0) Wait for this tick's deadline (returns at once the first time, or when running late)
+            loop_start = scheduler.wait()
             loop_count += 1
-
-            if loop_count > 1:
-                freq_stats = self._update_frequency_stats(loop_start, prev_loop_start, freq_stats)
+            self._loop_iteration(loop_count, loop_start, prev_loop_start)
             prev_loop_start = loop_start
 
-            # 1) Poll external commands and apply pending offsets (atomic snapshot)
-            self._poll_signals(loop_start)
-
-            # 2) Manage the primary move queue (start new move, end finished move, breathing)
-            self._update_primary_motion(loop_start)
-
-            # 3) Update vision-based secondary offsets
-            self._update_face_tracking(loop_start)
-
-            # 4) Build primary and secondary full-body poses, then fuse them
-            head, antennas, body_yaw = self._compose_full_body_pose(loop_start)
-
-            # 5) Apply listening antenna freeze or blend-back
-            antennas_cmd = self._calculate_blended_antennas(antennas)
-
-            # 6) Single set_target call - the only control point
-            self._issue_control_command(head, antennas_cmd, body_yaw)
+        logger.debug("Movement control loop stopped")
 
-            # 7) Adaptive sleep to align to next tick, then publish shared state
-            sleep_time, freq_stats = self._schedule_next_tick(loop_start, freq_stats)
-            self._publish_shared_state()
-            self._record_frequency_snapshot(freq_stats)
+    def _loop_iteration(self, loop_count: int, loop_start: float, prev_loop_start: float) -> None:
+        """Run everything ``working_loop`` does for one tick once its deadline is reached."""
+        freq_stats = self._freq_stats
+        if loop_count > 1:
+            self._update_frequency_stats(loop_start, prev_loop_start, freq_stats)
 
-            # 8) Periodic telemetry on loop frequency
-            self._maybe_log_frequency(loop_count, print_interval_loops, freq_stats)
+        # 1-6) Commands, move queue, offsets, fusion and the single set_target call
+        self._run_tick(loop_start)
 
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        # 7) Record the tick's cost, then publish shared state
+        self._update_potential_frequency(loop_start, freq_stats)
+        self._publish_shared_state()
+        self._record_frequency_snapshot(freq_stats)
 
-        logger.debug("Movement control loop stopped")
+        # 8) Periodic telemetry on loop frequency (every 2 s)
+        self._maybe_log_frequency(loop_count, self._print_interval_loops, freq_stats)
+        self._maybe_log_profile(loop_count)
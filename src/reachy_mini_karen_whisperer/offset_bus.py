@@ -0,0 +1,185 @@
+"""Named channels of additive secondary offsets, fused once per control tick.
+
+Speech sway and face tracking used to have their own lock, pending pose and
+dirty flag in ``MovementManager``, and adding a producer (a listening tilt, a
+gaze aversion) meant adding another set and another step to the loop.
+``OffsetBus`` replaces them with a registry of ``OffsetChannel`` objects:
+
+- a producer registers a channel once and then calls ``publish()`` from its own
+  thread; the control loop does not change;
+- each channel has a weight, a clamp on its rotation and translation, and an
+  optional staleness decay: its contribution is held for ``hold_s`` after the
+  last publish, then faded linearly to zero over ``decay_s``, so a producer
+  that stops publishing (an interrupted response) does not leave the head offset;
+- ``publish()`` is lock-free: it builds an immutable ``(timestamp, values)``
+  sample and stores it with a single reference assignment, which is atomic in
+  CPython. The loop only reads that reference, so neither side ever waits.
+
+Offsets are kept as 9-value rows (head rotation vector, head translation,
+antennas, body yaw) in one preallocated array. On each tick ``fuse()`` copies
+in the rows of channels that published, updates the weights and, only when
+one of them changed, sums the rows with a single ``np.dot``. Summing rotation
+vectors matches composing the rotations to first order, which is exact enough
+for offsets of a few degrees.
+"""
+
+from __future__ import annotations
+import math
+import threading
+from typing import Any, Dict, List, Tuple, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from reachy_mini_karen_whisperer.pose import Pose, Offsets
+
+
+OFFSET_SIZE = 9  # rotation vector (3), translation (3), antennas (2), body yaw (1)
+MAX_CHANNELS = 16
+_ZERO: Tuple[float, ...] = (0.0,) * OFFSET_SIZE
+
+
+class OffsetChannel:
+    """One producer's additive offset, published from any thread."""
+
+    def __init__(
+        self,
+        name: str,
+        weight: float = 1.0,
+        hold_s: Optional[float] = None,
+        decay_s: float = 0.0,
+        max_translation_m: float = math.inf,
+        max_rotation_rad: float = math.inf,
+        marks_activity: bool = False,
+    ) -> None:
+        """Configure the channel; ``hold_s`` None keeps the last offset forever (no staleness decay).
+
+        ``marks_activity`` makes each new offset count as robot activity, which
+        postpones idle breathing.
+        """
+        self.name = name
+        self.weight = weight
+        self.hold_s = hold_s
+        self.decay_s = max(0.0, decay_s)
+        self.max_translation_m = max_translation_m
+        self.max_rotation_rad = max_rotation_rad
+        self.marks_activity = marks_activity
+        self.publishes = 0
+        # (timestamp or None, values); replaced as a whole, never mutated
+        self._sample: Tuple[Optional[float], Tuple[float, ...]] = (None, _ZERO)
+
+    def publish(self, offset: Pose | Offsets, timestamp: Optional[float] = None) -> None:
+        """Publish a new offset, as a ``Pose`` or (x, y, z, roll, pitch, yaw) in metres and radians.
+
+        ``timestamp`` (on the control loop's monotonic clock) dates the offset for
+        the staleness decay; by default it is the tick that first sees it.
+        """
+        pose = offset if isinstance(offset, Pose) else Pose.from_offsets(*offset)
+        rx, ry, rz = pose.as_rotation_vector()
+        x, y, z, antenna0, antenna1, body_yaw = pose.data[4:].tolist()
+        angle = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if angle > self.max_rotation_rad:
+            scale = self.max_rotation_rad / angle
+            rx, ry, rz = rx * scale, ry * scale, rz * scale
+        distance = math.sqrt(x * x + y * y + z * z)
+        if distance > self.max_translation_m:
+            scale = self.max_translation_m / distance
+            x, y, z = x * scale, y * scale, z * scale
+        self._sample = (timestamp, (rx, ry, rz, x, y, z, antenna0, antenna1, body_yaw))
+        self.publishes += 1
+
+    def clear(self) -> None:
+        """Publish a zero offset."""
+        self._sample = (None, _ZERO)
+        self.publishes += 1
+
+    def staleness(self, age: float) -> float:
+        """Return the decay factor (1 = fresh, 0 = expired) for an offset published ``age`` seconds ago."""
+        hold = self.hold_s
+        if hold is None or age <= hold:
+            return 1.0
+        if self.decay_s <= 0.0:
+            return 0.0
+        return max(0.0, 1.0 - (age - hold) / self.decay_s)
+
+
+class OffsetBus:
+    """Registry of offset channels and their fusion into one secondary pose."""
+
+    def __init__(self) -> None:
+        """Allocate room for ``MAX_CHANNELS`` channels."""
+        self._lock = threading.Lock()  # registration only; fuse() never takes it
+        self._values: NDArray[np.float64] = np.zeros((MAX_CHANNELS, OFFSET_SIZE))
+        self._weights: NDArray[np.float64] = np.zeros(MAX_CHANNELS)
+        self._fused: NDArray[np.float64] = np.zeros(OFFSET_SIZE)
+        # Channels with views on their rows, swapped as one reference when a channel registers
+        self._registry: Tuple[Tuple[OffsetChannel, ...], NDArray[np.float64], NDArray[np.float64]] = (
+            (),
+            self._weights[:0],
+            self._values[:0],
+        )
+        # Worker-side state per channel: last sample seen, its timestamp and the last weight applied
+        self._seen: List[Any] = [None] * MAX_CHANNELS
+        self._stamps: List[float] = [0.0] * MAX_CHANNELS
+        self._applied: List[float] = [0.0] * MAX_CHANNELS
+
+    def register(self, name: str, **options: Any) -> OffsetChannel:
+        """Create the channel ``name`` with ``OffsetChannel`` options; raise ValueError if it exists or the bus is full."""
+        with self._lock:
+            channels = self._registry[0]
+            if any(channel.name == name for channel in channels):
+                raise ValueError(f"Offset channel {name!r} is already registered")
+            if len(channels) >= MAX_CHANNELS:
+                raise ValueError(f"Offset bus is full ({MAX_CHANNELS} channels)")
+            channel = OffsetChannel(name, **options)
+            n = len(channels) + 1
+            self._registry = (channels + (channel,), self._weights[:n], self._values[:n])
+        return channel
+
+    def get(self, name: str) -> Optional[OffsetChannel]:
+        """Return the channel ``name``, or None."""
+        return next((channel for channel in self._registry[0] if channel.name == name), None)
+
+    def fuse(self, now: float, out: Pose) -> bool:
+        """Write the weighted sum of all channels at time ``now`` into ``out`` when it changed.
+
+        Returns True when a channel with ``marks_activity`` published since the last call.
+        Must only be called from one thread (the control loop).
+        """
+        channels, weights, values = self._registry
+        seen = self._seen
+        stamps = self._stamps
+        applied = self._applied
+        changed = False
+        activity = False
+        for i, channel in enumerate(channels):
+            sample = channel._sample
+            if sample is not seen[i]:
+                seen[i] = sample
+                timestamp, row = sample
+                stamps[i] = now if timestamp is None else timestamp
+                values[i] = row
+                changed = True
+                activity = activity or channel.marks_activity
+            weight = channel.weight * channel.staleness(now - stamps[i])
+            if weight != applied[i]:
+                applied[i] = weight
+                weights[i] = weight
+                changed = True
+        if changed:
+            np.dot(weights, values, out=self._fused)
+            out.set_rotation_vector(*self._fused.tolist())
+        return activity
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        """Return, per channel, its weight, the weight last applied, publish count and age of its offset."""
+        channels = self._registry[0]
+        return {
+            channel.name: {
+                "weight": channel.weight,
+                "applied_weight": round(self._applied[i], 3),
+                "publishes": channel.publishes,
+                "age_s": round(now - self._stamps[i], 3) if self._seen[i] is not None else None,
+            }
+            for i, channel in enumerate(channels)
+        }
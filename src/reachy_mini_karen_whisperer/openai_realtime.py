@@ -1,11 +1,13 @@
 import json
+import time
 import base64
 import random
 import asyncio
 import logging
-from typing import Any, Final, Tuple, Literal, Optional
+from typing import Any, Dict, Final, Tuple, Literal, Callable, Optional, Awaitable, NamedTuple
 from pathlib import Path
 from datetime import datetime
+from collections import deque
 
 import cv2
 import numpy as np
@@ -16,12 +18,27 @@ from numpy.typing import NDArray
 from scipy.signal import resample
 from websockets.exceptions import ConnectionClosedError
 
+from reachy_mini_karen_whisperer import turn_latency
 from reachy_mini_karen_whisperer.config import config
 from reachy_mini_karen_whisperer.prompts import get_session_voice, get_session_instructions
+from reachy_mini_karen_whisperer.idle_engine import IdleBehaviourEngine
+from reachy_mini_karen_whisperer.session_host import RobotLease
+from reachy_mini_karen_whisperer.loop_watchdog import monitor_running_loop
+from reachy_mini_karen_whisperer.realtime_replay import RealtimeRecorder, RecordingConnection, new_recording_base
+from reachy_mini_karen_whisperer.realtime_standby import StandbySession, open_standby
 from reachy_mini_karen_whisperer.tools.core_tools import (
     ToolDependencies,
     get_tool_specs,
     dispatch_tool_call,
+    get_expected_latency,
+)
+from reachy_mini_karen_whisperer.audio.filler_cache import FillerCache, FillerPlayback
+from reachy_mini_karen_whisperer.conversation_context import ConversationContext
+from reachy_mini_karen_whisperer.audio.playback_cursor import PlaybackCursor
+from reachy_mini_karen_whisperer.conversation_transcript import (
+    ConversationTranscript,
+    seed_item,
+    resume_note_item,
 )
 
 
@@ -29,6 +46,61 @@ logger = logging.getLogger(__name__)
 
 OPEN_AI_INPUT_SAMPLE_RATE: Final[Literal[24000]] = 24000
 OPEN_AI_OUTPUT_SAMPLE_RATE: Final[Literal[24000]] = 24000
+BARGE_IN_TARGET_MS = 100.0
+STANDBY_CHECK_INTERVAL_S = 2.0
+STANDBY_RETRY_DELAY_S = 30.0
+FILLER_CHUNK_MS = 40.0
+TOOL_LATENCY_EWMA_ALPHA = 0.3
+SESSION_UPDATED_TIMEOUT_S = 3.0
+
+
+def _session_fields(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields that a personality switch may change from a session config."""
+    audio = cfg.get("audio") or {}
+    return {
+        "instructions": cfg.get("instructions"),
+        "tools": (cfg.get("tools"), cfg.get("tool_choice")),
+        "turn_detection": (audio.get("input") or {}).get("turn_detection"),
+        "voice": (audio.get("output") or {}).get("voice"),
+    }
+
+
+def diff_session_config(current: Dict[str, Any] | None, target: Dict[str, Any]) -> list[str]:
+    """Return the names of switchable fields that differ between two session configs."""
+    if current is None:
+        return list(_session_fields(target))
+    cur, tgt = _session_fields(current), _session_fields(target)
+    return [name for name in tgt if cur.get(name) != tgt[name]]
+
+
+def partial_session_update(target: Dict[str, Any], fields: list[str]) -> Dict[str, Any]:
+    """Build a ``session.update`` payload carrying only ``fields`` from ``target``."""
+    update: Dict[str, Any] = {"type": "realtime"}
+    audio: Dict[str, Any] = {}
+    if "instructions" in fields:
+        update["instructions"] = target["instructions"]
+    if "tools" in fields:
+        update["tools"] = target["tools"]
+        update["tool_choice"] = target["tool_choice"]
+    if "turn_detection" in fields:
+        audio["input"] = {"turn_detection": target["audio"]["input"]["turn_detection"]}
+    if "voice" in fields:
+        audio["output"] = {"voice": target["audio"]["output"]["voice"]}
+    if audio:
+        update["audio"] = audio
+    return update
+
+
+class ResponseAudio(NamedTuple):
+    """A chunk of model response audio on ``output_queue``.
+
+    It is still a ``(sample_rate, pcm)`` tuple for fastrtc. Streams tell it
+    apart from filler clip chunks, which are plain tuples, so only response
+    audio moves the playback cursor.
+    """
+
+    sample_rate: int
+    pcm: NDArray[np.int16]
 
 
 class OpenaiRealtimeHandler(AsyncStreamHandler):
@@ -73,18 +145,73 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
         self._shutdown_requested: bool = False
         self._connected_event: asyncio.Event = asyncio.Event()
 
+        # Playback cursor, installed by streams that know what reached the speaker
+        # (LocalStream). Without it, interrupted responses are not truncated.
+        self.playback_cursor: PlaybackCursor | None = None
+        self.barge_in_latencies_ms: deque[float] = deque(maxlen=100)
+
+        # Runs tool calls; offline replay swaps in the recorded outputs (realtime_replay.RecordedToolOutputs)
+        self.dispatch_tool: Callable[[str, str, ToolDependencies], Awaitable[Dict[str, Any]]] = dispatch_tool_call
+
+        # Per-turn voice latency timeline
+        self.latency = turn_latency.LatencyTracker()
+        self._tool_followup_requested = False
+
+        # Local mirror of the server conversation, trimmed to a token budget
+        self.context = ConversationContext(
+            token_budget=config.REALTIME_CONTEXT_TOKEN_BUDGET,
+            image_ttl_s=config.REALTIME_CONTEXT_IMAGE_TTL_S,
+        )
+        # Compact transcript replayed into a new session after a reconnect
+        self.transcript = ConversationTranscript()
+        self.last_resume: Dict[str, Any] | None = None
+
+        # Idle behaviour: chosen locally unless IDLE_MODE=model
+        self.idle_engine: IdleBehaviourEngine | None = None
+        self.model_idle_calls = 0
+
+        # Filler clips masking slow tool calls, loaded per (profile, voice)
+        self._filler_cache: FillerCache | None = None
+        self._filler_cache_key: Tuple[str, str] | None = None
+        self._filler: FillerPlayback | None = None
+        self._filler_task: asyncio.Task[None] | None = None
+        self._response_had_audio = False
+        self.tool_latency_ewma_s: Dict[str, float] = {}
+        self.fillers_played = 0
+
+        # Optional warm standby connection, promoted on drop or personality switch
+        self._standby: StandbySession | None = None
+        self._standby_task: asyncio.Task[None] | None = None
+        self._dead_air_since: float | None = None
+        self.last_reconnect_gap_ms: float | None = None
+        self.sessions_served = 0  # connections that got as far as handling events
+
+        # What the live session was last configured with, for diff-based personality switches
+        self._applied_session_config: Dict[str, Any] | None = None
+        self._session_audio_produced = False
+        self._session_updated_event: asyncio.Event = asyncio.Event()
+        self.last_personality_switch: Dict[str, Any] | None = None
+
+        # Shared by all copies driving the same robot; only the holder may start a session
+        self.robot_lease: RobotLease | None = None
+
     def copy(self) -> "OpenaiRealtimeHandler":
-        """Create a copy of the handler."""
-        return OpenaiRealtimeHandler(self.deps, self.gradio_mode, self.instance_path)
+        """Create a copy of the handler (one per Gradio connection), sharing the robot lease."""
+        handler = OpenaiRealtimeHandler(self.deps, self.gradio_mode, self.instance_path)
+        handler.robot_lease = self.robot_lease
+        return handler
 
     async def apply_personality(self, profile: str | None) -> str:
         """Apply a new personality (profile) at runtime if possible.
 
         - Updates the global config's selected profile for subsequent calls.
-        - If a realtime connection is active, sends a session.update with the
-          freshly resolved instructions so the change takes effect immediately.
+        - If a realtime connection is active, diffs the new session config against
+          the applied one and sends a session.update with only the changed fields
+          (instructions, tools, turn detection, and voice before any audio).
+        - Restarts the session only when the voice changes after audio has been
+          produced, or when the live update fails.
 
-        Returns a short status message for UI feedback.
+        Returns a short status message for UI feedback, including switch latency.
         """
         try:
             # Update the in-process config value and env
@@ -96,44 +223,66 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                 "Set custom profile to %r (config=%r)", profile, getattr(_config, "REACHY_MINI_CUSTOM_PROFILE", None)
             )
 
+            started = time.perf_counter()
             try:
-                instructions = get_session_instructions()
-                voice = get_session_voice()
+                target = self._session_config()
             except BaseException as e:  # catch SystemExit from prompt loader without crashing
                 logger.error("Failed to resolve personality content: %s", e)
                 return f"Failed to apply personality: {e}"
 
-            # Attempt a live update first, then force a full restart to ensure it sticks
-            if self.connection is not None:
-                try:
-                    await self.connection.session.update(
-                        session={
-                            "type": "realtime",
-                            "instructions": instructions,
-                            "audio": {"output": {"voice": voice}},
-                        },
-                    )
-                    logger.info("Applied personality via live update: %s", profile or "built-in default")
-                except Exception as e:
-                    logger.warning("Live update failed; will restart session: %s", e)
-
-                # Force a real restart to guarantee the new instructions/voice
-                try:
-                    await self._restart_session()
-                    return "Applied personality and restarted realtime session."
-                except Exception as e:
-                    logger.warning("Failed to restart session after apply: %s", e)
-                    return "Applied personality. Will take effect on next connection."
-            else:
+            if self.connection is None:
                 logger.info(
                     "Applied personality recorded: %s (no live connection; will apply on next session)",
                     profile or "built-in default",
                 )
                 return "Applied personality. Will take effect on next connection."
+
+            changed = diff_session_config(self._applied_session_config, target)
+            # The voice is fixed once the session has produced audio
+            needs_restart = "voice" in changed and self._session_audio_produced
+            if not changed:
+                self._record_switch("none", changed, started)
+                return "Personality already active; nothing to update."
+
+            if not needs_restart:
+                try:
+                    await self._update_session_live(target, changed)
+                    ms = self._record_switch("live", changed, started)
+                    logger.info("Applied personality via live update (%s) in %.0f ms", ", ".join(changed), ms)
+                    return f"Applied personality live ({', '.join(changed)}) in {ms:.0f} ms."
+                except Exception as e:
+                    logger.warning("Live update failed; will restart session: %s", e)
+
+            try:
+                await self._restart_session()
+                ms = self._record_switch("restart", changed, started)
+                return f"Applied personality and restarted realtime session ({', '.join(changed)}) in {ms:.0f} ms."
+            except Exception as e:
+                logger.warning("Failed to restart session after apply: %s", e)
+                return "Applied personality. Will take effect on next connection."
         except Exception as e:
             logger.error("Error applying personality '%s': %s", profile, e)
             return f"Failed to apply personality: {e}"
 
+    async def _update_session_live(self, target: Dict[str, Any], changed: list[str]) -> None:
+        """Send only the changed fields and wait for the server to acknowledge them."""
+        conn = self.connection
+        if conn is None:
+            raise RuntimeError("no live connection")
+        self._session_updated_event.clear()
+        await conn.session.update(session=partial_session_update(target, changed))
+        try:
+            await asyncio.wait_for(self._session_updated_event.wait(), timeout=SESSION_UPDATED_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.warning("No session.updated within %.1fs; assuming the update applied", SESSION_UPDATED_TIMEOUT_S)
+        self._applied_session_config = target
+
+    def _record_switch(self, mode: str, changed: list[str], started: float) -> float:
+        """Remember how the last personality switch was applied and how long it took."""
+        ms = (time.perf_counter() - started) * 1000.0
+        self.last_personality_switch = {"mode": mode, "changed": changed, "ms": round(ms, 1)}
+        return ms
+
     async def _emit_debounced_partial(self, transcript: str, sequence: int) -> None:
         """Emit partial transcript after debounce delay."""
         try:
@@ -148,6 +297,19 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
 
     async def start_up(self) -> None:
         """Start the handler with minimal retries on unexpected websocket closure."""
+        if self.robot_lease is not None and not self.robot_lease.acquire(self):
+            logger.warning("Robot %s is busy with another session; not starting this one", self.robot_lease.name)
+            await self.output_queue.put(
+                AdditionalOutputs(
+                    {"role": "assistant", "content": "[error] The robot is already talking with someone else."}
+                )
+            )
+            return
+
+        if self.gradio_mode:
+            # LocalStream starts its own monitor; in Gradio the loop belongs to the server
+            monitor_running_loop(config.LOOP_LAG_THRESHOLD_MS)
+
         openai_api_key = config.OPENAI_API_KEY
         if self.gradio_mode and not openai_api_key:
             # api key was not found in .env or in the environment variables
@@ -168,40 +330,92 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                 logger.warning("OPENAI_API_KEY missing. Proceeding with a placeholder (tests/offline).")
                 openai_api_key = "DUMMY"
 
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        self.client = AsyncOpenAI(api_key=openai_api_key, websocket_base_url=config.OPENAI_WEBSOCKET_BASE_URL)
+        if config.REALTIME_WARM_STANDBY and self._standby_task is None:
+            self._standby_task = asyncio.create_task(self._maintain_standby(), name="openai-realtime-standby")
 
+        # Retries count consecutive failed connections only: a session that was up resets them,
+        # and promoting a warm standby does not use one
         max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
-            try:
-                await self._run_realtime_session()
-                # Normal exit from the session, stop retrying
-                return
-            except ConnectionClosedError as e:
-                # Abrupt close (e.g., "no close frame received or sent") → retry
-                logger.warning("Realtime websocket closed unexpectedly (attempt %d/%d): %s", attempt, max_attempts, e)
-                if attempt < max_attempts:
-                    # exponential backoff with jitter
-                    base_delay = 2 ** (attempt - 1)  # 1s, 2s, 4s, 8s, etc.
-                    jitter = random.uniform(0, 0.5)
-                    delay = base_delay + jitter
-                    logger.info("Retrying in %.1f seconds...", delay)
-                    await asyncio.sleep(delay)
-                    continue
-                raise
-            finally:
-                # never keep a stale reference
-                self.connection = None
+        attempt = 0
+        standby: StandbySession | None = None
+        try:
+            while True:
+                served = self.sessions_served
                 try:
-                    self._connected_event.clear()
-                except Exception:
-                    pass
+                    # _run_realtime_session closes the standby it is given
+                    session, standby = standby, None
+                    await self._run_realtime_session(session)
+                    # Normal exit from the session, stop retrying
+                    return
+                except ConnectionClosedError as e:
+                    # Abrupt close (e.g., "no close frame received or sent") → retry
+                    if self.sessions_served > served:
+                        attempt = 0
+                    logger.warning("Realtime websocket closed unexpectedly: %s", e)
+                    self._dead_air_since = time.monotonic()
+                    standby = await self._take_standby()
+                    if standby is not None:
+                        logger.info("Promoting warm standby session")
+                        continue
+                    attempt += 1
+                    if attempt < max_attempts:
+                        # exponential backoff with jitter
+                        base_delay = 2 ** (attempt - 1)  # 1s, 2s, 4s, 8s, etc.
+                        jitter = random.uniform(0, 0.5)
+                        delay = base_delay + jitter
+                        logger.info("Retrying in %.1f seconds (attempt %d/%d)...", delay, attempt, max_attempts)
+                        await asyncio.sleep(delay)
+                        continue
+                    raise
+        finally:
+            # Never leave a promoted standby open when giving up or being cancelled
+            if standby is not None:
+                await standby.close()
+
+    async def _take_standby(self) -> StandbySession | None:
+        """Detach the warm standby and bring it up to date with the current profile."""
+        standby, self._standby = self._standby, None
+        if standby is None:
+            return None
+        if standby.age_s >= config.REALTIME_STANDBY_MAX_LIFETIME_S:
+            await standby.close()
+            return None
+        try:
+            await standby.reconfigure(self._session_config())
+        except Exception as e:
+            logger.warning("Warm standby unusable, falling back to a new connection: %s", e)
+            await standby.close()
+            return None
+        return standby
+
+    async def _maintain_standby(self) -> None:
+        """Keep one configured spare connection open while a primary session is live."""
+        while not self._shutdown_requested:
+            standby = self._standby
+            if standby is not None and standby.age_s >= config.REALTIME_STANDBY_MAX_LIFETIME_S:
+                logger.debug("Recycling warm standby after %.0fs", standby.age_s)
+                self._standby = None
+                await standby.close()
+                standby = None
+            if standby is None and self.connection is not None:
+                try:
+                    self._standby = await open_standby(self.client, config.MODEL_NAME, self._session_config())
+                    logger.debug("Warm standby session ready")
+                except Exception as e:
+                    logger.warning("Failed to open warm standby session: %s", e)
+                    await asyncio.sleep(STANDBY_RETRY_DELAY_S)
+                    continue
+            await asyncio.sleep(STANDBY_CHECK_INTERVAL_S)
 
     async def _restart_session(self) -> None:
         """Force-close the current session and start a fresh one in background.
 
-        Does not block the caller while the new session is establishing.
+        A warm standby, when available, is promoted instead of opening a new
+        connection. Does not block the caller while the new session is establishing.
         """
         try:
+            self._dead_air_since = time.monotonic()
             if self.connection is not None:
                 try:
                     await self.connection.close()
@@ -220,7 +434,10 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                 self._connected_event.clear()
             except Exception:
                 pass
-            asyncio.create_task(self._run_realtime_session(), name="openai-realtime-restart")
+            standby = await self._take_standby()
+            if standby is not None:
+                logger.info("Restarting realtime session on warm standby")
+            asyncio.create_task(self._run_realtime_session(standby), name="openai-realtime-restart")
             try:
                 await asyncio.wait_for(self._connected_event.wait(), timeout=5.0)
                 logger.info("Realtime session restarted and connected.")
@@ -229,69 +446,123 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
         except Exception as e:
             logger.warning("_restart_session failed: %s", e)
 
-    async def _run_realtime_session(self) -> None:
-        """Establish and manage a single realtime session."""
-        async with self.client.realtime.connect(model=config.MODEL_NAME) as conn:
-            try:
-                await conn.session.update(
-                    session={
-                        "type": "realtime",
-                        "instructions": get_session_instructions(),
-                        "audio": {
-                            "input": {
-                                "format": {
-                                    "type": "audio/pcm",
-                                    "rate": self.input_sample_rate,
-                                },
-                                "transcription": {"model": "gpt-4o-transcribe", "language": "en"},
-                                "turn_detection": {
-                                    "type": "server_vad",
-                                    "interrupt_response": True,
-                                },
-                            },
-                            "output": {
-                                "format": {
-                                    "type": "audio/pcm",
-                                    "rate": self.output_sample_rate,
-                                },
-                                "voice": get_session_voice(),
-                            },
-                        },
-                        "tools": get_tool_specs(),  # type: ignore[typeddict-item]
-                        "tool_choice": "auto",
+    def _session_config(self) -> Dict[str, Any]:
+        """Build the full session configuration for the current profile."""
+        return {
+            "type": "realtime",
+            "instructions": get_session_instructions(),
+            "audio": {
+                "input": {
+                    "format": {
+                        "type": "audio/pcm",
+                        "rate": self.input_sample_rate,
                     },
-                )
-                logger.info(
-                    "Realtime session initialized with profile=%r voice=%r",
-                    getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None),
-                    get_session_voice(),
-                )
-                # If we reached here, the session update succeeded which implies the API key worked.
-                # Persist the key to a newly created .env (copied from .env.example) if needed.
-                self._persist_api_key_if_needed()
-            except Exception:
-                logger.exception("Realtime session.update failed; aborting startup")
-                return
+                    "transcription": {"model": "gpt-4o-transcribe", "language": "en"},
+                    "turn_detection": {
+                        "type": "server_vad",
+                        "interrupt_response": True,
+                    },
+                },
+                "output": {
+                    "format": {
+                        "type": "audio/pcm",
+                        "rate": self.output_sample_rate,
+                    },
+                    "voice": get_session_voice(),
+                },
+            },
+            "tools": get_tool_specs(),
+            "tool_choice": "auto",
+        }
 
-            logger.info("Realtime session updated successfully")
+    async def _run_realtime_session(self, standby: StandbySession | None = None) -> None:
+        """Establish and manage a single realtime session.
 
-            # Manage event received from the openai server
-            self.connection = conn
+        When ``standby`` is given, its already configured connection is served
+        instead of opening a new one.
+        """
+        if standby is not None:
+            self._applied_session_config = standby.session_config
+            conn, recorder = self._maybe_record(standby.connection)
             try:
-                self._connected_event.set()
-            except Exception:
-                pass
-            async for event in self.connection:
+                await self._serve_connection(conn)
+            finally:
+                if recorder is not None:
+                    recorder.close()
+                await standby.close()
+            return
+
+        async with self.client.realtime.connect(model=config.MODEL_NAME) as raw_conn:
+            conn, recorder = self._maybe_record(raw_conn)
+            try:
+                await self._run_configured_session(conn)
+            finally:
+                if recorder is not None:
+                    recorder.close()
+
+    def _maybe_record(self, conn: Any) -> Tuple[Any, RealtimeRecorder | None]:
+        """Wrap ``conn`` in a recorder when REALTIME_RECORD_DIR is set."""
+        if not config.REALTIME_RECORD_DIR:
+            return conn, None
+        try:
+            recorder = RealtimeRecorder(new_recording_base(Path(config.REALTIME_RECORD_DIR)))
+        except Exception as e:
+            logger.warning("Realtime recording disabled: %s", e)
+            return conn, None
+        logger.info("Recording realtime session to %s", recorder.base)
+        return RecordingConnection(conn, recorder), recorder
+
+    async def _run_configured_session(self, conn: Any) -> None:
+        """Configure a freshly opened connection and serve it."""
+        try:
+            session_config = self._session_config()
+            await conn.session.update(session=session_config)  # type: ignore[arg-type]
+            self._applied_session_config = session_config
+            logger.info(
+                "Realtime session initialized with profile=%r voice=%r",
+                getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None),
+                get_session_voice(),
+            )
+            # If we reached here, the session update succeeded which implies the API key worked.
+            # Persist the key to a newly created .env (copied from .env.example) if needed.
+            self._persist_api_key_if_needed()
+        except Exception:
+            logger.exception("Realtime session.update failed; aborting startup")
+            return
+
+        logger.info("Realtime session updated successfully")
+        await self._serve_connection(conn)
+
+    async def _serve_connection(self, conn: Any) -> None:
+        """Make ``conn`` the active connection and handle its server events until it closes."""
+        self.connection = conn
+        self.sessions_served += 1
+        self._session_audio_produced = False
+        self.context.reset()
+        if self.playback_cursor is not None:
+            self.playback_cursor.reset()
+        if self._dead_air_since is not None:
+            self.last_reconnect_gap_ms = (time.monotonic() - self._dead_air_since) * 1000.0
+            self._dead_air_since = None
+            logger.info("Realtime connection restored after %.0f ms without a session", self.last_reconnect_gap_ms)
+        await self._seed_from_transcript(conn)
+        try:
+            self._connected_event.set()
+        except Exception:
+            pass
+        try:
+            async for event in conn:
+                received = time.perf_counter()
                 logger.debug(f"OpenAI event: {event.type}")
                 if event.type == "input_audio_buffer.speech_started":
-                    if hasattr(self, "_clear_queue") and callable(self._clear_queue):
-                        self._clear_queue()
+                    await self._handle_barge_in(received)
                     if self.deps.head_wobbler is not None:
                         self.deps.head_wobbler.reset()
                     self.deps.movement_manager.set_listening(True)
                     logger.debug("User speech started")
 
                 if event.type == "input_audio_buffer.speech_stopped":
+                    self.latency.mark(turn_latency.SPEECH_STOPPED)
                     self.deps.movement_manager.set_listening(False)
                     logger.debug("User speech stopped - server will auto-commit with VAD")
 
@@ -302,13 +573,40 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                     "response.completed",  # text-only completion
                 ):
                     logger.debug("response completed")
+                    item_id = getattr(event, "item_id", None)
+                    if self.playback_cursor is not None and isinstance(item_id, str):
+                        self.playback_cursor.mark_done(item_id)
+
+                if event.type == "session.updated":
+                    self._session_updated_event.set()
 
                 if event.type == "response.created":
+                    self.latency.mark(turn_latency.RESPONSE_CREATED)
+                    self._response_had_audio = False
+                    self.latency.annotate("context_tokens", self.context.total_tokens)
                     logger.debug("Response created")
 
                 if event.type == "response.done":
                     # Doesn't mean the audio is done playing
+                    self.latency.response_done(expects_followup=self._tool_followup_requested)
+                    self._tool_followup_requested = False
                     logger.debug("Response done")
+                    await self._trim_context(conn)
+
+                # ---- conversation context bookkeeping ----
+                if event.type in ("conversation.item.added", "conversation.item.created", "conversation.item.done"):
+                    self.context.observe_item(getattr(event, "item", None))
+
+                if event.type == "conversation.item.deleted":
+                    item_id = getattr(event, "item_id", None)
+                    if isinstance(item_id, str):
+                        self.context.forget(item_id)
+
+                if event.type == "conversation.item.truncated":
+                    item_id = getattr(event, "item_id", None)
+                    audio_end_ms = getattr(event, "audio_end_ms", None)
+                    if isinstance(item_id, str) and isinstance(audio_end_ms, int):
+                        self.context.set_audio_length(item_id, audio_end_ms / 1000.0)
 
                 # Handle partial transcription (user speaking in real-time)
                 if event.type == "conversation.item.input_audio_transcription.partial":
@@ -333,6 +631,9 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
 
                 # Handle completed transcription (user finished speaking)
                 if event.type == "conversation.item.input_audio_transcription.completed":
+                    self.latency.mark(turn_latency.TRANSCRIPTION_COMPLETED)
+                    self.context.set_transcript(event.item_id, event.transcript)
+                    self.transcript.add_user(event.transcript)
                     logger.debug(f"User transcript: {event.transcript}")
 
                     # Cancel any pending partial emission
@@ -348,20 +649,27 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                 # Handle assistant transcription
                 if event.type in ("response.audio_transcript.done", "response.output_audio_transcript.done"):
                     logger.debug(f"Assistant transcript: {event.transcript}")
+                    self.transcript.add_assistant(event.transcript)
                     await self.output_queue.put(AdditionalOutputs({"role": "assistant", "content": event.transcript}))
 
                 # Handle audio delta
                 if event.type in ("response.audio.delta", "response.output_audio.delta"):
+                    self.latency.mark(turn_latency.FIRST_AUDIO_DELTA)
                     if self.deps.head_wobbler is not None:
                         self.deps.head_wobbler.feed(event.delta)
                     self.last_activity_time = asyncio.get_event_loop().time()
                     logger.debug("last activity time updated to %s", self.last_activity_time)
-                    await self.output_queue.put(
-                        (
-                            self.output_sample_rate,
-                            np.frombuffer(base64.b64decode(event.delta), dtype=np.int16).reshape(1, -1),
-                        ),
-                    )
+                    pcm = np.frombuffer(base64.b64decode(event.delta), dtype=np.int16).reshape(1, -1)
+                    self._response_had_audio = True
+                    self._session_audio_produced = True
+                    if self._filler is not None:
+                        pcm = self._stop_filler(crossfade_into=pcm)
+                    item_id = getattr(event, "item_id", None)
+                    if isinstance(item_id, str):
+                        self.context.add_audio(item_id, pcm.shape[1] / self.output_sample_rate)
+                        if self.playback_cursor is not None:
+                            self.playback_cursor.enqueue(item_id, pcm.shape[1])
+                    await self.output_queue.put(ResponseAudio(self.output_sample_rate, pcm))
 
                 # ---- tool-calling plumbing ----
                 if event.type == "response.function_call_arguments.done":
@@ -373,17 +681,25 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                         logger.error("Invalid tool call: tool_name=%s, args=%s", tool_name, args_json_str)
                         continue
 
+                    self.latency.mark(turn_latency.TOOL_START)
+                    if not self.is_idle_tool_call:
+                        self._maybe_start_filler(tool_name)
+                    tool_started = time.monotonic()
                     try:
-                        tool_result = await dispatch_tool_call(tool_name, args_json_str, self.deps)
+                        tool_result = await self.dispatch_tool(tool_name, args_json_str, self.deps)
                         logger.debug("Tool '%s' executed successfully", tool_name)
                         logger.debug("Tool result: %s", tool_result)
                     except Exception as e:
                         logger.error("Tool '%s' failed", tool_name)
                         tool_result = {"error": str(e)}
+                    self.latency.mark(turn_latency.TOOL_END)
+                    self._record_tool_latency(tool_name, time.monotonic() - tool_started)
+                    if not self.is_idle_tool_call:
+                        self.transcript.add_tool_result(tool_name, tool_result)
 
                     # send the tool result back
                     if isinstance(call_id, str):
-                        await self.connection.conversation.item.create(
+                        await conn.conversation.item.create(
                             item={
                                 "type": "function_call_output",
                                 "call_id": call_id,
@@ -407,7 +723,7 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                         if not isinstance(b64_im, str):
                             logger.warning("Unexpected type for b64_im: %s", type(b64_im))
                             b64_im = str(b64_im)
-                        await self.connection.conversation.item.create(
+                        await conn.conversation.item.create(
                             item={
                                 "type": "message",
                                 "role": "user",
@@ -443,8 +759,10 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                     # for other tool calls, let the robot reply out loud
                     if self.is_idle_tool_call:
                         self.is_idle_tool_call = False
+                        await self._fade_out_filler()
                     else:
-                        await self.connection.response.create(
+                        self._tool_followup_requested = True
+                        await conn.response.create(
                             response={
                                 "instructions": "Use the tool result just returned and answer concisely in speech.",
                             },
@@ -467,6 +785,157 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
                         await self.output_queue.put(
                             AdditionalOutputs({"role": "assistant", "content": f"[error] {msg}"})
                         )
+        finally:
+            # never keep a stale reference (a promoted standby may already have replaced it)
+            if self.connection is conn:
+                self.connection = None
+                try:
+                    self._connected_event.clear()
+                except Exception:
+                    pass
+
+    async def _seed_from_transcript(self, conn: Any) -> None:
+        """Replay the recent local transcript into a fresh session, within token and time budgets."""
+        budget = config.REALTIME_RESUME_TOKEN_BUDGET
+        if budget <= 0 or not len(self.transcript):
+            return
+        entries = self.transcript.select(budget, config.REALTIME_RESUME_MAX_AGE_S)
+        if not entries:
+            return
+
+        started = time.perf_counter()
+        deadline_s = config.REALTIME_RESUME_MAX_SEED_MS / 1000.0
+        sent = 0
+        tokens = 0
+        try:
+            await conn.conversation.item.create(item=resume_note_item())
+            for entry in entries:
+                if time.perf_counter() - started > deadline_s:
+                    logger.warning("Resume seeding stopped at the %.0f ms budget", config.REALTIME_RESUME_MAX_SEED_MS)
+                    break
+                await conn.conversation.item.create(item=seed_item(entry))
+                sent += 1
+                tokens += entry.tokens
+        except Exception as e:
+            logger.warning("Failed to replay conversation into new session: %s", e)
+
+        seed_ms = (time.perf_counter() - started) * 1000.0
+        self.last_resume = {"items": sent, "of": len(entries), "tokens": tokens, "seed_ms": round(seed_ms, 1)}
+        logger.info(
+            "Resumed conversation with %d/%d items (~%d tokens) in %.1f ms", sent, len(entries), tokens, seed_ms
+        )
+
+    def _record_tool_latency(self, tool_name: str, seconds: float) -> None:
+        """Update the moving average of observed tool latency."""
+        prev = self.tool_latency_ewma_s.get(tool_name)
+        a = TOOL_LATENCY_EWMA_ALPHA
+        self.tool_latency_ewma_s[tool_name] = seconds if prev is None else (1 - a) * prev + a * seconds
+
+    def _get_filler_cache(self) -> FillerCache | None:
+        """Return the filler cache for the active profile and voice, loading it on change."""
+        key = (getattr(config, "REACHY_MINI_CUSTOM_PROFILE", None) or "default", get_session_voice())
+        if key != self._filler_cache_key:
+            self._filler_cache_key = key
+            self._filler_cache = FillerCache.load(Path(config.FILLER_CACHE_DIR), *key)
+        return self._filler_cache
+
+    def _maybe_start_filler(self, tool_name: str) -> None:
+        """Start a filler clip when the tool is expected to be slower than the threshold."""
+        threshold = config.FILLER_LATENCY_THRESHOLD_S
+        if threshold <= 0 or self._filler is not None or self._response_had_audio:
+            # Disabled, already playing, or the model already said something before calling the tool
+            return
+        expected = max(get_expected_latency(tool_name), self.tool_latency_ewma_s.get(tool_name, 0.0))
+        if expected < threshold:
+            return
+        cache = self._get_filler_cache()
+        if cache is None:
+            return
+        self._filler = FillerPlayback(cache.pick(), cache.sample_rate)
+        self._filler_task = asyncio.create_task(self._play_filler(self._filler), name="filler-playback")
+        self.fillers_played += 1
+        logger.debug("Playing filler while %s runs (expected %.2fs)", tool_name, expected)
+
+    async def _play_filler(self, filler: FillerPlayback) -> None:
+        """Feed the filler clip to the output queue at real-time pace."""
+        chunk_samples = int(filler.sample_rate * FILLER_CHUNK_MS / 1000.0)
+        try:
+            while self._filler is filler:
+                chunk = filler.next_chunk(chunk_samples)
+                if chunk is None:
+                    break
+                if self.deps.head_wobbler is not None:
+                    self.deps.head_wobbler.feed(base64.b64encode(chunk.tobytes()).decode("utf-8"))
+                await self.output_queue.put((filler.sample_rate, chunk.reshape(1, -1)))
+                await asyncio.sleep(chunk.shape[0] / filler.sample_rate)
+        finally:
+            if self._filler is filler and filler.finished:
+                self._filler = None
+
+    def _stop_filler(self, crossfade_into: NDArray[np.int16] | None = None) -> Any:
+        """Stop the filler; when given the first response chunk, return it with the clip faded under it."""
+        filler, self._filler = self._filler, None
+        if self._filler_task is not None:
+            self._filler_task.cancel()
+            self._filler_task = None
+        if filler is not None and crossfade_into is not None:
+            return filler.crossfade_into(crossfade_into)
+        return crossfade_into
+
+    async def _fade_out_filler(self) -> None:
+        """End a filler that no response will follow, without a click."""
+        filler = self._filler
+        self._stop_filler()
+        tail = filler.fade_out() if filler is not None else None
+        if tail is not None and filler is not None:
+            await self.output_queue.put((filler.sample_rate, tail.reshape(1, -1)))
+
+    async def _trim_context(self, conn: Any) -> None:
+        """Delete stale images and the oldest items once the context exceeds its budget."""
+        for item_id in self.context.plan_evictions():
+            try:
+                await conn.conversation.item.delete(item_id=item_id)
+            except Exception as e:
+                logger.warning("Failed to delete conversation item %s: %s", item_id, e)
+                self.context.restore(item_id)
+
+    async def _handle_barge_in(self, speech_started_at: float) -> None:
+        """Silence playback and truncate the interrupted item to what was actually heard.
+
+        ``speech_started_at`` is when the ``speech_started`` event came off the
+        connection (``time.perf_counter``); the silencing latency is measured from it.
+        """
+        truncate_at = self.playback_cursor.interrupt_point() if self.playback_cursor is not None else None
+
+        self._stop_filler()
+        if hasattr(self, "_clear_queue") and callable(self._clear_queue):
+            self._clear_queue()
+        silenced_ms = (time.perf_counter() - speech_started_at) * 1000.0
+        self.barge_in_latencies_ms.append(silenced_ms)
+
+        if self.playback_cursor is not None:
+            self.playback_cursor.reset()
+
+        if truncate_at is not None and self.connection is not None:
+            item_id, audio_end_ms = truncate_at
+            try:
+                await self.connection.conversation.item.truncate(
+                    item_id=item_id,
+                    content_index=0,
+                    audio_end_ms=audio_end_ms,
+                )
+            except Exception as e:
+                logger.warning("Failed to truncate interrupted item %s: %s", item_id, e)
+            else:
+                logger.debug("Truncated item %s at %d ms", item_id, audio_end_ms)
+
+        log = logger.warning if silenced_ms > BARGE_IN_TARGET_MS else logger.info
+        log(
+            "Barge-in: playback silenced %.1f ms after speech_started arrived (target %.0f ms)%s",
+            silenced_ms,
+            BARGE_IN_TARGET_MS,
+            f", truncated at {truncate_at[1]} ms" if truncate_at is not None else "",
+        )
 
     # Microphone receive
     async def receive(self, frame: Tuple[int, NDArray[np.int16]]) -> None:
@@ -518,18 +987,25 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
         idle_duration = asyncio.get_event_loop().time() - self.last_activity_time
         if idle_duration > 15.0 and self.deps.movement_manager.is_idle():
             try:
-                await self.send_idle_signal(idle_duration)
+                await self._handle_idle(idle_duration)
             except Exception as e:
                 logger.warning("Idle signal skipped (connection closed?): %s", e)
                 return None
 
             self.last_activity_time = asyncio.get_event_loop().time()  # avoid repeated resets
 
-        return await wait_for_item(self.output_queue)  # type: ignore[no-any-return]
+        item = await wait_for_item(self.output_queue)
+        if self.gradio_mode and isinstance(item, ResponseAudio):
+            # fastrtc plays what emit() returns, so this is as close to "played" as Gradio mode gets
+            self.latency.mark(turn_latency.FIRST_AUDIO_PLAYED)
+        return item  # type: ignore[no-any-return]
 
     async def shutdown(self) -> None:
         """Shutdown the handler."""
         self._shutdown_requested = True
+        self._stop_filler()
+        if self.robot_lease is not None:
+            self.robot_lease.release(self)
         # Cancel any pending debounce task
         if self.partial_transcript_task and not self.partial_transcript_task.done():
             self.partial_transcript_task.cancel()
@@ -538,6 +1014,13 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
             except asyncio.CancelledError:
                 pass
 
+        if self._standby_task is not None:
+            self._standby_task.cancel()
+            self._standby_task = None
+        if self._standby is not None:
+            await self._standby.close()
+            self._standby = None
+
         if self.connection:
             try:
                 await self.connection.close()
@@ -629,6 +1112,31 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
         except Exception:
             return fallback
 
+    def _get_idle_engine(self) -> IdleBehaviourEngine | None:
+        """Create the local idle engine on first use."""
+        if self.idle_engine is None:
+            try:
+                self.idle_engine = IdleBehaviourEngine(
+                    self.deps.movement_manager,
+                    seed=config.IDLE_SEED,
+                    emotions=config.IDLE_EMOTIONS,
+                )
+            except Exception as e:
+                logger.warning("Local idle behaviour unavailable: %s", e)
+                return None
+        return self.idle_engine
+
+    async def _handle_idle(self, idle_duration: float) -> None:
+        """Play a local idle action, or ask the model when configured to."""
+        if config.IDLE_MODE == "model":
+            await self.send_idle_signal(idle_duration)
+            return
+        engine = self._get_idle_engine()
+        if engine is not None and engine.planner.actions:
+            engine.step()
+        elif config.IDLE_MODEL_FALLBACK:
+            await self.send_idle_signal(idle_duration)
+
     async def send_idle_signal(self, idle_duration: float) -> None:
         """Send an idle signal to the openai server."""
         logger.debug("Sending idle signal")
@@ -637,6 +1145,7 @@ class OpenaiRealtimeHandler(AsyncStreamHandler):
         if not self.connection:
             logger.debug("No connection, cannot send idle signal")
             return
+        self.model_idle_calls += 1
         await self.connection.conversation.item.create(
             item={
                 "type": "message",
@@ -0,0 +1,120 @@
+"""Dead-band on the movement loop's output, to skip ``set_target`` calls that change nothing.
+
+The control loop produces a command every 10 ms, but while the robot holds a
+pose (listening with frozen antennas, a face-tracking plateau, the slow part
+of a breathing cycle) consecutive commands differ by less than a servo step.
+Each ``set_target`` still goes to the daemon as a message. ``DeadbandOutput``
+compares each command with the last one actually sent and lets it through
+only when:
+
+- the head rotated by more than ``rotation_rad`` or moved by more than
+  ``translation_m`` on any axis, or
+- an antenna or the body yaw moved by more than ``joint_rad``, or
+- ``keepalive_s`` has passed since the last send.
+
+Head, antennas and body yaw are always sent together in one call, so the
+daemon never combines fields from different ticks. A slow drift still gets
+through: it is measured against the last sent command, not the previous tick.
+"""
+
+from __future__ import annotations
+import math
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from reachy_mini_karen_whisperer.pose import POSE_SIZE, Pose
+
+
+DEFAULT_TRANSLATION_M = 0.0001  # 0.1 mm
+DEFAULT_ROTATION_RAD = math.radians(0.05)  # about half an encoder step of the XL330 servos
+DEFAULT_KEEPALIVE_S = 0.5
+
+
+class DeadbandOutput:
+    """Decide which control commands are worth sending and count the rest."""
+
+    def __init__(
+        self,
+        translation_m: float = DEFAULT_TRANSLATION_M,
+        rotation_rad: float = DEFAULT_ROTATION_RAD,
+        joint_rad: float = DEFAULT_ROTATION_RAD,
+        keepalive_s: float = DEFAULT_KEEPALIVE_S,
+    ) -> None:
+        """Set the thresholds; ``keepalive_s`` <= 0 disables the filter (every command is sent)."""
+        self.translation_m = translation_m
+        self.rotation_rad = rotation_rad
+        self.joint_rad = joint_rad
+        self.keepalive_s = keepalive_s
+        self.enabled = keepalive_s > 0
+        # Rotations closer than rotation_rad have quaternions with |dot| above this
+        self._min_dot = math.cos(rotation_rad / 2.0)
+        self._last_sent = np.zeros(POSE_SIZE)  # pose data of the last command sent, with its blended antennas
+        self._last_sent_at = -math.inf
+        self._first_at: float | None = None
+        self._last_at = 0.0
+        self.sent = 0
+        self.keepalives = 0
+        self.suppressed = 0
+
+    def should_send(self, pose: Pose, antennas: Tuple[float, float], now: float) -> bool:
+        """Return True when this command differs enough from the last one sent, or a keep-alive is due."""
+        if self._first_at is None:
+            self._first_at = now
+        self._last_at = now
+        if not self.enabled:
+            return True
+        qx, qy, qz, qw, x, y, z, _, _, body_yaw = pose.data.tolist()
+        lqx, lqy, lqz, lqw, lx, ly, lz, la0, la1, lyaw = self._last_sent.tolist()
+        translation = self.translation_m
+        joint = self.joint_rad
+        if (
+            abs(qx * lqx + qy * lqy + qz * lqz + qw * lqw) < self._min_dot
+            or abs(x - lx) > translation
+            or abs(y - ly) > translation
+            or abs(z - lz) > translation
+            or abs(antennas[0] - la0) > joint
+            or abs(antennas[1] - la1) > joint
+            or abs(body_yaw - lyaw) > joint
+        ):
+            return True
+        if now - self._last_sent_at >= self.keepalive_s:
+            self.keepalives += 1
+            return True
+        self.suppressed += 1
+        return False
+
+    def mark_sent(self, pose: Pose, antennas: Tuple[float, float], now: float) -> None:
+        """Remember a command the robot accepted."""
+        last = self._last_sent
+        np.copyto(last, pose.data)
+        last[7] = antennas[0]
+        last[8] = antennas[1]
+        self._last_sent_at = now
+        self.sent += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return sent/suppressed counts and the send rate since the first command."""
+        elapsed = self._last_at - self._first_at if self._first_at is not None else 0.0
+        total = self.sent + self.suppressed
+        return {
+            "enabled": self.enabled,
+            "sent": self.sent,
+            "keepalives": self.keepalives,
+            "suppressed": self.suppressed,
+            "sent_per_min": round(self.sent * 60.0 / elapsed, 1) if elapsed > 0 else None,
+            "suppressed_ratio": round(self.suppressed / total, 3) if total else 0.0,
+        }
+
+
+def deadband_from_config() -> DeadbandOutput:
+    """Build the dead-band from ``CONTROL_DEADBAND_MM``, ``CONTROL_DEADBAND_DEG`` and ``CONTROL_KEEPALIVE_S``."""
+    from reachy_mini_karen_whisperer.config import config
+
+    angle = math.radians(config.CONTROL_DEADBAND_DEG)
+    return DeadbandOutput(
+        translation_m=config.CONTROL_DEADBAND_MM / 1000.0,
+        rotation_rad=angle,
+        joint_rad=angle,
+        keepalive_s=config.CONTROL_KEEPALIVE_S,
+    )
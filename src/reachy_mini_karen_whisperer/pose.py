@@ -0,0 +1,287 @@
+"""Compact full-body pose used inside the motion pipeline.
+
+A ``Pose`` packs the head rotation as a unit quaternion (scalar last, like
+scipy), the head translation, both antennas and the body yaw into one float64
+array of ``POSE_SIZE`` values laid out as ``CHANNELS``. The control loop
+composes and interpolates these instead of 4x4 matrices and only converts to
+a matrix for ``set_target``:
+
+- composing is a quaternion product plus sums, and renormalising the
+  quaternion replaces the SVD re-orthonormalisation of ``compose_world_offset``;
+- interpolation is a slerp of the rotation and a lerp of everything else,
+  the same geodesic path as ``linear_pose_interpolation``;
+- secondary offsets are built from (x, y, z, roll, pitch, yaw) in closed form,
+  without scipy ``Rotation`` round trips.
+
+The ``set_*`` methods overwrite the pose in place and return it, so a caller
+that keeps its poses allocates nothing per tick. The math runs on Python
+floats: for a single pose that is faster than NumPy calls on 3x3 arrays.
+"""
+
+from __future__ import annotations
+import math
+from typing import Any, Tuple, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+CHANNELS = ("qx", "qy", "qz", "qw", "x", "y", "z", "antenna0", "antenna1", "body_yaw")
+POSE_SIZE = len(CHANNELS)
+SLERP_LINEAR_THRESHOLD = 0.9995  # above this quaternion dot product, slerp falls back to a normalised lerp
+
+Offsets = Tuple[float, float, float, float, float, float]  # x, y, z (m), roll, pitch, yaw (rad)
+
+
+class Pose:
+    """Head rotation and translation, antennas and body yaw in one small float64 array."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Optional[NDArray[np.float64]] = None) -> None:
+        """Wrap ``data`` (a ``POSE_SIZE`` float64 array, not copied) or start from the identity pose."""
+        if data is None:
+            data = np.zeros(POSE_SIZE)
+            data[3] = 1.0
+        self.data = data
+
+    def __repr__(self) -> str:
+        """Show the channels by name."""
+        values = ", ".join(f"{name}={value:.4g}" for name, value in zip(CHANNELS, self.data.tolist()))
+        return f"Pose({values})"
+
+    # ---- constructors ----
+    @classmethod
+    def identity(cls) -> "Pose":
+        """Return a new neutral pose."""
+        return cls()
+
+    @classmethod
+    def from_matrix(
+        cls,
+        head: NDArray[Any],
+        antennas: Any = (0.0, 0.0),
+        body_yaw: float = 0.0,
+    ) -> "Pose":
+        """Return a new pose from a 4x4 head matrix, antennas and body yaw."""
+        return cls().set_matrix(head, antennas, body_yaw)
+
+    @classmethod
+    def from_offsets(cls, x: float, y: float, z: float, roll: float, pitch: float, yaw: float) -> "Pose":
+        """Return a new head offset, like ``create_head_pose(..., degrees=False, mm=False)``."""
+        return cls().set_offsets(x, y, z, roll, pitch, yaw)
+
+    def copy(self) -> "Pose":
+        """Return an independent copy."""
+        return Pose(self.data.copy())
+
+    # ---- accessors ----
+    @property
+    def antennas(self) -> Tuple[float, float]:
+        """Antenna positions (rad)."""
+        return (float(self.data[7]), float(self.data[8]))
+
+    @property
+    def body_yaw(self) -> float:
+        """Body yaw (rad)."""
+        return float(self.data[9])
+
+    def as_offsets(self) -> Offsets:
+        """Return the head as (x, y, z, roll, pitch, yaw) with extrinsic xyz angles, like scipy ``as_euler("xyz")``."""
+        qx, qy, qz, qw, x, y, z = self.data[:7].tolist()
+        r00 = 1.0 - 2.0 * (qy * qy + qz * qz)
+        r10 = 2.0 * (qx * qy + qz * qw)
+        r20 = 2.0 * (qx * qz - qy * qw)
+        r21 = 2.0 * (qy * qz + qx * qw)
+        r22 = 1.0 - 2.0 * (qx * qx + qy * qy)
+        pitch = math.asin(max(-1.0, min(1.0, -r20)))
+        return (x, y, z, math.atan2(r21, r22), pitch, math.atan2(r10, r00))
+
+    def as_rotation_vector(self) -> Tuple[float, float, float]:
+        """Return the head rotation as a rotation vector (axis times angle in rad, angle <= pi)."""
+        qx, qy, qz, qw = self.data[:4].tolist()
+        if qw < 0.0:
+            qx, qy, qz, qw = -qx, -qy, -qz, -qw
+        norm = math.sqrt(qx * qx + qy * qy + qz * qz)
+        if norm < 1e-12:
+            return (2.0 * qx, 2.0 * qy, 2.0 * qz)
+        scale = 2.0 * math.atan2(norm, qw) / norm
+        return (qx * scale, qy * scale, qz * scale)
+
+    def to_matrix(self, out: Optional[NDArray[np.float64]] = None) -> NDArray[np.float64]:
+        """Write the 4x4 head matrix into ``out`` (a new identity-initialised array when None) and return it.
+
+        Only the top three rows of ``out`` are written; its last row must already be [0, 0, 0, 1].
+        """
+        if out is None:
+            out = np.eye(4)
+        qx, qy, qz, qw, x, y, z = self.data[:7].tolist()
+        xx, yy, zz = 2.0 * qx * qx, 2.0 * qy * qy, 2.0 * qz * qz
+        xy, xz, yz = 2.0 * qx * qy, 2.0 * qx * qz, 2.0 * qy * qz
+        wx, wy, wz = 2.0 * qw * qx, 2.0 * qw * qy, 2.0 * qw * qz
+        out[0, 0] = 1.0 - yy - zz
+        out[0, 1] = xy - wz
+        out[0, 2] = xz + wy
+        out[1, 0] = xy + wz
+        out[1, 1] = 1.0 - xx - zz
+        out[1, 2] = yz - wx
+        out[2, 0] = xz - wy
+        out[2, 1] = yz + wx
+        out[2, 2] = 1.0 - xx - yy
+        out[0, 3] = x
+        out[1, 3] = y
+        out[2, 3] = z
+        return out
+
+    # ---- in-place setters ----
+    def set_identity(self) -> "Pose":
+        """Reset to the neutral pose."""
+        self.data.fill(0.0)
+        self.data[3] = 1.0
+        return self
+
+    def set_from(self, other: "Pose") -> "Pose":
+        """Copy ``other`` into this pose."""
+        np.copyto(self.data, other.data)
+        return self
+
+    def set_matrix(self, head: NDArray[Any], antennas: Any = (0.0, 0.0), body_yaw: float = 0.0) -> "Pose":
+        """Set from a 4x4 head matrix (rotation converted with Shepperd's method), antennas and body yaw."""
+        (r00, r01, r02, x), (r10, r11, r12, y), (r20, r21, r22, z) = head[:3].tolist()
+        trace = r00 + r11 + r22
+        if trace > 0.0:
+            s = 0.5 / math.sqrt(trace + 1.0)
+            qw, qx, qy, qz = 0.25 / s, (r21 - r12) * s, (r02 - r20) * s, (r10 - r01) * s
+        elif r00 > r11 and r00 > r22:
+            s = 2.0 * math.sqrt(1.0 + r00 - r11 - r22)
+            qw, qx, qy, qz = (r21 - r12) / s, 0.25 * s, (r01 + r10) / s, (r02 + r20) / s
+        elif r11 > r22:
+            s = 2.0 * math.sqrt(1.0 + r11 - r00 - r22)
+            qw, qx, qy, qz = (r02 - r20) / s, (r01 + r10) / s, 0.25 * s, (r12 + r21) / s
+        else:
+            s = 2.0 * math.sqrt(1.0 + r22 - r00 - r11)
+            qw, qx, qy, qz = (r10 - r01) / s, (r02 + r20) / s, (r12 + r21) / s, 0.25 * s
+        self._write_normalized(qx, qy, qz, qw, x, y, z, float(antennas[0]), float(antennas[1]), float(body_yaw))
+        return self
+
+    def set_offsets(self, x: float, y: float, z: float, roll: float, pitch: float, yaw: float) -> "Pose":
+        """Set a head offset from translation and extrinsic xyz angles; antennas and body yaw are zeroed."""
+        cr, sr = math.cos(roll * 0.5), math.sin(roll * 0.5)
+        cp, sp = math.cos(pitch * 0.5), math.sin(pitch * 0.5)
+        cy, sy = math.cos(yaw * 0.5), math.sin(yaw * 0.5)
+        d = self.data
+        d[0] = sr * cp * cy - cr * sp * sy
+        d[1] = cr * sp * cy + sr * cp * sy
+        d[2] = cr * cp * sy - sr * sp * cy
+        d[3] = cr * cp * cy + sr * sp * sy
+        d[4] = x
+        d[5] = y
+        d[6] = z
+        d[7] = 0.0
+        d[8] = 0.0
+        d[9] = 0.0
+        return self
+
+    def set_rotation_vector(
+        self,
+        rx: float,
+        ry: float,
+        rz: float,
+        x: float,
+        y: float,
+        z: float,
+        antenna0: float = 0.0,
+        antenna1: float = 0.0,
+        body_yaw: float = 0.0,
+    ) -> "Pose":
+        """Set from a head rotation vector (axis times angle, rad), translation, antennas and body yaw."""
+        angle = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if angle < 1e-8:
+            s, qw = 0.5, 1.0
+        else:
+            s, qw = math.sin(angle * 0.5) / angle, math.cos(angle * 0.5)
+        self._write_normalized(rx * s, ry * s, rz * s, qw, x, y, z, antenna0, antenna1, body_yaw)
+        return self
+
+    def set_composed(self, offset: "Pose", base: "Pose") -> "Pose":
+        """Set to ``offset`` applied to ``base`` in the world frame.
+
+        The rotation is ``offset * base`` (the offset rotates the head about its own
+        origin, in world axes) and translations, antennas and body yaw add up, as in
+        ``compose_world_offset`` and ``combine_full_body``. ``self`` may be either input.
+        """
+        ox, oy, oz, ow, otx, oty, otz, oa0, oa1, oyaw = offset.data.tolist()
+        bx, by, bz, bw, btx, bty, btz, ba0, ba1, byaw = base.data.tolist()
+        self._write_normalized(
+            ow * bx + ox * bw + oy * bz - oz * by,
+            ow * by - ox * bz + oy * bw + oz * bx,
+            ow * bz + ox * by - oy * bx + oz * bw,
+            ow * bw - ox * bx - oy * by - oz * bz,
+            otx + btx,
+            oty + bty,
+            otz + btz,
+            oa0 + ba0,
+            oa1 + ba1,
+            oyaw + byaw,
+        )
+        return self
+
+    def set_interpolated(self, start: "Pose", end: "Pose", t: float) -> "Pose":
+        """Set to the pose at fraction ``t`` from ``start`` to ``end``: slerp for the head rotation, lerp otherwise."""
+        ax, ay, az, aw, atx, aty, atz, aa0, aa1, ayaw = start.data.tolist()
+        bx, by, bz, bw, btx, bty, btz, ba0, ba1, byaw = end.data.tolist()
+        dot = ax * bx + ay * by + az * bz + aw * bw
+        if dot < 0.0:  # q and -q are the same rotation: take the short way round
+            bx, by, bz, bw, dot = -bx, -by, -bz, -bw, -dot
+        if dot > SLERP_LINEAR_THRESHOLD:
+            s0, s1 = 1.0 - t, t
+        else:
+            theta = math.acos(dot)
+            sin_theta = math.sin(theta)
+            s0, s1 = math.sin((1.0 - t) * theta) / sin_theta, math.sin(t * theta) / sin_theta
+        self._write_normalized(
+            s0 * ax + s1 * bx,
+            s0 * ay + s1 * by,
+            s0 * az + s1 * bz,
+            s0 * aw + s1 * bw,
+            atx + (btx - atx) * t,
+            aty + (bty - aty) * t,
+            atz + (btz - atz) * t,
+            aa0 + (ba0 - aa0) * t,
+            aa1 + (ba1 - aa1) * t,
+            ayaw + (byaw - ayaw) * t,
+        )
+        return self
+
+    def _write_normalized(
+        self,
+        qx: float,
+        qy: float,
+        qz: float,
+        qw: float,
+        x: float,
+        y: float,
+        z: float,
+        antenna0: float,
+        antenna1: float,
+        body_yaw: float,
+    ) -> None:
+        n = qx * qx + qy * qy + qz * qz + qw * qw
+        inv = 1.0 / math.sqrt(n) if n > 0.0 else 0.0
+        if inv == 0.0:
+            qw, inv = 1.0, 1.0
+        d = self.data
+        d[0] = qx * inv
+        d[1] = qy * inv
+        d[2] = qz * inv
+        d[3] = qw * inv
+        d[4] = x
+        d[5] = y
+        d[6] = z
+        d[7] = antenna0
+        d[8] = antenna1
+        d[9] = body_yaw
+
+
+IDENTITY_POSE = Pose()
+IDENTITY_POSE.data.flags.writeable = False
@@ -4,8 +4,9 @@ from typing import Any, Dict
 import numpy as np
 
 from reachy_mini.utils import create_head_pose
+from reachy_mini_karen_whisperer.move_queue import INTERRUPT
 from reachy_mini_karen_whisperer.tools.core_tools import Tool, ToolDependencies
-from reachy_mini_karen_whisperer.dance_emotion_moves import GotoQueueMove
+from reachy_mini_karen_whisperer.dance_emotion_moves import Keyframe, KeyframeMove
 
 
 logger = logging.getLogger(__name__)
@@ -26,9 +27,6 @@ class SweepLook(Tool):
         """Execute sweep look: left -> hold -> right -> hold -> center."""
         logger.info("Tool call: sweep_look")
 
-        # Clear any existing moves
-        deps.movement_manager.clear_move_queue()
-
         # Get current state
         current_head_pose = deps.reachy_mini.get_current_head_pose()
         head_joints, antenna_joints = deps.reachy_mini.get_current_joint_positions()
@@ -43,82 +41,28 @@ class SweepLook(Tool):
         transition_duration = 3.0  # Time to move between positions
         hold_duration = 1.0  # Time to hold at each extreme
 
-        # Move 1: Sweep to the left (positive yaw for both body and head)
+        antennas = (current_antenna1, current_antenna2)
         left_head_pose = create_head_pose(0, 0, 0, 0, 0, max_angle, degrees=False)
-        move_to_left = GotoQueueMove(
-            target_head_pose=left_head_pose,
-            start_head_pose=current_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw + max_angle,
-            start_body_yaw=current_body_yaw,
-            duration=transition_duration,
-        )
-
-        # Move 2: Hold at left position
-        hold_left = GotoQueueMove(
-            target_head_pose=left_head_pose,
-            start_head_pose=left_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw + max_angle,
-            start_body_yaw=current_body_yaw + max_angle,
-            duration=hold_duration,
-        )
-
-        # Move 3: Return to center from left (to avoid crossing pi/-pi boundary)
         center_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=False)
-        return_to_center_from_left = GotoQueueMove(
-            target_head_pose=center_head_pose,
-            start_head_pose=left_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw,
-            start_body_yaw=current_body_yaw + max_angle,
-            duration=transition_duration,
-        )
-
-        # Move 4: Sweep to the right (negative yaw for both body and head)
         right_head_pose = create_head_pose(0, 0, 0, 0, 0, -max_angle, degrees=False)
-        move_to_right = GotoQueueMove(
-            target_head_pose=right_head_pose,
-            start_head_pose=center_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw - max_angle,
-            start_body_yaw=current_body_yaw,
-            duration=transition_duration,
-        )
-
-        # Move 5: Hold at right position
-        hold_right = GotoQueueMove(
-            target_head_pose=right_head_pose,
-            start_head_pose=right_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw - max_angle,
-            start_body_yaw=current_body_yaw - max_angle,
-            duration=hold_duration,
-        )
-
-        # Move 6: Return to center from right
-        return_to_center_final = GotoQueueMove(
-            target_head_pose=center_head_pose,
-            start_head_pose=right_head_pose,
-            target_antennas=(current_antenna1, current_antenna2),
-            start_antennas=(current_antenna1, current_antenna2),
-            target_body_yaw=current_body_yaw,  # Return to original body yaw
-            start_body_yaw=current_body_yaw - max_angle,
-            duration=transition_duration,
-        )
 
-        # Queue all moves in sequence
-        deps.movement_manager.queue_move(move_to_left)
-        deps.movement_manager.queue_move(hold_left)
-        deps.movement_manager.queue_move(return_to_center_from_left)
-        deps.movement_manager.queue_move(move_to_right)
-        deps.movement_manager.queue_move(hold_right)
-        deps.movement_manager.queue_move(return_to_center_final)
+        # One move for the whole gesture: left (positive yaw for both body and head), hold, back through
+        # center (to avoid crossing the pi/-pi boundary), right, hold, center. Equal consecutive keyframes
+        # are holds; the head keeps its speed through center instead of stopping there.
+        t = 0.0
+        keyframes = [Keyframe(t, current_head_pose, antennas, current_body_yaw)]
+        for head_pose, body_yaw, duration in [
+            (left_head_pose, current_body_yaw + max_angle, transition_duration),
+            (left_head_pose, current_body_yaw + max_angle, hold_duration),
+            (center_head_pose, current_body_yaw, transition_duration),
+            (right_head_pose, current_body_yaw - max_angle, transition_duration),
+            (right_head_pose, current_body_yaw - max_angle, hold_duration),
+            (center_head_pose, current_body_yaw, transition_duration),  # Return to original body yaw
+        ]:
+            t += duration
+            keyframes.append(Keyframe(t, head_pose, antennas, body_yaw))
+        # Replaces any queued or playing moves
+        deps.movement_manager.queue_move(KeyframeMove(keyframes), INTERRUPT)
 
         # Calculate total duration and mark as moving
         total_duration = transition_duration * 4 + hold_duration * 2
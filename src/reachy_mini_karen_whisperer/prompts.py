@@ -1,7 +1,13 @@
+import os
 import re
 import sys
+import time
+import hashlib
 import logging
+import threading
+from typing import Dict, List, Tuple, Optional
 from pathlib import Path
+from dataclasses import dataclass
 
 from reachy_mini_karen_whisperer.config import config
 
@@ -13,92 +19,267 @@ PROFILES_DIRECTORY = Path(__file__).parent / "profiles"
 PROMPTS_LIBRARY_DIRECTORY = Path(__file__).parent / "prompts"
 INSTRUCTIONS_FILENAME = "instructions.txt"
 VOICE_FILENAME = "voice.txt"
+TOOLS_FILENAME = "tools.txt"
+USER_PROFILES_DIRNAME = "user_personalities"
+DEFAULT_VOICE = "cedar"
+MAX_INCLUDE_DEPTH = 8
+# Minimum delay between two mtime checks of a cached bundle
+VALIDATE_INTERVAL_S = 1.0
 
+_INCLUDE_PATTERN = re.compile(r"^\[([a-zA-Z0-9/_-]+)\]$")
 
-def _expand_prompt_includes(content: str) -> str:
+
+class ProfileError(Exception):
+    """Raised when a profile cannot be compiled."""
+
+
+@dataclass(frozen=True)
+class ProfileBundle:
+    """Everything a session needs from a profile, resolved once.
+
+    ``sources`` lists every file the bundle was built from (including files
+    that were missing, with mtime None) so that the cache can be invalidated
+    when any of them changes.
+    """
+
+    profile: Optional[str]
+    instructions: str
+    voice: Optional[str]
+    tools: Optional[Tuple[str, ...]]
+    spec_hash: str
+    sources: Tuple[Tuple[Path, Optional[float]], ...]
+
+
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _expand_prompt_includes(
+    content: str,
+    sources: Optional[Dict[Path, Optional[float]]] = None,
+    _stack: Tuple[str, ...] = (),
+) -> str:
     """Expand [<name>] placeholders with content from prompts library files.
 
+    Included files are expanded recursively; a cycle or an include nested
+    deeper than ``MAX_INCLUDE_DEPTH`` keeps its placeholder.
+
     Args:
         content: The template content with [<name>] placeholders
+        sources: Optional mapping filled with every include file consulted and its mtime
 
     Returns:
         Expanded content with placeholders replaced by file contents
 
     """
-    # Pattern to match [<name>] where name is a valid file stem (alphanumeric, underscores, hyphens)
-    # pattern = re.compile(r'^\[([a-zA-Z0-9_-]+)\]$')
-    # Allow slashes for subdirectories
-    pattern = re.compile(r'^\[([a-zA-Z0-9/_-]+)\]$')
-
-    lines = content.split('\n')
+    lines = content.split("\n")
     expanded_lines = []
 
     for line in lines:
-        stripped = line.strip()
-        match = pattern.match(stripped)
+        match = _INCLUDE_PATTERN.match(line.strip())
+        if not match:
+            expanded_lines.append(line)
+            continue
 
-        if match:
-            # Extract the name from [<name>]
-            template_name = match.group(1)
-            template_file = PROMPTS_LIBRARY_DIRECTORY / f"{template_name}.txt"
+        # Extract the name from [<name>]; slashes select subdirectories
+        template_name = match.group(1)
+        template_file = PROMPTS_LIBRARY_DIRECTORY / f"{template_name}.txt"
+        if sources is not None:
+            sources[template_file] = _mtime(template_file)
 
-            try:
-                if template_file.exists():
-                    template_content = template_file.read_text(encoding="utf-8").rstrip()
-                    expanded_lines.append(template_content)
-                    logger.debug("Expanded template: [%s]", template_name)
-                else:
-                    logger.warning("Template file not found: %s, keeping placeholder", template_file)
-                    expanded_lines.append(line)
-            except Exception as e:
-                logger.warning("Failed to read template '%s': %s, keeping placeholder", template_name, e)
+        if template_name in _stack or len(_stack) >= MAX_INCLUDE_DEPTH:
+            logger.warning("Include cycle or depth limit at [%s], keeping placeholder", template_name)
+            expanded_lines.append(line)
+            continue
+        try:
+            if template_file.exists():
+                template_content = template_file.read_text(encoding="utf-8").rstrip()
+                expanded_lines.append(_expand_prompt_includes(template_content, sources, (*_stack, template_name)))
+                logger.debug("Expanded template: [%s]", template_name)
+            else:
+                logger.warning("Template file not found: %s, keeping placeholder", template_file)
                 expanded_lines.append(line)
-        else:
+        except Exception as e:
+            logger.warning("Failed to read template '%s': %s, keeping placeholder", template_name, e)
             expanded_lines.append(line)
 
-    return '\n'.join(expanded_lines)
+    return "\n".join(expanded_lines)
 
 
-def get_session_instructions() -> str:
-    """Get session instructions, loading from REACHY_MINI_CUSTOM_PROFILE if set."""
-    profile = config.REACHY_MINI_CUSTOM_PROFILE
+def _read_tool_names(path: Path) -> List[str]:
+    """Parse a tools.txt file (skip comments and blank lines)."""
+    names = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            names.append(line)
+    return names
+
+
+def compile_profile(profile: Optional[str]) -> ProfileBundle:
+    """Resolve instructions (with includes), voice and tool list of ``profile``.
+
+    ``None`` selects the built-in default prompt and the ``default`` tool list.
+    """
+    sources: Dict[Path, Optional[float]] = {}
     if not profile:
-        logger.info(f"Loading default prompt from {PROMPTS_LIBRARY_DIRECTORY / 'default_prompt.txt'}")
         instructions_file = PROMPTS_LIBRARY_DIRECTORY / "default_prompt.txt"
+        profile_dir = PROFILES_DIRECTORY / "default"
+        voice_file = None
     else:
-        logger.info(f"Loading prompt from profile '{profile}'")
-        instructions_file = PROFILES_DIRECTORY / profile / INSTRUCTIONS_FILENAME
+        profile_dir = PROFILES_DIRECTORY / profile
+        instructions_file = profile_dir / INSTRUCTIONS_FILENAME
+        voice_file = profile_dir / VOICE_FILENAME
+    tools_file = profile_dir / TOOLS_FILENAME
+
+    sources[instructions_file] = _mtime(instructions_file)
+    if sources[instructions_file] is None:
+        raise ProfileError(f"Profile {profile} has no {INSTRUCTIONS_FILENAME}")
+    try:
+        raw = instructions_file.read_text(encoding="utf-8").strip()
+    except Exception as e:
+        raise ProfileError(f"Failed to load instructions from profile '{profile}': {e}") from e
+    if not raw:
+        raise ProfileError(f"Profile '{profile}' has empty {INSTRUCTIONS_FILENAME}")
+    instructions = _expand_prompt_includes(raw, sources)
+
+    voice: Optional[str] = None
+    if voice_file is not None:
+        sources[voice_file] = _mtime(voice_file)
+        if sources[voice_file] is not None:
+            try:
+                voice = voice_file.read_text(encoding="utf-8").strip() or None
+            except Exception:
+                voice = None
+
+    tools: Optional[Tuple[str, ...]] = None
+    sources[tools_file] = _mtime(tools_file)
+    if sources[tools_file] is not None:
+        try:
+            tools = tuple(_read_tool_names(tools_file))
+        except Exception as e:
+            logger.warning("Failed to read %s: %s", tools_file, e)
+
+    digest = hashlib.sha1()
+    for part in (instructions, voice or "", "\n".join(tools or ())):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return ProfileBundle(
+        profile=profile or None,
+        instructions=instructions,
+        voice=voice,
+        tools=tools,
+        spec_hash=digest.hexdigest(),
+        sources=tuple(sources.items()),
+    )
+
+
+class _BundleCache:
+    """Compiled bundles keyed by profile, revalidated against file mtimes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bundles: Dict[Optional[str], Tuple[ProfileBundle, float]] = {}
+        self._profiles: Optional[Tuple[Tuple[Tuple[Path, Optional[float]], ...], List[str]]] = None
+        self.hits = 0
+        self.compiles = 0
+
+    def get(self, profile: Optional[str]) -> ProfileBundle:
+        key = profile or None
+        now = time.monotonic()
+        with self._lock:
+            cached = self._bundles.get(key)
+            if cached is not None:
+                bundle, checked_at = cached
+                fresh = now - checked_at < VALIDATE_INTERVAL_S
+                if not fresh and all(_mtime(p) == m for p, m in bundle.sources):
+                    self._bundles[key] = (bundle, now)
+                    fresh = True
+                if fresh:
+                    self.hits += 1
+                    return bundle
+        bundle = compile_profile(key)
+        with self._lock:
+            self._bundles[key] = (bundle, now)
+            self.compiles += 1
+        logger.debug("Compiled profile bundle %r (%s)", key, bundle.spec_hash[:8])
+        return bundle
+
+    def list_profiles(self) -> List[str]:
+        user_dir = PROFILES_DIRECTORY / USER_PROFILES_DIRNAME
+        with self._lock:
+            cached = self._profiles
+        if cached is not None and all(_mtime(p) == m for p, m in cached[0]):
+            return list(cached[1])
+
+        names: List[str] = []
+        stamps: Dict[Path, Optional[float]] = {
+            PROFILES_DIRECTORY: _mtime(PROFILES_DIRECTORY),
+            user_dir: _mtime(user_dir),
+        }
+        for root, prefix in ((PROFILES_DIRECTORY, ""), (user_dir, f"{USER_PROFILES_DIRNAME}/")):
+            if stamps[root] is None:
+                continue
+            try:
+                for p in sorted(root.iterdir()):
+                    if p.name == USER_PROFILES_DIRNAME or not p.is_dir():
+                        continue
+                    stamps[p] = _mtime(p)  # adding/removing instructions.txt touches the directory
+                    if (p / INSTRUCTIONS_FILENAME).exists():
+                        names.append(f"{prefix}{p.name}")
+            except Exception:
+                pass
+        with self._lock:
+            self._profiles = (tuple(stamps.items()), names)
+        return list(names)
+
+
+_CACHE = _BundleCache()
+
+
+def get_profile_bundle(profile: Optional[str]) -> ProfileBundle:
+    """Return the compiled bundle of ``profile``, recompiling only when its files changed.
 
+    Raises ProfileError when the profile cannot be compiled.
+    """
+    return _CACHE.get(profile)
+
+
+def get_current_profile_bundle() -> ProfileBundle:
+    """Return the compiled bundle of the currently selected profile."""
+    return _CACHE.get(config.REACHY_MINI_CUSTOM_PROFILE)
+
+
+def list_profiles() -> List[str]:
+    """List profile names with an instructions file (user profiles prefixed), cached by directory mtimes."""
+    return _CACHE.list_profiles()
+
+
+def get_session_instructions() -> str:
+    """Get session instructions, loading from REACHY_MINI_CUSTOM_PROFILE if set."""
+    profile = config.REACHY_MINI_CUSTOM_PROFILE
     try:
-        if instructions_file.exists():
-            instructions = instructions_file.read_text(encoding="utf-8").strip()
-            if instructions:
-                # Expand [<name>] placeholders with content from prompts library
-                expanded_instructions = _expand_prompt_includes(instructions)
-                return expanded_instructions
-            logger.error(f"Profile '{profile}' has empty {INSTRUCTIONS_FILENAME}")
-            sys.exit(1)
-        logger.error(f"Profile {profile} has no {INSTRUCTIONS_FILENAME}")
+        return get_current_profile_bundle().instructions
+    except ProfileError as e:
+        logger.error(str(e))
         sys.exit(1)
     except Exception as e:
         logger.error(f"Failed to load instructions from profile '{profile}': {e}")
         sys.exit(1)
 
 
-def get_session_voice(default: str = "cedar") -> str:
+def get_session_voice(default: str = DEFAULT_VOICE) -> str:
     """Resolve the voice to use for the session.
 
     If a custom profile is selected and contains a voice.txt, return its
     trimmed content; otherwise return the provided default ("cedar").
     """
-    profile = config.REACHY_MINI_CUSTOM_PROFILE
-    if not profile:
+    if not config.REACHY_MINI_CUSTOM_PROFILE:
         return default
     try:
-        voice_file = PROFILES_DIRECTORY / profile / VOICE_FILENAME
-        if voice_file.exists():
-            voice = voice_file.read_text(encoding="utf-8").strip()
-            return voice or default
+        return get_current_profile_bundle().voice or default
     except Exception:
-        pass
-    return default
+        return default
@@ -0,0 +1,426 @@
+"""Record and replay realtime sessions offline.
+
+Recording
+    ``RecordingConnection`` wraps a live realtime connection. Every inbound
+    server event and every outbound client call is appended to
+    ``<base>.jsonl.zst`` (plain ``<base>.jsonl`` when ``zstandard`` is not
+    installed) with a monotonic timestamp relative to the session start. Audio
+    is not base64-encoded in the log: it goes to raw int16 PCM sidecars
+    (``<base>.in.pcm`` for microphone appends, ``<base>.out.pcm`` for response
+    deltas) and the record keeps ``{"pcm": "in"|"out", "offset", "length"}``.
+
+Replay
+    ``ReplayClient`` is a drop-in for ``AsyncOpenAI`` as far as the handler is
+    concerned: ``client.realtime.connect(model=...)`` yields a
+    ``ReplayConnection`` that plays the recorded server events back (at real
+    time, scaled by ``speed``, or as fast as possible with ``speed=0``) and
+    collects what the handler sends in ``sent``. Assign it to
+    ``handler.client`` and await ``handler._run_realtime_session()``.
+
+    Tools are not run on replay: ``RecordedToolOutputs``, assigned to
+    ``handler.dispatch_tool``, answers each tool call with the
+    ``function_call_output`` recorded for it, so replaying a session never
+    posts an escalation or writes files again.
+
+Command line (throughput benchmark of the handler event loop)::
+
+    python -m reachy_mini_karen_whisperer.realtime_replay recordings/session-20250101-120000-4242-1 --speed 0
+"""
+
+from __future__ import annotations
+import io
+import os
+import sys
+import json
+import time
+import base64
+import asyncio
+import logging
+import argparse
+import itertools
+from typing import IO, Any, Dict, List, Tuple, Iterator, Optional
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+INBOUND = "in"
+OUTBOUND = "out"
+OUTPUT_AUDIO_EVENTS = ("response.audio.delta", "response.output_audio.delta")
+INPUT_AUDIO_CALL = "input_audio_buffer.append"
+_RECORDING_SEQ = itertools.count(1)
+
+
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    if isinstance(obj, dict):
+        return obj
+    dump = getattr(obj, "model_dump", None)
+    if callable(dump):
+        out = dump(exclude_none=True)
+        if isinstance(out, dict):
+            return out
+    return {"repr": repr(obj)}
+
+
+def log_path(base: Path, for_writing: bool = False) -> Path:
+    """Return the event log path of a recording (compressed when zstandard is available)."""
+    zst = base.with_name(base.name + ".jsonl.zst")
+    if for_writing:
+        return zst if ZSTD_AVAILABLE else base.with_name(base.name + ".jsonl")
+    return zst if zst.exists() else base.with_name(base.name + ".jsonl")
+
+
+class RealtimeRecorder:
+    """Append realtime traffic to a compressed JSONL log with PCM sidecars."""
+
+    def __init__(self, base: Path) -> None:
+        """Create the log and sidecar files for ``base`` (parent directories included)."""
+        base.parent.mkdir(parents=True, exist_ok=True)
+        self.base = base
+        self._t0 = time.monotonic()
+        self._raw: IO[bytes] = open(log_path(base, for_writing=True), "wb")
+        self._log: Any = zstandard.ZstdCompressor(level=3).stream_writer(self._raw) if ZSTD_AVAILABLE else self._raw
+        self._pcm: Dict[str, IO[bytes]] = {
+            INBOUND: open(base.with_name(base.name + ".in.pcm"), "wb"),
+            OUTBOUND: open(base.with_name(base.name + ".out.pcm"), "wb"),
+        }
+        self.records = 0
+        self._closed = False
+
+    def _write_pcm(self, stream: str, b64: str) -> Dict[str, Any]:
+        data = base64.b64decode(b64)
+        f = self._pcm[stream]
+        offset = f.tell()
+        f.write(data)
+        return {"pcm": stream, "offset": offset, "length": len(data)}
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        record["t"] = round(time.monotonic() - self._t0, 6)
+        self._log.write(json.dumps(record, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+        self.records += 1
+
+    def record_event(self, event: Any) -> None:
+        """Record an inbound server event."""
+        payload = dict(_to_dict(event))
+        if payload.get("type") in OUTPUT_AUDIO_EVENTS and isinstance(payload.get("delta"), str):
+            payload["delta"] = self._write_pcm(OUTBOUND, payload["delta"])
+        self._append({"dir": INBOUND, "event": payload})
+
+    def record_call(self, method: str, kwargs: Dict[str, Any]) -> None:
+        """Record an outbound client call such as ``session.update``."""
+        kwargs = {k: _to_dict(v) if hasattr(v, "model_dump") else v for k, v in kwargs.items()}
+        if method == INPUT_AUDIO_CALL and isinstance(kwargs.get("audio"), str):
+            kwargs = {**kwargs, "audio": self._write_pcm(INBOUND, kwargs["audio"])}
+        self._append({"dir": OUTBOUND, "method": method, "kwargs": kwargs})
+
+    def close(self) -> None:
+        """Flush and close all files (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._log is not self._raw:
+                self._log.close()  # also closes the raw file
+            else:
+                self._raw.close()
+        finally:
+            for f in self._pcm.values():
+                f.close()
+        logger.info("Recorded %d realtime records to %s", self.records, self.base)
+
+
+class _CallProxy:
+    """Proxy an SDK resource path (``conversation.item`` ...) and record awaited calls."""
+
+    def __init__(self, target: Any, path: str, recorder: Any) -> None:
+        self._target = target
+        self._path = path
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        path = f"{self._path}.{name}" if self._path else name
+        if asyncio.iscoroutinefunction(attr):
+
+            async def _call(**kwargs: Any) -> Any:
+                self._recorder.record_call(path, kwargs)
+                return await attr(**kwargs)
+
+            return _call
+        if callable(attr):
+            return attr
+        return _CallProxy(attr, path, self._recorder)
+
+
+class RecordingConnection(_CallProxy):
+    """Wrap a live realtime connection and record its traffic."""
+
+    def __init__(self, connection: Any, recorder: RealtimeRecorder) -> None:
+        """Wrap ``connection``; the recorder is closed together with the connection."""
+        super().__init__(connection, "", recorder)
+
+    def __aiter__(self) -> "RecordingConnection":
+        """Iterate over server events."""
+        self._iter = self._target.__aiter__()
+        return self
+
+    async def __anext__(self) -> Any:
+        """Return the next server event, recording it."""
+        event = await self._iter.__anext__()
+        try:
+            self._recorder.record_event(event)
+        except Exception as e:
+            logger.debug("Failed to record event: %s", e)
+        return event
+
+    async def close(self) -> None:
+        """Close the connection and the recording."""
+        try:
+            await self._target.close()
+        finally:
+            self._recorder.close()
+
+
+# ---- replay ----
+class ReplayEvent(dict):  # type: ignore[type-arg]
+    """A recorded event with attribute access, like the SDK models."""
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the field ``name``, wrapping nested objects."""
+        try:
+            value = self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return ReplayEvent(value) if isinstance(value, dict) else value
+
+    def model_dump(self, **_: Any) -> Dict[str, Any]:
+        """Return the event as a plain dict."""
+        return dict(self)
+
+
+def iter_records(base: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a recording in order."""
+    path = log_path(base)
+    with open(path, "rb") as f:
+        if path.suffix == ".zst":
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstandard is required to read compressed recordings")
+            stream: Any = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(f), encoding="utf-8")
+        else:
+            stream = io.TextIOWrapper(f, encoding="utf-8")
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+
+
+class _SinkProxy:
+    """Accept any ``conn.x.y(**kwargs)`` call and remember it."""
+
+    def __init__(self, sent: List[Tuple[float, str, Dict[str, Any]]], path: str, clock: Any) -> None:
+        self._sent = sent
+        self._path = path
+        self._clock = clock
+
+    def __getattr__(self, name: str) -> "_SinkProxy":
+        return _SinkProxy(self._sent, f"{self._path}.{name}" if self._path else name, self._clock)
+
+    async def __call__(self, **kwargs: Any) -> None:
+        self._sent.append((self._clock(), self._path, kwargs))
+
+
+class ReplayConnection:
+    """Fake realtime connection that plays back the server side of a recording."""
+
+    def __init__(self, base: Path, speed: float = 1.0) -> None:
+        """Load the recording at ``base``; ``speed`` scales time (0 means no waiting)."""
+        self.base = base
+        self.speed = speed
+        self.sent: List[Tuple[float, str, Dict[str, Any]]] = []
+        self._events = [r for r in iter_records(base) if r.get("dir") == INBOUND]
+        self._out_pcm = base.with_name(base.name + ".out.pcm")
+        self._closed = asyncio.Event()
+        self._t0 = time.monotonic()
+        self.events_replayed = 0
+
+    def _clock(self) -> float:
+        return time.monotonic() - self._t0
+
+    def __getattr__(self, name: str) -> _SinkProxy:
+        """Accept any client call (``session.update``, ``conversation.item.create`` ...) into ``sent``."""
+        return _SinkProxy(self.sent, name, self._clock)
+
+    def _restore_audio(self, event: Dict[str, Any], pcm: Optional[IO[bytes]]) -> Dict[str, Any]:
+        ref = event.get("delta")
+        if pcm is None or not isinstance(ref, dict) or ref.get("pcm") != OUTBOUND:
+            return event
+        pcm.seek(int(ref["offset"]))
+        return {**event, "delta": base64.b64encode(pcm.read(int(ref["length"]))).decode("ascii")}
+
+    async def __aiter__(self) -> Any:
+        """Yield recorded events, paced by their timestamps."""
+        self._t0 = time.monotonic()
+        pcm = open(self._out_pcm, "rb") if self._out_pcm.exists() else None
+        try:
+            for record in self._events:
+                if self._closed.is_set():
+                    return
+                if self.speed > 0:
+                    delay = record["t"] / self.speed - self._clock()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                else:
+                    await asyncio.sleep(0)
+                self.events_replayed += 1
+                yield ReplayEvent(self._restore_audio(record["event"], pcm))
+        finally:
+            if pcm is not None:
+                pcm.close()
+
+    async def close(self) -> None:
+        """Stop the replay."""
+        self._closed.set()
+
+
+class _ReplayRealtime:
+    def __init__(self, client: "ReplayClient") -> None:
+        self._client = client
+
+    def connect(self, **_: Any) -> "_ReplayConnect":
+        return _ReplayConnect(self._client)
+
+
+class _ReplayConnect:
+    def __init__(self, client: "ReplayClient") -> None:
+        self._client = client
+
+    async def __aenter__(self) -> ReplayConnection:
+        conn = ReplayConnection(self._client.base, self._client.speed)
+        self._client.connections.append(conn)
+        return conn
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class ReplayClient:
+    """Stand-in for ``AsyncOpenAI`` whose realtime connections replay a recording."""
+
+    def __init__(self, base: Path, speed: float = 1.0) -> None:
+        """Replay ``base`` at ``speed`` for every connection opened."""
+        self.base = base
+        self.speed = speed
+        self.connections: List[ReplayConnection] = []
+        self.realtime = _ReplayRealtime(self)
+
+
+def _tool_output(output: Any) -> Dict[str, Any]:
+    try:
+        value = json.loads(output) if isinstance(output, str) else output
+    except ValueError:
+        value = output
+    return value if isinstance(value, dict) else {"output": value}
+
+
+class RecordedToolOutputs:
+    """Tool dispatcher for replay that returns the recorded output of each call instead of running the tool."""
+
+    def __init__(self, base: Path) -> None:
+        """Pair the tool calls of the recording at ``base`` with the outputs the handler sent back."""
+        calls: Dict[str, Tuple[str, str]] = {}
+        self._outputs: List[Tuple[str, str, Dict[str, Any]]] = []
+        for record in iter_records(base):
+            if record.get("dir") == INBOUND:
+                event = record.get("event") or {}
+                if event.get("type") == "response.function_call_arguments.done":
+                    calls[str(event.get("call_id"))] = (str(event.get("name")), str(event.get("arguments")))
+            elif record.get("method") == "conversation.item.create":
+                item = (record.get("kwargs") or {}).get("item") or {}
+                call = calls.get(str(item.get("call_id")))
+                if item.get("type") == "function_call_output" and call is not None:
+                    self._outputs.append((*call, _tool_output(item.get("output"))))
+        self.calls = 0
+        self.missing = 0
+
+    async def __call__(self, tool_name: str, args_json: str, deps: Any) -> Dict[str, Any]:
+        """Return the next recorded output for this tool and arguments (or for this tool)."""
+        self.calls += 1
+        match = next((i for i, (n, a, _) in enumerate(self._outputs) if n == tool_name and a == args_json), None)
+        if match is None:
+            match = next((i for i, (n, _, _) in enumerate(self._outputs) if n == tool_name), None)
+        if match is None:
+            self.missing += 1
+            return {"error": f"no recorded output for tool {tool_name}"}
+        return self._outputs.pop(match)[2]
+
+
+def new_recording_base(directory: Path) -> Path:
+    """Return a fresh recording base path inside ``directory``.
+
+    The process id and a per-process counter keep connections opened in the
+    same second (a reconnect, a standby promotion, several sessions) apart.
+    """
+    return directory / time.strftime(f"session-%Y%m%d-%H%M%S-{os.getpid()}-{next(_RECORDING_SEQ)}")
+
+
+# ---- command line benchmark ----
+class _NullMovementManager:
+    """Movement manager that accepts everything and moves nothing (offline replay)."""
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: False
+
+
+async def _replay_once(base: Path, speed: float) -> Dict[str, Any]:
+    from reachy_mini_karen_whisperer.openai_realtime import OpenaiRealtimeHandler
+    from reachy_mini_karen_whisperer.tools.core_tools import ToolDependencies
+
+    deps = ToolDependencies(reachy_mini=None, movement_manager=_NullMovementManager())
+    handler = OpenaiRealtimeHandler(deps)
+    client = ReplayClient(base, speed)
+    handler.client = client
+    tools = RecordedToolOutputs(base)
+    handler.dispatch_tool = tools
+
+    started = time.perf_counter()
+    await handler._run_realtime_session()
+    elapsed = time.perf_counter() - started
+    conn = client.connections[-1]
+    tool_outputs = [
+        kw
+        for _, method, kw in conn.sent
+        if method == "conversation.item.create" and kw.get("item", {}).get("type") == "function_call_output"
+    ]
+    return {
+        "events": conn.events_replayed,
+        "seconds": round(elapsed, 3),
+        "events_per_s": round(conn.events_replayed / elapsed, 1) if elapsed > 0 else None,
+        "client_calls": len(conn.sent),
+        "tool_outputs": len(tool_outputs),
+        "tool_outputs_not_recorded": tools.missing,
+        "latency": handler.latency.percentiles(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Replay a recording through a handler and print throughput."""
+    parser = argparse.ArgumentParser(description="Replay a recorded realtime session through the handler.")
+    parser.add_argument("recording", type=Path, help="Recording base path (without extension)")
+    parser.add_argument("--speed", type=float, default=0.0, help="Time scale (1 = real time, 0 = as fast as possible)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    result = asyncio.run(_replay_once(args.recording, args.speed))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
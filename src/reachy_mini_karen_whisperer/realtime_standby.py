@@ -0,0 +1,79 @@
+"""Warm standby realtime connection.
+
+Opening a realtime websocket and sending the full ``session.update`` takes long
+enough that the robot is deaf after a drop or a personality switch. A standby is
+a second connection, opened and configured in the background, that the handler
+promotes to primary in place of a cold reconnect.
+
+A standby has produced no audio yet, so it can still be reconfigured (including
+the voice) right before promotion. Its lifetime is capped so an idle spare never
+lingers for the whole shift.
+"""
+
+from __future__ import annotations
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+def session_config_key(session_config: Dict[str, Any]) -> str:
+    """Return a stable hash of a session configuration."""
+    payload = json.dumps(session_config, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class StandbySession:
+    """A pre-opened, pre-configured realtime connection waiting to be promoted."""
+
+    def __init__(self, manager: Any, connection: Any, session_config: Dict[str, Any]) -> None:
+        """Wrap an entered connection manager and its configured connection."""
+        self._manager = manager
+        self.connection = connection
+        self.session_config = session_config
+        self.config_key = session_config_key(session_config)
+        self.opened_at = time.monotonic()
+        self._closed = False
+
+    @property
+    def age_s(self) -> float:
+        """Seconds since the connection was opened."""
+        return time.monotonic() - self.opened_at
+
+    async def reconfigure(self, session_config: Dict[str, Any]) -> None:
+        """Send ``session_config`` if it differs from what the standby was opened with."""
+        key = session_config_key(session_config)
+        if key == self.config_key:
+            return
+        await self.connection.session.update(session=session_config)
+        self.session_config = session_config
+        self.config_key = key
+
+    async def close(self) -> None:
+        """Close the underlying connection (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._manager.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug("Standby close ignored: %s", e)
+
+
+async def open_standby(client: Any, model: str, session_config: Dict[str, Any]) -> StandbySession:
+    """Open a realtime connection and configure it with ``session_config``."""
+    manager = client.realtime.connect(model=model)
+    connection = await manager.__aenter__()
+    try:
+        await connection.session.update(session=session_config)
+    except BaseException:
+        try:
+            await manager.__aexit__(None, None, None)
+        except Exception:
+            pass
+        raise
+    return StandbySession(manager, connection, session_config)
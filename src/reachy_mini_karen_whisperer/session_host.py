@@ -0,0 +1,308 @@
+"""Host several robot sessions in one process.
+
+``main.run`` builds one robot, movement manager, head wobbler and realtime
+handler per process. On the demo floor we run several robots from one machine,
+so this module runs N independent pipelines side by side instead:
+
+- Read-only resources are loaded once and shared: the tool registry, the
+  compiled profile bundle, the dance and emotion libraries, the head tracker
+  model and the local vision model. Model inference is serialized by a lock.
+- Everything that carries conversation or motion state (movement manager,
+  head wobbler, camera worker, handler, stream) is created per session.
+- A ``RobotLease`` makes sure only one realtime handler drives a robot at a
+  time, which also arbitrates the handler copies Gradio creates per browser tab.
+
+Run with::
+
+    python -m reachy_mini_karen_whisperer.session_host --robot-name reachy_a --robot-name reachy_b
+"""
+
+from __future__ import annotations
+import sys
+import time
+import logging
+import argparse
+import threading
+from typing import Any, Dict, List, Tuple, Optional
+from dataclasses import field, dataclass
+
+
+logger = logging.getLogger(__name__)
+
+
+class RobotLease:
+    """Lets only one handler at a time drive a robot."""
+
+    def __init__(self, name: str = "robot") -> None:
+        """Initialize a free lease."""
+        self.name = name
+        self._lock = threading.Lock()
+        self._holder: Any = None
+        self.denied = 0
+
+    @property
+    def holder(self) -> Any:
+        """Return the current holder, if any."""
+        return self._holder
+
+    def acquire(self, owner: Any) -> bool:
+        """Take the lease for ``owner``; return False when someone else holds it."""
+        with self._lock:
+            if self._holder is None or self._holder is owner:
+                self._holder = owner
+                return True
+            self.denied += 1
+            return False
+
+    def release(self, owner: Any) -> None:
+        """Give the lease back if ``owner`` holds it."""
+        with self._lock:
+            if self._holder is owner:
+                self._holder = None
+
+
+class SharedHeadTracker:
+    """Serialize calls into one head tracker model shared by several camera workers."""
+
+    def __init__(self, tracker: Any) -> None:
+        """Wrap ``tracker``."""
+        self._tracker = tracker
+        self._lock = threading.Lock()
+
+    def get_head_position(self, img: Any) -> Tuple[Any, Any]:
+        """Delegate to the wrapped tracker under the lock."""
+        with self._lock:
+            result: Tuple[Any, Any] = self._tracker.get_head_position(img)
+            return result
+
+
+@dataclass
+class SharedResources:
+    """Read-only resources loaded once per process."""
+
+    head_tracker: Any = None
+    vision_processor: Any = None
+
+    @classmethod
+    def load(cls, head_tracker: Optional[str], local_vision: bool) -> "SharedResources":
+        """Warm the process-wide caches and load the models every session will use."""
+        from reachy_mini_karen_whisperer.prompts import get_current_profile_bundle
+        from reachy_mini_karen_whisperer.tools.core_tools import get_tool_specs
+        from reachy_mini_karen_whisperer.trajectory_cache import warm_trajectories
+
+        # Tool registry, profile bundle and move libraries are module-level and shared as is
+        get_tool_specs()
+        get_current_profile_bundle()
+        warm_trajectories()
+
+        resources = cls()
+        if head_tracker == "yolo":
+            from reachy_mini_karen_whisperer.vision.yolo_head_tracker import HeadTracker
+
+            resources.head_tracker = SharedHeadTracker(HeadTracker())
+        elif head_tracker == "mediapipe":
+            from reachy_mini_toolbox.vision import HeadTracker  # type: ignore[no-redef]
+
+            resources.head_tracker = SharedHeadTracker(HeadTracker())
+
+        if local_vision:
+            try:
+                from reachy_mini_karen_whisperer.vision.processors import initialize_vision_manager
+            except ImportError as e:
+                raise ImportError(
+                    "To use --local-vision, please install the extra dependencies: pip install '.[local_vision]'",
+                ) from e
+            # Load the model once through a camera-less manager and keep only its processor
+            manager = initialize_vision_manager(None)
+            resources.vision_processor = manager.processor if manager is not None else None
+        return resources
+
+
+@dataclass
+class RobotSession:
+    """One robot pipeline: motion, audio reactivity, vision and a realtime handler."""
+
+    name: str
+    robot: Any
+    movement_manager: Any
+    head_wobbler: Any
+    handler: Any
+    stream: Any
+    lease: RobotLease
+    camera_worker: Any = None
+    vision_manager: Any = None
+    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+    def start(self) -> None:
+        """Start the background workers and run the stream on its own thread and event loop."""
+        self.movement_manager.start()
+        self.head_wobbler.start()
+        if self.camera_worker:
+            self.camera_worker.start()
+        if self.vision_manager:
+            self.vision_manager.start()
+        self._thread = threading.Thread(target=self._run_stream, name=f"session-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _run_stream(self) -> None:
+        try:
+            self.stream.launch()
+        except Exception:
+            logger.exception("Session %s stopped with an error", self.name)
+
+    def stop(self) -> None:
+        """Stop the stream and workers, then release the robot."""
+        try:
+            self.stream.close()
+        except Exception as e:
+            logger.error("Error while closing stream of session %s: %s", self.name, e)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        self.movement_manager.stop()
+        self.head_wobbler.stop()
+        if self.camera_worker:
+            self.camera_worker.stop()
+        if self.vision_manager:
+            self.vision_manager.stop()
+        try:
+            self.robot.media.close()
+        except Exception as e:
+            logger.debug("Error closing media of session %s: %s", self.name, e)
+        self.robot.client.disconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-session counters for status endpoints and benchmarks."""
+        return {
+            "name": self.name,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "lease_denied": self.lease.denied,
+            "latency": self.handler.latency.percentiles(),
+            "context_tokens": self.handler.context.total_tokens,
+        }
+
+
+def build_session(
+    name: str,
+    robot: Any,
+    shared: SharedResources,
+    *,
+    no_camera: bool = False,
+) -> RobotSession:
+    """Create the per-session objects for ``robot`` on top of the shared resources."""
+    from reachy_mini_karen_whisperer.moves import CONTROL_LOOP_FREQUENCY_HZ, MovementManager
+    from reachy_mini_karen_whisperer.config import config
+    from reachy_mini_karen_whisperer.console import LocalStream
+    from reachy_mini_karen_whisperer.camera_worker import CameraWorker
+    from reachy_mini_karen_whisperer.flight_recorder import flight_recorder_from_config
+    from reachy_mini_karen_whisperer.openai_realtime import OpenaiRealtimeHandler
+    from reachy_mini_karen_whisperer.output_deadband import deadband_from_config
+    from reachy_mini_karen_whisperer.tools.core_tools import ToolDependencies
+    from reachy_mini_karen_whisperer.audio.head_wobbler import HeadWobbler
+
+    camera_worker = None
+    vision_manager = None
+    if not no_camera:
+        camera_worker = CameraWorker(robot, shared.head_tracker)
+        if shared.vision_processor is not None:
+            from reachy_mini_karen_whisperer.vision.processors import VisionManager
+
+            vision_manager = VisionManager(camera_worker, processor=shared.vision_processor)
+
+    movement_manager = MovementManager(
+        current_robot=robot,
+        camera_worker=camera_worker,
+        spin_s=config.CONTROL_LOOP_SPIN_US / 1e6,
+        realtime_priority=config.CONTROL_LOOP_RT_PRIORITY,
+        cpus=config.CONTROL_LOOP_CPUS,
+        output=deadband_from_config(),
+        queue_capacity=config.MOVE_QUEUE_CAPACITY,
+        max_repeats=config.MOVE_QUEUE_MAX_REPEATS,
+        recorder=flight_recorder_from_config(CONTROL_LOOP_FREQUENCY_HZ),
+    )
+    head_wobbler = HeadWobbler(set_speech_offsets=movement_manager.set_speech_offsets)
+    deps = ToolDependencies(
+        reachy_mini=robot,
+        movement_manager=movement_manager,
+        camera_worker=camera_worker,
+        vision_manager=vision_manager,
+        head_wobbler=head_wobbler,
+    )
+    lease = RobotLease(name)
+    handler = OpenaiRealtimeHandler(deps)
+    handler.robot_lease = lease
+    stream = LocalStream(handler, robot)
+    return RobotSession(
+        name=name,
+        robot=robot,
+        movement_manager=movement_manager,
+        head_wobbler=head_wobbler,
+        handler=handler,
+        stream=stream,
+        lease=lease,
+        camera_worker=camera_worker,
+        vision_manager=vision_manager,
+    )
+
+
+class SessionHost:
+    """Run several ``RobotSession`` pipelines in one process."""
+
+    def __init__(self, shared: SharedResources) -> None:
+        """Initialize an empty host."""
+        self.shared = shared
+        self.sessions: List[RobotSession] = []
+
+    def add(self, name: str, robot: Any, *, no_camera: bool = False) -> RobotSession:
+        """Build a session for ``robot`` and register it."""
+        session = build_session(name, robot, self.shared, no_camera=no_camera)
+        self.sessions.append(session)
+        return session
+
+    def start(self) -> None:
+        """Start every registered session."""
+        for session in self.sessions:
+            session.start()
+        logger.info("Session host running %d session(s)", len(self.sessions))
+
+    def stop(self) -> None:
+        """Stop every session, newest first."""
+        for session in reversed(self.sessions):
+            session.stop()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return the counters of every session."""
+        return [session.stats() for session in self.sessions]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: one session per ``--robot-name``."""
+    from reachy_mini import ReachyMini
+    from reachy_mini_karen_whisperer.utils import setup_logger
+
+    parser = argparse.ArgumentParser(description="Run several Reachy Mini sessions in one process.")
+    parser.add_argument("--robot-name", action="append", required=True, help="Repeat once per robot")
+    parser.add_argument("--head-tracker", choices=["yolo", "mediapipe"], default=None)
+    parser.add_argument("--no-camera", default=False, action="store_true")
+    parser.add_argument("--local-vision", default=False, action="store_true")
+    parser.add_argument("--debug", default=False, action="store_true")
+    args = parser.parse_args(argv)
+
+    setup_logger(args.debug)
+    shared = SharedResources.load(None if args.no_camera else args.head_tracker, args.local_vision)
+    host = SessionHost(shared)
+    for name in args.robot_name:
+        host.add(name, ReachyMini(robot_name=name), no_camera=args.no_camera)
+
+    host.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        logger.info("Keyboard interruption, stopping sessions...")
+    finally:
+        host.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Absolute-deadline scheduling for the movement control loop.
+
+Sleeping ``period - computation_time`` after each tick lets every oversleep
+(timer slack, a GIL hand-off from the camera, YOLO or asyncio threads) push all
+later ticks back, so the loop drifts and ticks bunch up. ``DeadlineScheduler``
+keeps a fixed grid of deadlines instead:
+
+- it sleeps until shortly before the next deadline and busy-waits the last
+  ``spin_s``, so timer slack no longer shows up as lateness;
+- a tick that overruns its deadline is counted as missed, and grid slots that
+  are already over are skipped rather than run back to back;
+- wake-up lateness and period jitter go into fixed-bucket histograms.
+
+``apply_realtime_policy`` optionally moves the calling thread to Linux
+``SCHED_FIFO`` and pins it to a set of CPUs.
+"""
+
+from __future__ import annotations
+import os
+import time
+import bisect
+import logging
+import threading
+from typing import Any, Dict, List, Callable, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (us) of the lateness and jitter histogram buckets; the last bucket is open-ended
+TIMING_BUCKETS_US: List[float] = [50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000]
+DEFAULT_SPIN_S = 0.0005
+
+
+class TimingHistogram:
+    """Fixed-bucket histogram of durations in microseconds, cheap enough to update on every tick."""
+
+    def __init__(self, bounds_us: Sequence[float] = TIMING_BUCKETS_US) -> None:
+        """Create empty buckets with the given upper bounds."""
+        self.bounds_us = list(bounds_us)
+        self.counts: List[int] = [0] * (len(self.bounds_us) + 1)
+        self.samples = 0
+        self.max_us = 0.0
+
+    def record(self, value_us: float) -> None:
+        """Add one sample (negative values count as 0)."""
+        value_us = max(0.0, value_us)
+        self.counts[bisect.bisect_left(self.bounds_us, value_us)] += 1
+        self.samples += 1
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding quantile ``q`` (the max for the open bucket)."""
+        if self.samples == 0:
+            return 0.0
+        rank = q * self.samples
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds_us[i] if i < len(self.bounds_us) else round(self.max_us, 1)
+        return round(self.max_us, 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the buckets and summary percentiles as plain values."""
+        labels = [f"<={b:g}us" for b in self.bounds_us] + [f">{self.bounds_us[-1]:g}us"]
+        return {
+            "samples": self.samples,
+            "p50_us": self.percentile(0.5),
+            "p99_us": self.percentile(0.99),
+            "max_us": round(self.max_us, 1),
+            "histogram": dict(zip(labels, self.counts)),
+        }
+
+
+class DeadlineScheduler:
+    """Wake a loop on a fixed grid of absolute deadlines and account for late ticks."""
+
+    def __init__(
+        self,
+        period_s: float,
+        spin_s: float = DEFAULT_SPIN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Prepare a scheduler for ticks every ``period_s`` seconds of ``clock``."""
+        self.period_s = period_s
+        self.spin_s = max(0.0, spin_s)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.next_deadline = 0.0
+        self._last_wake: Optional[float] = None
+        self.last_lateness_s = 0.0  # of the latest wake-up
+        self.missed_deadlines = 0  # ticks whose work ran past the next deadline
+        self.skipped_ticks = 0  # grid slots dropped to catch up after a miss
+        self.lateness = TimingHistogram()  # wake time minus deadline
+        self.jitter = TimingHistogram()  # |wake-to-wake interval - period|
+
+    def start(self, now: Optional[float] = None) -> None:
+        """Anchor the grid so the first ``wait`` returns immediately."""
+        self.next_deadline = self._clock() if now is None else now
+        self._last_wake = None
+
+    def wait(self) -> float:
+        """Block until the next deadline and return the wake-up time."""
+        deadline = self.next_deadline
+        period = self.period_s
+        now = self._clock()
+        if now > deadline:
+            if self._last_wake is not None:  # the first wait of a run has no tick behind it
+                self.missed_deadlines += 1
+        else:
+            remaining = deadline - now - self.spin_s
+            if remaining > 0:
+                time.sleep(remaining)
+            now = self._clock()
+            while now < deadline:  # spin tail: absorbs the sleep's timer slack
+                now = self._clock()
+
+        # Next deadline stays on the grid; slots that are already over are skipped, not run back to back
+        next_deadline = deadline + period
+        if now >= next_deadline:
+            skipped = int((now - next_deadline) / period) + 1
+            next_deadline += skipped * period
+        else:
+            skipped = 0
+
+        with self._lock:
+            self.lateness.record((now - deadline) * 1e6)
+            if self._last_wake is not None:
+                self.jitter.record(abs(now - self._last_wake - period) * 1e6)
+            self.skipped_ticks += skipped
+        self._last_wake = now
+        self.last_lateness_s = now - deadline
+        self.next_deadline = next_deadline
+        return now
+
+    def stats(self) -> Dict[str, Any]:
+        """Return missed-deadline counters and the lateness and jitter histograms."""
+        with self._lock:
+            return {
+                "period_ms": self.period_s * 1000.0,
+                "spin_us": self.spin_s * 1e6,
+                "missed_deadlines": self.missed_deadlines,
+                "skipped_ticks": self.skipped_ticks,
+                "lateness_us": self.lateness.snapshot(),
+                "jitter_us": self.jitter.snapshot(),
+            }
+
+
+def apply_realtime_policy(priority: int = 0, cpus: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+    """Give the calling thread ``SCHED_FIFO`` at ``priority`` and pin it to ``cpus``, where supported.
+
+    Both are opt-in (``priority`` 0 and empty ``cpus`` leave the thread alone) and
+    Linux-only. Failures, usually a missing ``CAP_SYS_NICE`` or ``ulimit -r``, are
+    logged and the thread keeps running with the default policy. Returns what
+    was actually applied.
+    """
+    applied: Dict[str, Any] = {"sched_fifo_priority": None, "cpus": None}
+    if cpus:
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, set(cpus))
+                applied["cpus"] = sorted(os.sched_getaffinity(0))
+            except OSError as e:
+                logger.warning("Could not pin control thread to CPUs %s: %s", list(cpus), e)
+        else:
+            logger.warning("CPU pinning is not supported on this platform; ignoring %s", list(cpus))
+    if priority > 0:
+        if hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                applied["sched_fifo_priority"] = priority
+            except OSError as e:
+                logger.warning(
+                    "Could not switch control thread to SCHED_FIFO priority %d: %s "
+                    "(needs CAP_SYS_NICE or an rtprio limit)",
+                    priority,
+                    e,
+                )
+        else:
+            logger.warning("SCHED_FIFO is not supported on this platform; ignoring priority %d", priority)
+    if applied["cpus"] or applied["sched_fifo_priority"]:
+        logger.info("Control thread real-time policy: %s", applied)
+    return applied
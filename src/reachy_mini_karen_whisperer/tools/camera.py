@@ -16,6 +16,7 @@ class Camera(Tool):
 
     name = "camera"
     description = "Take a picture with the camera and ask a question about it."
+    expected_latency_s = 1.5
     parameters_schema = {
         "type": "object",
         "properties": {
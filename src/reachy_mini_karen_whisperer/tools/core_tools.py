@@ -6,12 +6,12 @@ import inspect
 import logging
 import importlib
 from typing import Any, Dict, List
-from pathlib import Path
 from dataclasses import dataclass
 
 from reachy_mini import ReachyMini
 # Import config to ensure .env is loaded before reading REACHY_MINI_CUSTOM_PROFILE
 from reachy_mini_karen_whisperer.config import config  # noqa: F401
+from reachy_mini_karen_whisperer.prompts import ProfileError, get_profile_bundle
 
 
 logger = logging.getLogger(__name__)
@@ -65,11 +65,15 @@ class Tool(abc.ABC):
       - name: str
       - description: str
       - parameters_schema: Dict[str, Any]  # JSON Schema
+
+    and may set ``expected_latency_s`` when a call is typically slow, so the
+    handler can mask the wait with a filler clip.
     """
 
     name: str
     description: str
     parameters_schema: Dict[str, Any]
+    expected_latency_s: float = 0.0
 
     def spec(self) -> Dict[str, Any]:
         """Return the function spec for LLM consumption."""
@@ -93,31 +97,18 @@ def _load_profile_tools() -> None:
     profile = config.REACHY_MINI_CUSTOM_PROFILE or "default"
     logger.info(f"Loading tools for profile: {profile}")
 
-    # Build path to tools.txt
-    # Get the profile directory path
-    profile_module_path = Path(__file__).parent.parent / "profiles" / profile
-    tools_txt_path = profile_module_path / "tools.txt"
-
-    if not tools_txt_path.exists():
-        logger.error(f"✗ tools.txt not found at {tools_txt_path}")
+    # Tool list comes from the compiled profile bundle (tools.txt, cached by mtime)
+    try:
+        bundle = get_profile_bundle(config.REACHY_MINI_CUSTOM_PROFILE)
+    except ProfileError as e:
+        logger.error(f"✗ Failed to compile profile '{profile}': {e}")
         sys.exit(1)
 
-    # Read and parse tools.txt
-    try:
-        with open(tools_txt_path, "r") as f:
-            lines = f.readlines()
-    except Exception as e:
-        logger.error(f"✗ Failed to read tools.txt: {e}")
+    if bundle.tools is None:
+        logger.error(f"✗ tools.txt not found for profile '{profile}'")
         sys.exit(1)
 
-    # Parse tool names (skip comments and blank lines)
-    tool_names = []
-    for line in lines:
-        line = line.strip()
-        # Skip blank lines and comments
-        if not line or line.startswith("#"):
-            continue
-        tool_names.append(line)
+    tool_names = list(bundle.tools)
 
     logger.info(f"Found {len(tool_names)} tools to load: {tool_names}")
 
@@ -198,6 +189,12 @@ def get_tool_specs(exclusion_list: list[str] = []) -> list[Dict[str, Any]]:
     return [spec for spec in ALL_TOOL_SPECS if spec.get("name") not in exclusion_list]
 
 
+def get_expected_latency(tool_name: str) -> float:
+    """Return the declared expected latency of a tool (0 when unknown)."""
+    tool = ALL_TOOLS.get(tool_name)
+    return float(getattr(tool, "expected_latency_s", 0.0)) if tool is not None else 0.0
+
+
 # Dispatcher
 def _safe_load_obj(args_json: str) -> Dict[str, Any]:
     try:
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict
 
+from reachy_mini_karen_whisperer.move_queue import APPEND, POLICIES
 from reachy_mini_karen_whisperer.tools.core_tools import Tool, ToolDependencies
 
 
@@ -53,7 +54,13 @@ class Dance(Tool):
             },
             "repeat": {
                 "type": "integer",
-                "description": "How many times to repeat the move (default 1).",
+                "description": "How many times to repeat the move (default 1, capped).",
+            },
+            "priority": {
+                "type": "string",
+                "enum": ["append", "interrupt", "drop_if_busy"],
+                "description": "append (default) plays after the current moves, interrupt replaces them, "
+                "drop_if_busy only plays if nothing else is.",
             },
         },
         "required": [],
@@ -66,8 +73,11 @@ class Dance(Tool):
 
         move_name = kwargs.get("move")
         repeat = int(kwargs.get("repeat", 1))
+        priority = kwargs.get("priority") or APPEND
+        if priority not in POLICIES:
+            return {"error": f"Unknown priority '{priority}'. Use one of {list(POLICIES)}"}
 
-        logger.info("Tool call: dance move=%s repeat=%d", move_name, repeat)
+        logger.info("Tool call: dance move=%s repeat=%d priority=%s", move_name, repeat, priority)
 
         if not move_name or move_name == "random":
             import random
@@ -77,10 +87,6 @@ class Dance(Tool):
         if move_name not in AVAILABLE_MOVES:
             return {"error": f"Unknown dance move '{move_name}'. Available: {list(AVAILABLE_MOVES.keys())}"}
 
-        # Add dance moves to queue
-        movement_manager = deps.movement_manager
-        for _ in range(repeat):
-            dance_move = DanceQueueMove(move_name)
-            movement_manager.queue_move(dance_move)
-
-        return {"status": "queued", "move": move_name, "repeat": repeat}
+        # Queue the dance once; repeats are played by a single looped queue entry
+        result = deps.movement_manager.queue_move(DanceQueueMove(move_name), priority, repeat)
+        return {**result.as_dict(), "move": move_name, "repeat_requested": repeat}
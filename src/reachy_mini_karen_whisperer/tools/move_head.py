@@ -69,10 +69,11 @@ class MoveHead(Tool):
                 duration=deps.motion_duration_s,
             )
 
-            movement_manager.queue_move(goto_move)
-            movement_manager.set_moving_state(deps.motion_duration_s)
+            result = movement_manager.queue_move(goto_move)
+            if result.accepted:
+                movement_manager.set_moving_state(deps.motion_duration_s)
 
-            return {"status": f"looking {direction}"}
+            return {**result.as_dict(), "direction": direction}
 
         except Exception as e:
             logger.error("move_head failed")
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict
 
+from reachy_mini_karen_whisperer.move_queue import APPEND, POLICIES
 from reachy_mini_karen_whisperer.tools.core_tools import Tool, ToolDependencies
 
 
@@ -51,6 +52,12 @@ class PlayEmotion(Tool):
                                     {get_available_emotions_and_descriptions()}
                                     """,
             },
+            "priority": {
+                "type": "string",
+                "enum": ["append", "interrupt", "drop_if_busy"],
+                "description": "append (default) plays after the current moves, interrupt replaces them, "
+                "drop_if_busy only plays if nothing else is.",
+            },
         },
         "required": ["emotion"],
     }
@@ -63,6 +70,9 @@ class PlayEmotion(Tool):
         emotion_name = kwargs.get("emotion")
         if not emotion_name:
             return {"error": "Emotion name is required"}
+        priority = kwargs.get("priority") or APPEND
+        if priority not in POLICIES:
+            return {"error": f"Unknown priority '{priority}'. Use one of {list(POLICIES)}"}
 
         logger.info("Tool call: play_emotion emotion=%s", emotion_name)
 
@@ -75,9 +85,9 @@ class PlayEmotion(Tool):
             # Add emotion to queue
             movement_manager = deps.movement_manager
             emotion_move = EmotionQueueMove(emotion_name, RECORDED_MOVES)
-            movement_manager.queue_move(emotion_move)
+            result = movement_manager.queue_move(emotion_move, priority)
 
-            return {"status": "queued", "emotion": emotion_name}
+            return {**result.as_dict(), "emotion": emotion_name}
 
         except Exception as e:
             logger.exception("Failed to play emotion")
@@ -63,6 +63,7 @@ class SlackEscalationTool(Tool):
         "confusion about the same topic multiple times, or risk situations (frustration, safety concerns). "
         "Always provide clear evidence and a recommendation."
     )
+    expected_latency_s = 2.0
     
     parameters_schema = {
         "type": "object",
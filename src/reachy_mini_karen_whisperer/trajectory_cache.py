@@ -0,0 +1,325 @@
+"""Precompiled trajectories for the dance and recorded emotion libraries.
+
+Library moves are evaluated through Python on every control tick: a dance
+calls its move function and ``create_head_pose``, a recorded emotion bisects
+its keyframes and runs ``linear_pose_interpolation``. Both are pure functions
+of time, so each move is sampled once at ``SAMPLE_RATE_HZ`` into a dense array
+and played back by interpolating between neighbouring samples.
+
+Each sample row is laid out like a ``Pose``: the head rotation as a quaternion
+(scalar last, sign-continuous along the move), the head translation, both
+antennas and the body yaw. Playback interpolates two rows with
+``Pose.set_interpolated``; samples this close fall in its normalised-lerp range.
+
+Cache layout, one pair of files per library version::
+
+    <cache_dir>/<key>.npy   # all moves concatenated, float64, shape (samples, 10)
+    <cache_dir>/<key>.json  # {"format", "rate", "moves": [{"name", "offset", "length", "duration"}]}
+
+The key contains the library and ``reachy_mini`` versions, so an upgrade
+compiles a fresh file. The ``.npy`` file is opened with ``mmap_mode="r"`` and
+shared by every move and session of the process.
+"""
+
+from __future__ import annotations
+import os
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Tuple, Callable, Optional
+from pathlib import Path
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.spatial.transform import Rotation
+
+from reachy_mini_karen_whisperer.pose import CHANNELS, Pose
+
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE_HZ = 200.0
+FORMAT_VERSION = 1
+
+CompiledMoves = Dict[str, Tuple[NDArray[np.float64], float]]  # name -> (samples, duration)
+
+# Poses the two neighbouring samples are copied into; per thread, as every session's loop shares the libraries
+_SCRATCH = threading.local()
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def pack_samples(
+    heads: NDArray[np.float64],
+    antennas: NDArray[np.float64],
+    body_yaw: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Pack (N, 4, 4) head poses, (N, 2) antennas and (N,) body yaws into (N, 10) sample rows."""
+    quats = Rotation.from_matrix(heads[:, :3, :3]).as_quat()
+    # q and -q are the same rotation; keep neighbours in the same hemisphere so lerps take the short way
+    if len(quats) > 1:
+        flips = np.cumprod(np.where(np.einsum("ij,ij->i", quats[1:], quats[:-1]) < 0.0, -1.0, 1.0))
+        quats[1:] *= flips[:, None]
+    return np.column_stack([quats, heads[:, :3, 3], antennas, body_yaw]).astype(np.float64)
+
+
+def sample_times(duration: float, rate: float = SAMPLE_RATE_HZ) -> NDArray[np.float64]:
+    """Return evenly spaced sample times covering [0, duration] at about ``rate`` Hz."""
+    count = max(2, int(round(duration * rate)) + 1)
+    return np.linspace(0.0, duration, count)
+
+
+class CompiledTrajectory:
+    """One library move as dense samples, evaluated by interpolation."""
+
+    def __init__(self, name: str, samples: NDArray[np.float64], duration: float) -> None:
+        """Wrap ``samples`` (a view into the library array) spanning ``duration`` seconds."""
+        self.name = name
+        self.samples = samples
+        self.duration = duration
+        self._last = samples.shape[0] - 1
+        self._rate = self._last / duration if duration > 0 else 0.0
+
+    def evaluate_pose(self, t: float, out: Pose) -> None:
+        """Write the pose at time ``t`` (clamped to the move) into ``out``."""
+        pos = min(max(t, 0.0) * self._rate, float(self._last))
+        i = min(int(pos), self._last - 1)
+        scratch = getattr(_SCRATCH, "poses", None)
+        if scratch is None:
+            scratch = _SCRATCH.poses = (Pose(), Pose())
+        start, end = scratch
+        np.copyto(start.data, self.samples[i])
+        np.copyto(end.data, self.samples[i + 1])
+        out.set_interpolated(start, end, pos - i)
+
+    def sample(
+        self,
+        times: NDArray[np.float64],
+    ) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+        """Evaluate the move at many ``times`` at once: (N, 4, 4) heads, (N, 2) antennas, (N,) body yaws."""
+        pos = np.clip(np.asarray(times, dtype=np.float64) * self._rate, 0.0, float(self._last))
+        i = np.minimum(pos.astype(np.intp), self._last - 1)
+        a = (pos - i)[:, None]
+        rows = self.samples[i] + (self.samples[i + 1] - self.samples[i]) * a
+        heads = np.broadcast_to(np.eye(4), (len(rows), 4, 4)).copy()
+        heads[:, :3, :3] = Rotation.from_quat(rows[:, 0:4]).as_matrix()
+        heads[:, :3, 3] = rows[:, 4:7]
+        return heads, rows[:, 7:9], rows[:, 9]
+
+
+class TrajectoryLibrary:
+    """All compiled moves of one library, backed by a single (usually memory-mapped) array."""
+
+    def __init__(self, key: str, samples: NDArray[np.float64], moves: List[Dict[str, Any]], rate: float) -> None:
+        """Wrap already loaded samples and their move index."""
+        self.key = key
+        self.rate = rate
+        self._samples = samples
+        self._index: List[Dict[str, Any]] = []
+        self._moves: Dict[str, CompiledTrajectory] = {}
+        for m in moves:
+            start, length = int(m["offset"]), int(m["length"])
+            if length < 2 or start + length > samples.shape[0]:
+                continue
+            self._index.append(m)
+            view = samples[start : start + length]
+            self._moves[m["name"]] = CompiledTrajectory(m["name"], view, float(m["duration"]))
+
+    def get(self, name: str) -> Optional[CompiledTrajectory]:
+        """Return the compiled move ``name``, or None when the library does not have it."""
+        return self._moves.get(name)
+
+    def names(self) -> List[str]:
+        """List the compiled moves."""
+        return list(self._moves)
+
+    @classmethod
+    def from_compiled(cls, key: str, compiled: CompiledMoves, rate: float) -> "TrajectoryLibrary":
+        """Concatenate freshly compiled moves into one library."""
+        moves: List[Dict[str, Any]] = []
+        parts: List[NDArray[np.float64]] = []
+        offset = 0
+        for name, (samples, duration) in compiled.items():
+            moves.append({"name": name, "offset": offset, "length": int(samples.shape[0]), "duration": duration})
+            parts.append(samples)
+            offset += samples.shape[0]
+        samples = np.concatenate(parts) if parts else np.zeros((0, len(CHANNELS)))
+        return cls(key, samples, moves, rate)
+
+    @classmethod
+    def load(cls, cache_dir: Path, key: str, rate: float) -> Optional["TrajectoryLibrary"]:
+        """Open the cached library ``key``; return None when it is missing, stale or unreadable."""
+        samples_path, index_path = cache_paths(cache_dir, key)
+        if not samples_path.exists() or not index_path.exists():
+            return None
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            samples = np.load(samples_path, mmap_mode="r")
+        except Exception as e:
+            logger.warning("Failed to load trajectory cache %s: %s", samples_path, e)
+            return None
+        if index.get("format") != FORMAT_VERSION or float(index.get("rate", 0.0)) != rate:
+            return None
+        if samples.dtype != np.float64 or samples.ndim != 2 or samples.shape[1] != len(CHANNELS):
+            logger.warning("Ignoring trajectory cache %s: unexpected %s%s", samples_path, samples.dtype, samples.shape)
+            return None
+        return cls(key, samples, index.get("moves", []), rate)
+
+    def save(self, cache_dir: Path) -> None:
+        """Write the library to ``cache_dir`` (samples first, so a present index means a complete file)."""
+        samples_path, index_path = cache_paths(cache_dir, self.key)
+        samples_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_samples = samples_path.with_name(f"{samples_path.stem}.{os.getpid()}.tmp.npy")
+        tmp_index = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        np.save(tmp_samples, np.ascontiguousarray(self._samples))
+        os.replace(tmp_samples, samples_path)
+        index = {"format": FORMAT_VERSION, "rate": self.rate, "channels": list(CHANNELS), "moves": self._index}
+        tmp_index.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp_index, index_path)
+
+
+def cache_paths(cache_dir: Path, key: str) -> Tuple[Path, Path]:
+    """Return the (samples, index) paths of a cached library."""
+    return cache_dir / f"{key}.npy", cache_dir / f"{key}.json"
+
+
+def load_or_compile(
+    key: str,
+    compile_moves: Callable[[], CompiledMoves],
+    cache_dir: Optional[Path],
+    rate: float = SAMPLE_RATE_HZ,
+) -> TrajectoryLibrary:
+    """Open the cached library ``key`` or compile it (and cache it when ``cache_dir`` is set)."""
+    if cache_dir is not None:
+        library = TrajectoryLibrary.load(cache_dir, key, rate)
+        if library is not None:
+            logger.info("Loaded %d compiled trajectories from %s", len(library.names()), cache_dir / key)
+            return library
+    library = TrajectoryLibrary.from_compiled(key, compile_moves(), rate)
+    logger.info("Compiled %d trajectories for %s", len(library.names()), key)
+    if cache_dir is not None:
+        try:
+            library.save(cache_dir)
+        except OSError as e:
+            logger.warning("Could not write trajectory cache %s: %s", cache_dir / key, e)
+    return library
+
+
+# ---- library compilers ----
+def compile_dances(rate: float = SAMPLE_RATE_HZ) -> CompiledMoves:
+    """Sample every move of ``reachy_mini_dances_library`` at ``rate``."""
+    from reachy_mini_dances_library.dance_move import DanceMove
+    from reachy_mini_dances_library.collection.dance import AVAILABLE_MOVES
+
+    compiled: CompiledMoves = {}
+    for name in AVAILABLE_MOVES:
+        move = DanceMove(name)
+        duration = float(move.duration)
+        times = sample_times(duration, rate)
+        heads = np.empty((len(times), 4, 4))
+        antennas = np.empty((len(times), 2))
+        body_yaw = np.empty(len(times))
+        for k, t in enumerate(times):
+            head, ant, yaw = move.evaluate(float(t))
+            heads[k] = head
+            antennas[k] = ant
+            body_yaw[k] = yaw
+        compiled[name] = (pack_samples(heads, antennas, body_yaw), duration)
+    return compiled
+
+
+def compile_recorded_move(move: Any, rate: float = SAMPLE_RATE_HZ) -> Tuple[NDArray[np.float64], float]:
+    """Resample a ``RecordedMove`` at ``rate`` with the same keyframe interpolation as its ``evaluate``."""
+    keyframe_times = np.asarray(move.timestamps, dtype=np.float64)
+    frames = move.trajectory
+    key_heads = np.array([f["head"] for f in frames], dtype=np.float64)
+    key_antennas = np.array([f["antennas"] for f in frames], dtype=np.float64)
+    key_yaw = np.array([f.get("body_yaw", 0.0) for f in frames], dtype=np.float64)
+    duration = float(move.duration)
+
+    # RecordedMove.evaluate refuses t >= the last timestamp; stay just inside it
+    last = np.nextafter(keyframe_times[-1], -np.inf)
+    times = np.minimum(sample_times(duration, rate), last)
+    index = np.searchsorted(keyframe_times, times, side="right")
+    prev = np.clip(index - 1, 0, len(frames) - 1)
+    nxt = np.minimum(index, len(frames) - 1)
+    span = keyframe_times[nxt] - keyframe_times[prev]
+    alpha = np.divide(times - keyframe_times[prev], span, out=np.zeros_like(times), where=span != 0.0)
+
+    # Geodesic interpolation between keyframes, as linear_pose_interpolation does
+    rot_prev = Rotation.from_matrix(key_heads[prev, :3, :3])
+    rot_rel = (rot_prev.inv() * Rotation.from_matrix(key_heads[nxt, :3, :3])).as_rotvec()
+    heads = np.broadcast_to(np.eye(4), (len(times), 4, 4)).copy()
+    heads[:, :3, :3] = (rot_prev * Rotation.from_rotvec(rot_rel * alpha[:, None])).as_matrix()
+    a = alpha[:, None]
+    heads[:, :3, 3] = key_heads[prev, :3, 3] + (key_heads[nxt, :3, 3] - key_heads[prev, :3, 3]) * a
+    antennas = key_antennas[prev] + (key_antennas[nxt] - key_antennas[prev]) * a
+    body_yaw = key_yaw[prev] + (key_yaw[nxt] - key_yaw[prev]) * alpha
+    return pack_samples(heads, antennas, body_yaw), duration
+
+
+def compile_recorded_moves(recorded_moves: Any, rate: float = SAMPLE_RATE_HZ) -> CompiledMoves:
+    """Resample every move of a ``RecordedMoves`` library at ``rate``."""
+    compiled: CompiledMoves = {}
+    for name in recorded_moves.list_moves():
+        try:
+            compiled[name] = compile_recorded_move(recorded_moves.get(name), rate)
+        except Exception as e:
+            logger.warning("Skipping recorded move %r: %s", name, e)
+    return compiled
+
+
+# ---- process-wide libraries ----
+_LOCK = threading.Lock()
+_LIBRARIES: Dict[str, Optional[TrajectoryLibrary]] = {}
+
+
+def _cache_dir() -> Optional[Path]:
+    from reachy_mini_karen_whisperer.config import config
+
+    return Path(config.TRAJECTORY_CACHE_DIR) if config.TRAJECTORY_CACHE_DIR else None
+
+
+def _shared_library(key: str, compile_moves: Callable[[], CompiledMoves]) -> Optional[TrajectoryLibrary]:
+    with _LOCK:
+        if key not in _LIBRARIES:
+            try:
+                _LIBRARIES[key] = load_or_compile(key, compile_moves, _cache_dir())
+            except Exception as e:
+                logger.warning("Trajectory cache unavailable for %s, evaluating moves live: %s", key, e)
+                _LIBRARIES[key] = None
+        return _LIBRARIES[key]
+
+
+def dance_trajectories() -> Optional[TrajectoryLibrary]:
+    """Return the compiled dance library (compiled or loaded on first call), or None if unavailable."""
+    key = (
+        f"dances-{_package_version('reachy_mini_dances_library')}"
+        f"-reachy_mini-{_package_version('reachy_mini')}-{SAMPLE_RATE_HZ:g}hz"
+    )
+    return _shared_library(key, compile_dances)
+
+
+def emotion_trajectories(recorded_moves: Any) -> Optional[TrajectoryLibrary]:
+    """Return the compiled ``RecordedMoves`` library, keyed by its dataset snapshot revision."""
+    dataset = str(recorded_moves.hf_dataset_name).replace("/", "--")
+    revision = Path(str(recorded_moves.local_path)).name
+    key = f"{dataset}-{revision}-reachy_mini-{_package_version('reachy_mini')}-{SAMPLE_RATE_HZ:g}hz"
+    return _shared_library(key, lambda: compile_recorded_moves(recorded_moves))
+
+
+def warm_trajectories() -> None:
+    """Compile (or load the cached) dance and emotion trajectories now rather than on the first move."""
+    from reachy_mini_karen_whisperer.tools.dance import DANCE_AVAILABLE
+    from reachy_mini_karen_whisperer.tools.play_emotion import RECORDED_MOVES, EMOTION_AVAILABLE
+
+    if DANCE_AVAILABLE:
+        dance_trajectories()
+    if EMOTION_AVAILABLE:
+        emotion_trajectories(RECORDED_MOVES)
@@ -0,0 +1,190 @@
+"""Per-turn voice latency timeline.
+
+Each conversational turn records monotonic timestamps for a fixed set of
+milestones, from the user stopping speech to the response being done. Finished
+turns go into a ring buffer from which p50/p95/p99 of the derived intervals are
+computed for the settings endpoint and a periodic log summary.
+
+A turn opens on ``speech_stopped`` (or on the first milestone seen when the
+response was not triggered by speech) and closes on ``response_done``, unless a
+tool was dispatched during that response: the follow-up response that speaks the
+tool result then belongs to the same turn.
+"""
+
+from __future__ import annotations
+import time
+import logging
+from typing import Any, Dict, List, Tuple, Optional
+from collections import deque
+from dataclasses import field, dataclass
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+SPEECH_STOPPED = "speech_stopped"
+TRANSCRIPTION_COMPLETED = "transcription_completed"
+RESPONSE_CREATED = "response_created"
+FIRST_AUDIO_DELTA = "first_audio_delta"
+FIRST_AUDIO_PLAYED = "first_audio_played"
+TOOL_START = "tool_start"
+TOOL_END = "tool_end"
+RESPONSE_DONE = "response_done"
+
+MILESTONES: Tuple[str, ...] = (
+    SPEECH_STOPPED,
+    TRANSCRIPTION_COMPLETED,
+    RESPONSE_CREATED,
+    FIRST_AUDIO_DELTA,
+    FIRST_AUDIO_PLAYED,
+    TOOL_START,
+    TOOL_END,
+    RESPONSE_DONE,
+)
+
+# Derived intervals reported in percentiles: name -> (from milestone, to milestone)
+INTERVALS: Dict[str, Tuple[str, str]] = {
+    "stop_to_transcript": (SPEECH_STOPPED, TRANSCRIPTION_COMPLETED),
+    "stop_to_response_created": (SPEECH_STOPPED, RESPONSE_CREATED),
+    "stop_to_first_delta": (SPEECH_STOPPED, FIRST_AUDIO_DELTA),
+    "stop_to_first_played": (SPEECH_STOPPED, FIRST_AUDIO_PLAYED),
+    "delta_to_played": (FIRST_AUDIO_DELTA, FIRST_AUDIO_PLAYED),
+    "tool": (TOOL_START, TOOL_END),
+    "stop_to_done": (SPEECH_STOPPED, RESPONSE_DONE),
+}
+
+DEFAULT_CAPACITY = 200
+DEFAULT_SUMMARY_INTERVAL_S = 300.0
+
+
+@dataclass
+class TurnTimeline:
+    """Milestone timestamps (monotonic seconds) of a single turn."""
+
+    turn_id: int
+    marks: Dict[str, float] = field(default_factory=dict)
+    tool_calls: int = 0
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def intervals_ms(self) -> Dict[str, float]:
+        """Return the derived intervals available for this turn, in milliseconds."""
+        out: Dict[str, float] = {}
+        for name, (start, end) in INTERVALS.items():
+            if start in self.marks and end in self.marks:
+                out[name] = 1000.0 * (self.marks[end] - self.marks[start])
+        return out
+
+
+class LatencyTracker:
+    """Collect turn timelines in a ring buffer and summarise them."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        summary_interval_s: float = DEFAULT_SUMMARY_INTERVAL_S,
+    ) -> None:
+        """Initialize the tracker."""
+        self._now = time.monotonic
+        self._turns: deque[TurnTimeline] = deque(maxlen=max(1, capacity))
+        self._current: TurnTimeline | None = None
+        self._next_id = 1
+        self._summary_interval_s = summary_interval_s
+        self._last_summary = self._now()
+
+    def _open_turn(self) -> TurnTimeline:
+        turn = TurnTimeline(turn_id=self._next_id)
+        self._next_id += 1
+        self._current = turn
+        return turn
+
+    def mark(self, milestone: str, t: Optional[float] = None) -> None:
+        """Record ``milestone`` for the current turn.
+
+        Only the first occurrence counts, except ``tool_end`` which keeps the last
+        one. ``speech_stopped`` always starts a new turn.
+        """
+        now = self._now() if t is None else t
+        if milestone == SPEECH_STOPPED:
+            if self._current is not None:
+                self._finish()
+            turn = self._open_turn()
+        elif milestone == FIRST_AUDIO_PLAYED and self._current is None:
+            # Playback trails the stream: the turn may already be closed
+            if self._turns:
+                self._turns[-1].marks.setdefault(milestone, now)
+            return
+        else:
+            turn = self._current or self._open_turn()
+
+        if milestone == TOOL_START:
+            turn.tool_calls += 1
+        if milestone == TOOL_END:
+            turn.marks[TOOL_END] = now
+        else:
+            turn.marks.setdefault(milestone, now)
+
+    def annotate(self, key: str, value: Any) -> None:
+        """Attach ``key=value`` to the current turn (first value wins)."""
+        if self._current is not None:
+            self._current.meta.setdefault(key, value)
+
+    def response_done(self, expects_followup: bool = False) -> None:
+        """Close the current turn unless a follow-up response will speak a tool result."""
+        if self._current is None or expects_followup:
+            return
+        self._current.marks.setdefault(RESPONSE_DONE, self._now())
+        self._finish()
+        self.maybe_log_summary()
+
+    def _finish(self) -> None:
+        if self._current is not None and self._current.marks:
+            self._turns.append(self._current)
+        self._current = None
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return the most recent turns with their intervals."""
+        turns = list(self._turns)[-limit:]
+        return [
+            {"turn": t.turn_id, "tool_calls": t.tool_calls, "intervals_ms": t.intervals_ms(), **t.meta} for t in turns
+        ]
+
+    def percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Return p50/p95/p99 and sample count for each derived interval."""
+        samples: Dict[str, List[float]] = {name: [] for name in INTERVALS}
+        # Snapshot first: the settings endpoint reads from another thread
+        for turn in list(self._turns):
+            for name, value in turn.intervals_ms().items():
+                samples[name].append(value)
+
+        out: Dict[str, Dict[str, float]] = {}
+        for name, values in samples.items():
+            if not values:
+                continue
+            p50, p95, p99 = np.percentile(np.asarray(values, dtype=np.float64), [50, 95, 99])
+            out[name] = {
+                "p50": round(float(p50), 1),
+                "p95": round(float(p95), 1),
+                "p99": round(float(p99), 1),
+                "count": len(values),
+            }
+        return out
+
+    def summary(self) -> Dict[str, Any]:
+        """Return percentiles plus the latest turns, for the settings endpoint."""
+        return {"turns": len(self._turns), "percentiles": self.percentiles(), "recent": self.recent()}
+
+    def maybe_log_summary(self) -> None:
+        """Log a one-line percentile summary at most every ``summary_interval_s``."""
+        now = self._now()
+        if now - self._last_summary < self._summary_interval_s:
+            return
+        self._last_summary = now
+        pct = self.percentiles()
+        if not pct:
+            return
+        parts = [
+            f"{name} p50={v['p50']:.0f} p95={v['p95']:.0f} p99={v['p99']:.0f} (n={int(v['count'])})"
+            for name, v in pct.items()
+        ]
+        logger.info("Voice latency (ms) over %d turns: %s", len(self._turns), "; ".join(parts))
@@ -43,6 +43,8 @@ class VisionProcessor:
         self.processor = None
         self.model = None
         self._initialized = False
+        # Serializes inference so one loaded model can serve several VisionManagers
+        self._lock = threading.Lock()
 
     def _determine_device(self) -> str:
         pref = self.vision_config.device_preference
@@ -95,6 +97,10 @@ class VisionProcessor:
         prompt: str = "Briefly describe what you see in one sentence.",
     ) -> str:
         """Process CV2 image and return description with retry logic."""
+        with self._lock:
+            return self._process_image(cv2_image, prompt)
+
+    def _process_image(self, cv2_image: NDArray[np.uint8], prompt: str) -> str:
         if not self._initialized or self.processor is None or self.model is None:
             return "Vision model not initialized"
 
@@ -207,19 +213,28 @@ class VisionProcessor:
 class VisionManager:
     """Manages periodic vision processing and scene understanding."""
 
-    def __init__(self, camera: Any, vision_config: VisionConfig | None = None):
-        """Initialize vision manager with camera and configuration."""
+    def __init__(
+        self,
+        camera: Any,
+        vision_config: VisionConfig | None = None,
+        processor: VisionProcessor | None = None,
+    ):
+        """Initialize vision manager with camera and configuration.
+
+        An already initialized ``processor`` can be passed to share one loaded model
+        between several managers (one per robot in the session host).
+        """
         self.camera = camera
-        self.vision_config = vision_config or VisionConfig()
+        self.vision_config = vision_config or (processor.vision_config if processor else VisionConfig())
         self.vision_interval = self.vision_config.vision_interval
-        self.processor = VisionProcessor(self.vision_config)
+        self.processor = processor or VisionProcessor(self.vision_config)
 
         self._last_processed_time = 0.0
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
         # Initialize processor
-        if not self.processor.initialize():
+        if not self.processor._initialized and not self.processor.initialize():
             logger.error("Failed to initialize vision processor")
             raise RuntimeError("Vision processor initialization failed")
 